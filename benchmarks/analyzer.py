@@ -0,0 +1,51 @@
+"""
+Measures the analyzer on operator-heavy code, comparing the dispatch of expressions by the types
+of the values (`sqf.expressions_cache.ExpressionsDispatch.match`) with the scan of the expressions
+of the keyword it replaced.
+"""
+from sqf.analyzer import analyze, EXPRESSIONS
+from sqf.expressions_cache import ExpressionsDatabase
+from sqf.parser import parse
+from sqf.types import Array, Keyword, Number
+
+from benchmarks.common import measure, synthetic_script
+
+
+OPERATORS = '''
+private _a = [1, 2, 3];
+private _b = (_a select 0) + (_a select 1) * 2 - (_a select 2) / 3;
+_a set [0, _b];
+private _s = "x" + str _b + "y";
+if (_b == 2 && {_s != ""} || {count _a >= 3}) then {_a pushBack (_b max 1 min 10)};
+'''
+
+
+def scan(self, values, exact=True):
+    for case in self.values_to_expressions(values):
+        if case.is_match(values, exact):
+            return case
+    return None
+
+
+def main():
+    values = [Array(), Keyword('select'), Number()]
+    print('match of "Array select Number"')
+    before = measure('  scan of the expressions', lambda: scan(EXPRESSIONS, values, False), number=100000)
+    after = measure('  dispatch', lambda: EXPRESSIONS.match(values, False), number=100000)
+    print('  speedup: %.1fx' % (before / after))
+
+    for name, script in (('operators', OPERATORS * 200), ('synthetic script', synthetic_script(1000))):
+        result = parse(script)
+        print(name)
+        match = ExpressionsDatabase.match
+        try:
+            ExpressionsDatabase.match = scan
+            before = measure('  scan of the expressions', lambda: analyze(result), repeat=7)
+        finally:
+            ExpressionsDatabase.match = match
+        after = measure('  dispatch', lambda: analyze(result), repeat=7)
+        print('  speedup: %.1fx' % (before / after))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,45 @@
+"""
+Measures the analyzer and the interpreter with the base tokens of statements computed once,
+compared with computing them on every access.
+"""
+from sqf.analyzer import analyze
+from sqf.interpreter import interpret
+from sqf.parser import parse
+from sqf.types import _Statement
+
+from benchmarks.common import synthetic_script, measure
+from benchmarks.loops import SCRIPT
+
+
+def base_tokens(self):
+    return [token for token in self._tokens if self.is_base_token(token)]
+
+
+def run():
+    """
+    Prints and returns the times of parsing and analyzing a script, of analyzing it again (e.g. by an
+    editor) and of interpreting loops.
+    """
+    code = synthetic_script(2000)
+    result = parse(code)
+    loops = SCRIPT % {'n': 1000, 'elements': ', '.join(str(i) for i in range(500))}
+    return (measure('  parse and analyze', lambda: analyze(parse(code))),
+            measure('  analyze again', lambda: analyze(result)),
+            measure('  interpret loops', lambda: interpret(loops)))
+
+
+def main():
+    cached = _Statement.base_tokens
+    try:
+        _Statement.base_tokens = property(base_tokens)
+        print('computed on every access')
+        before = run()
+    finally:
+        _Statement.base_tokens = cached
+    print('computed once')
+    after = run()
+    print('speedup: %s' % ', '.join('%.2fx' % (b / a) for b, a in zip(before, after)))
+
+
+if __name__ == '__main__':
+    main()
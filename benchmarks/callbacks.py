@@ -0,0 +1,52 @@
+"""
+Measures the analyzer on a script with many event handlers and spawned codes, comparing the
+codes analyzed in frames of the analyzer of the script with the standalone analyzers whose
+exceptions were copied to it.
+"""
+from sqf.analyzer import Analyzer, analyze
+from sqf.parser import parse
+from sqf.types import File
+
+from benchmarks.common import measure
+
+
+def script(blocks):
+    lines = []
+    for i in range(blocks):
+        lines.append('player addEventHandler ["Fired", {private _x = _this select %d; hint str _x}];' % i)
+        lines.append('[%d] spawn {params ["_y"]; sleep _y; hint str _y};' % i)
+    return '\n'.join(lines)
+
+
+def standalone_execute_unexecuted_code(self, code_key, extra_scope=None, own_namespace=False):
+    container = self._unexecuted_codes[code_key]
+
+    analyzer = Analyzer()
+    if not own_namespace:
+        analyzer._namespaces = container.namespaces
+    analyzer.variable_uses = self.variable_uses
+    analyzer.delete_scope_level = container.delete_scope_level
+
+    file = File(container.code._tokens)
+    file.position = container.position
+
+    analyzer.execute_code(file, extra_scope=extra_scope,
+                          namespace_name=container.namespace_name, delete_mode=True)
+
+    self.exceptions.extend(analyzer.exceptions)
+
+
+def main():
+    result = parse(script(500))
+    method = Analyzer.execute_unexecuted_code
+    try:
+        Analyzer.execute_unexecuted_code = standalone_execute_unexecuted_code
+        before = measure('standalone analyzers', lambda: analyze(result))
+    finally:
+        Analyzer.execute_unexecuted_code = method
+    after = measure('frames of the analyzer', lambda: analyze(result))
+    print('speedup: %.2fx' % (before / after))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+"""
+Measures the analyzer on large functions, comparing the keys of code of `sqf.analyzer.Analyzer`
+computed once per code (`Code.content_key`) with the rendering of the code on each call they replaced
+(both including the time to parse).
+"""
+from sqf.analyzer import Analyzer, analyze
+from sqf.base_type import BaseTypeContainer
+from sqf.parser import parse
+
+from benchmarks.common import measure, synthetic_script
+
+
+def large_function(blocks):
+    body = ''.join('    if (_x > %d) then {_y = _y + [%d]; {_y pushBack _x} forEach _y;};\n' % (i, i)
+                   for i in range(blocks))
+    return 'fnc_large = {\n    params ["_x"];\n    private _y = [];\n%s    _y\n};\n[1] call fnc_large;\n' % body
+
+
+def render(code):
+    # the string of the code, without using the string stored by the code
+    return BaseTypeContainer.__str__(code)
+
+
+def code_key(code):
+    return code.position, render(code)
+
+
+def exe_code_key(code, extra_scope):
+    if extra_scope is None:
+        extra_scope = {}
+    return render(code), tuple((x, type(extra_scope[x])) for x in sorted(extra_scope.keys()))
+
+
+def main():
+    for name, script in (('large function', large_function(300)), ('synthetic script', synthetic_script(2000))):
+        print(name)
+        keys = Analyzer.code_key, Analyzer.exe_code_key
+        try:
+            Analyzer.code_key, Analyzer.exe_code_key = staticmethod(code_key), staticmethod(exe_code_key)
+            # parsed on each run, so the keys are computed on each run
+            before = measure('  str(code)', lambda: analyze(parse(script)))
+        finally:
+            Analyzer.code_key, Analyzer.exe_code_key = (staticmethod(key) for key in keys)
+        after = measure('  content_key', lambda: analyze(parse(script)))
+        print('  speedup: %.1fx' % (before / after))
+
+
+if __name__ == '__main__':
+    main()
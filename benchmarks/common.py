@@ -0,0 +1,44 @@
+"""
+Helpers shared by the benchmarks. Run a benchmark from the root of the repository, e.g.
+
+    python -m benchmarks.lexer
+"""
+import timeit
+
+
+BLOCK = '''/*
+ * Function: fnc_%(i)d
+ * A header comment that spans multiple lines, like the ones of CBA-style functions.
+ */
+fnc_%(i)d = {
+    params ["_unit", ["_items", []]];
+    private _text = "a long string with ""escaped"" quotes and a // fake comment %(i)d";
+    private _total = 0;
+    {
+        _total = _total + (_x select 1) * 2; // accumulate
+    } forEach [[1, 2], [3, 4], [5, 6]];
+    if (_total > %(i)d) then {
+        hint format ["%%1: %%2", _text, _total];
+    } else {
+        _unit setVariable ["total", _total];
+    };
+    _total
+};
+'''
+
+
+def synthetic_script(lines):
+    """
+    Returns a valid SQF script with approximately `lines` lines.
+    """
+    block_lines = BLOCK.count('\n')
+    return ''.join(BLOCK % {'i': i} for i in range(max(1, lines // block_lines)))
+
+
+def measure(name, function, number=1, repeat=3):
+    """
+    Prints and returns the best time of `repeat` runs of `function`.
+    """
+    best = min(timeit.repeat(function, number=number, repeat=repeat)) / number
+    print('%-40s %10.4f s' % (name, best))
+    return best
@@ -0,0 +1,44 @@
+"""
+Measures the interpreter on a tight loop, comparing the dispatch of expressions
+(`sqf.expressions_cache.ExpressionsDispatch`) with the scan of all expressions it replaced.
+"""
+import sqf.interpreter
+from sqf.interpreter import interpret
+
+from benchmarks.common import measure
+
+
+SCRIPT = '''
+private _total = 0;
+private _items = [];
+for "_i" from 1 to 2000 do {
+    _total = _total + _i * 2 - 1;
+    if (_total > 100 && {_i % 2 == 0}) then {
+        _items pushBack (_i / 2);
+    };
+};
+_total
+'''
+
+
+class _Scan:
+    def match(self, values):
+        for case in sqf.interpreter.EXPRESSIONS:
+            if case.is_match(values):
+                return case
+        return None
+
+
+def main():
+    dispatch = sqf.interpreter.EXPRESSIONS_DISPATCH
+    try:
+        sqf.interpreter.EXPRESSIONS_DISPATCH = _Scan()
+        before = measure('scan of the expressions', lambda: interpret(SCRIPT))
+    finally:
+        sqf.interpreter.EXPRESSIONS_DISPATCH = dispatch
+    after = measure('dispatch', lambda: interpret(SCRIPT))
+    print('speedup: %.1fx' % (before / after))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+"""
+Measures how many token comparisons per second the checks of `parse_block` can do,
+comparing the previous idiom (a new token per comparison, compared by the sorted `__dict__`)
+with the current one (constant tokens compared by their value).
+"""
+from sqf.parser import lex, parse, CLOSE_PARENTHESIS, STOP_KEYWORDS, OPEN_SQUARE, \
+    IFDEF, IFNDEF, ENDIF
+from sqf.parser_types import ParserKeyword
+from sqf.types import Preprocessor
+
+from benchmarks.common import synthetic_script, measure
+
+
+def attributes(token):
+    # the tokens use `__slots__`, so their attributes are the ones of the slots of their classes
+    result = dict(getattr(token, '__dict__', {}))
+    for cls in type(token).__mro__:
+        for name in getattr(cls, '__slots__', ()):
+            if hasattr(token, name):
+                result[name] = getattr(token, name)
+    return result
+
+
+def dict_key(token):
+    return tuple(x for x in sorted(attributes(token).items()) if x[0] not in ('_line', '_column'))
+
+
+def dict_eq(token, other):
+    return isinstance(other, token.__class__) and dict_key(token) == dict_key(other)
+
+
+def compare_by_dict(tokens):
+    for token in tokens:
+        any(dict_eq(x, token) for x in (Preprocessor('#ifdef'), Preprocessor('#ifndef')))
+        dict_eq(token, Preprocessor('#endif'))
+        any(dict_eq(x, token) for x in STOP_KEYWORDS['both'])
+        any(dict_eq(x, token) for x in CLOSE_PARENTHESIS)
+        dict_eq(token, ParserKeyword('['))
+
+
+def compare(tokens):
+    for token in tokens:
+        token in (IFDEF, IFNDEF)
+        token == ENDIF
+        token in STOP_KEYWORDS['both']
+        token in CLOSE_PARENTHESIS
+        token == OPEN_SQUARE
+
+
+COMPARISONS_PER_TOKEN = 9
+
+
+def main():
+    script = synthetic_script(10000)
+    tokens = lex(script)
+    comparisons = COMPARISONS_PER_TOKEN * len(tokens)
+    print('%d tokens' % len(tokens))
+    before = measure('  new token, compared by __dict__', lambda: compare_by_dict(tokens))
+    after = measure('  constant token, compared by value', lambda: compare(tokens))
+    print('  comparisons per second: %.2e -> %.2e' % (comparisons / before, comparisons / after))
+    measure('parse', lambda: parse(script))
+
+
+if __name__ == '__main__':
+    main()
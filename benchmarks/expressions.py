@@ -0,0 +1,121 @@
+"""
+Measures the expression parser (`sqf.parser_exp`) over the scripts of tests/test_parser.py,
+comparing the binding power table with the chain of conditions it replaced.
+"""
+import ast
+import os
+
+import sqf.parser
+import sqf.parser_exp
+from sqf.keywords import BINARY_OPERATORS, UNARY_OPERATORS, OP_COMPARISON
+from sqf.parser import parse, lex
+from sqf.parser_exp import get_lbp, parse_exp, EndToken
+
+from benchmarks.common import measure
+
+
+def corpus():
+    """
+    Returns the scripts of tests/test_parser.py that parse, i.e. the string constants
+    assigned to `code` or passed to `parse`.
+    """
+    path = os.path.join(os.path.dirname(__file__), '..', 'tests', 'test_parser.py')
+    with open(path) as f:
+        tree = ast.parse(f.read())
+
+    scripts = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Assign) and any(isinstance(x, ast.Name) and x.id == 'code' for x in node.targets):
+            value = node.value
+        elif isinstance(node, ast.Call) and getattr(node.func, 'id', None) == 'parse' and node.args:
+            value = node.args[0]
+        else:
+            continue
+        if isinstance(value, ast.Constant) and isinstance(value.value, str):
+            try:
+                parse(value.value)
+            except Exception:
+                continue
+            scripts.append(value.value)
+    return scripts
+
+
+def expressions(scripts):
+    """
+    Returns the arguments of every call of `parse_exp` while parsing `scripts`.
+    """
+    calls = []
+
+    def recording_parse_exp(tokens, container=list):
+        calls.append((list(tokens), container))
+        return parse_exp(tokens, container)
+
+    sqf.parser.parse_exp = recording_parse_exp
+    try:
+        for script in scripts:
+            parse(script)
+    finally:
+        sqf.parser.parse_exp = parse_exp
+    return calls
+
+
+def parse_expressions(calls):
+    for tokens, container in calls:
+        parse_exp(tokens, container)
+
+
+def chain_lbp(token):
+    # the chain of conditions that `get_lbp` used before the table of binding powers
+    n_token = str(token).lower()
+    if token == EndToken:
+        return 0
+    elif n_token == '=':
+        return 0.8
+    elif n_token == 'private':
+        return 0.9
+    elif n_token in ('||', 'or'):
+        return 1
+    elif n_token in {'&&', 'and'}:
+        return 2
+    elif n_token in set(x.value for x in OP_COMPARISON):
+        return 3
+    elif n_token in {'*', '/', '%', 'mod', 'atan2'}:
+        return 7
+    elif n_token in {'+', 'max', 'min', '-'}:
+        return 6
+    elif n_token == 'else':
+        return 5
+    elif n_token == '^':
+        return 8
+    elif n_token in BINARY_OPERATORS:
+        return 4
+    elif n_token == '#':
+        return 9
+    elif n_token in UNARY_OPERATORS:
+        return 10
+    else:
+        return 0.1
+
+
+def main():
+    scripts = corpus()
+    tokens = [token for script in scripts for token in lex(script)]
+    assert all(chain_lbp(token) == get_lbp(token) for token in tokens)
+    print('%d scripts, %d tokens' % (len(scripts), len(tokens)))
+
+    before = measure('  binding power (chain)', lambda: [chain_lbp(token) for token in tokens], number=10)
+    after = measure('  binding power (table)', lambda: [get_lbp(token) for token in tokens], number=10)
+    print('  speedup: %.1fx' % (before / after))
+
+    calls = expressions(scripts)
+    sqf.parser_exp.get_lbp = chain_lbp
+    try:
+        before = measure('  parse_exp (chain)', lambda: parse_expressions(calls), number=10)
+    finally:
+        sqf.parser_exp.get_lbp = get_lbp
+    after = measure('  parse_exp (table)', lambda: parse_expressions(calls), number=10)
+    print('  speedup: %.1fx' % (before / after))
+
+
+if __name__ == '__main__':
+    main()
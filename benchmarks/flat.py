@@ -0,0 +1,31 @@
+"""
+Compares `sqf.parser.parse` with the flat parse mode (`sqf.parser.parse_flat`), in time and memory.
+"""
+import tracemalloc
+
+from sqf.parser import parse, parse_flat
+
+from benchmarks.common import synthetic_script, measure
+
+
+def allocated(function):
+    tracemalloc.start()
+    result = function()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return size / 1e6
+
+
+def main():
+    for lines in (1000, 10000):
+        script = synthetic_script(lines)
+        print('%d lines' % lines)
+        before = measure('  parse', lambda: parse(script))
+        after = measure('  parse_flat', lambda: parse_flat(script))
+        print('  speedup: %.1fx' % (before / after))
+        print('  memory: %.1f MB -> %.1f MB' % (allocated(lambda: parse(script)), allocated(lambda: parse_flat(script))))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,30 @@
+"""
+Compares the single-pass lexer (`sqf.parser.lex`) with the two-pass path
+(`tokenize` followed by `parse_strings_and_comments` and `identify_token`).
+"""
+from sqf.base_tokenizer import tokenize, scan
+from sqf.parser import lex, parse_strings_and_comments, identify_token
+
+from benchmarks.common import synthetic_script, measure
+
+
+def two_pass(script):
+    return [identify_token(x) for x in parse_strings_and_comments(tokenize(script))]
+
+
+def main():
+    for lines in (1000, 10000, 40000):
+        script = synthetic_script(lines)
+        # a long string literal and a long block comment are the worst case of the two-pass path
+        script += '_x = "%s";\n/*%s*/\n' % ('a ' * lines * 10, ' b\n' * lines)
+        print('%d lines' % lines)
+        before = measure('  tokenize + parse_strings_and_comments', lambda: parse_strings_and_comments(tokenize(script)))
+        after = measure('  scan', lambda: scan(script))
+        print('  speedup: %.1fx' % (before / after))
+        before = measure('  two-pass + identify_token', lambda: two_pass(script))
+        after = measure('  lex', lambda: lex(script))
+        print('  speedup: %.1fx' % (before / after))
+
+
+if __name__ == '__main__':
+    main()
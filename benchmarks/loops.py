@@ -0,0 +1,39 @@
+"""
+Measures the interpreter on loops, comparing the execution of compiled code (see `sqf.compiler`)
+with the execution of the tree of statements.
+"""
+from sqf.base_interpreter import BaseInterpreter
+from sqf.interpreter import Interpreter, interpret
+
+from benchmarks.common import measure
+
+
+SCRIPT = '''
+private _total = 0;
+for "_i" from 1 to 2000 do {
+    if (_i %% 3 == 0) then {_total = _total + 1};
+    _total = _total + _i * 2;
+};
+private _j = 0;
+while {_j < %(n)d} do {_j = _j + 1};
+{
+    _total = _total + _x * _forEachIndex;
+} forEach [%(elements)s];
+_total
+'''
+
+
+def main():
+    code = SCRIPT % {'n': 1000, 'elements': ', '.join(str(i) for i in range(500))}
+    method = Interpreter.execute_statements
+    try:
+        Interpreter.execute_statements = BaseInterpreter.execute_statements
+        before = measure('statements', lambda: interpret(code), repeat=5)
+    finally:
+        Interpreter.execute_statements = method
+    after = measure('compiled', lambda: interpret(code), repeat=5)
+    print('speedup: %.1fx' % (before / after))
+
+
+if __name__ == '__main__':
+    main()
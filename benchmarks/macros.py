@@ -0,0 +1,26 @@
+"""
+Measures the parsing of scripts that use macros often, like CBA-style code.
+"""
+from sqf.parser import parse
+
+from benchmarks.common import measure
+
+
+HEADER = '''#define GVAR(var) TAG_##var
+#define QUOTE(var) #var
+#define ZERO 0
+'''
+
+
+def macro_script(lines):
+    return HEADER + ''.join('GVAR(value%d) = [GVAR(other), ZERO, QUOTE(x)];\n' % i for i in range(lines))
+
+
+def main():
+    for lines in (500, 1000, 2000, 4000):
+        script = macro_script(lines)
+        measure('%d lines' % lines, lambda: parse(script))
+
+
+if __name__ == '__main__':
+    main()
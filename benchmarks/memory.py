@@ -0,0 +1,49 @@
+"""
+Measures the memory retained by the tokens and the parse tree of a synthetic 100k-line script.
+"""
+import sys
+import tracemalloc
+
+from sqf.parser import lex, parse
+from sqf.parser_types import Space, EndOfLine, ParserKeyword
+from sqf.types import Number, Variable, Keyword, String
+
+from benchmarks.common import synthetic_script
+
+
+def retained(function):
+    """
+    Returns the result of `function` and the memory (bytes) it retains.
+    """
+    tracemalloc.start()
+    result = function()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, size
+
+
+def size_of(token):
+    size = sys.getsizeof(token)
+    if hasattr(token, '__dict__'):
+        size += sys.getsizeof(token.__dict__)
+    return size
+
+
+def main():
+    script = synthetic_script(100000)
+    print('%d lines, %d characters' % (script.count('\n'), len(script)))
+
+    for token in (Space(), EndOfLine('\n'), ParserKeyword(';'), Number(1), Variable('_x'), Keyword('hint'),
+                  String('"a"')):
+        print('  %-15s %4d bytes' % (type(token).__name__, size_of(token)))
+
+    tokens, size = retained(lambda: lex(script))
+    print('lex:   %7.1f MB (%d tokens, %.0f bytes per token)' % (size / 1e6, len(tokens), size / len(tokens)))
+    del tokens
+
+    result, size = retained(lambda: parse(script))
+    print('parse: %7.1f MB' % (size / 1e6))
+
+
+if __name__ == '__main__':
+    main()
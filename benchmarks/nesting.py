@@ -0,0 +1,18 @@
+"""
+Measures the parsing of deeply nested scripts, deeper than Python's recursion limit.
+"""
+from sqf.parser import parse
+
+from benchmarks.common import measure
+
+
+def main():
+    for depth in (1000, 5000, 20000):
+        print('depth %d' % depth)
+        for name, (open_, close) in (('arrays', '[]'), ('parenthesis', '()'), ('code', '{}')):
+            script = '_x = %s1%s;' % (open_ * depth, close * depth)
+            measure('  %s' % name, lambda: parse(script))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,41 @@
+"""
+Compares `set_position` over a parsed tree with the previous implementation, that
+advanced the position using `str` of each token (rebuilding the text of every sub-tree).
+"""
+from sqf.base_type import BaseTypeContainer, get_diff
+from sqf.parser import parse
+
+from benchmarks.common import measure
+
+
+def set_position_by_str(token, position):
+    token._position = position
+    if not isinstance(token, BaseTypeContainer):
+        return
+    for sub_token in token.tokens:
+        set_position_by_str(sub_token, position)
+
+        token_delta = get_diff(str(sub_token))
+        if token_delta[0] == 0:
+            initial_column = position[1]
+        else:
+            initial_column = 1
+        position = (position[0] + token_delta[0], initial_column + token_delta[1])
+
+
+def loot_table(entries):
+    return 'loot = [\n%s\n];\n' % ',\n'.join(
+        '    ["item_%d", %d, [[%d, 2], ["a", ["b", ["c"]]]]]' % (i, i, i) for i in range(entries))
+
+
+def main():
+    for entries in (250, 500, 1000):
+        result = parse(loot_table(entries))
+        print('loot table with %d entries' % entries)
+        before = measure('  set_position (by str)', lambda: set_position_by_str(result, (1, 1)))
+        after = measure('  set_position', lambda: result.set_position((1, 1)))
+        print('  speedup: %.1fx' % (before / after))
+
+
+if __name__ == '__main__':
+    main()
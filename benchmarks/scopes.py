@@ -0,0 +1,46 @@
+"""
+Measures the interpreter and the analyzer on a script that reads variables defined at the bottom of
+deeply nested scopes, comparing the index of `sqf.namespace.Namespace` with searching its stack.
+"""
+from sqf.analyzer import analyze
+from sqf.interpreter import interpret
+from sqf.namespace import Namespace
+from sqf.parser import parse
+
+from benchmarks.common import measure
+
+
+def script(depth, reads):
+    body = '_total = _total + %s;' % ' + '.join(['_a', '_B'] * reads)
+    for i in range(depth):
+        body = 'if (true) then {private _v%d = %d; %s};' % (i, i, body)
+    return 'private _a = 1; private _b = 2; private _total = 0; for "_i" from 1 to 20 do {%s}; _total' % body
+
+
+def search_stack(self, name):
+    if name.startswith('_'):
+        for i in reversed(range(1, len(self._stack))):
+            scope = self._stack[i]
+            if name in scope:
+                return scope
+    return self._stack[0]
+
+
+def main():
+    code = script(20, 10)
+    result = parse('\n'.join([code] * 20))
+    method = Namespace.get_normalized_scope
+    try:
+        Namespace.get_normalized_scope = search_stack
+        before_interpreter = measure('interpreter (stack search)', lambda: interpret(code))
+        before_analyzer = measure('analyzer (stack search)', lambda: analyze(result))
+    finally:
+        Namespace.get_normalized_scope = method
+    after_interpreter = measure('interpreter (index)', lambda: interpret(code))
+    after_analyzer = measure('analyzer (index)', lambda: analyze(result))
+    print('speedup: interpreter %.2fx, analyzer %.2fx' % (
+        before_interpreter / after_interpreter, before_analyzer / after_analyzer))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+"""
+Measures the time from a change of a 2k-line script until its diagnostics are published, with
+`sqflint --server`, against the time of a new sqflint process per save (as the editor integrations do).
+"""
+import os
+import subprocess
+import sys
+import time
+
+from sqflint import _read_message, _write_message
+
+from benchmarks.common import synthetic_script
+
+
+def main():
+    root = os.path.join(os.path.dirname(__file__), '..')
+    script = synthetic_script(2000)
+    env = dict(os.environ)
+    # compiled modules are used, like in an installed package
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+
+    best = min(_timed(lambda: subprocess.run([sys.executable, 'sqflint.py'], input=script.encode(), cwd=root,
+                                             env=env, stdout=subprocess.DEVNULL, check=True)) for _ in range(3))
+    print('%-40s %10.4f s' % ('new process per save', best))
+
+    server = subprocess.Popen([sys.executable, 'sqflint.py', '--server'], cwd=root, env=env,
+                              stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+    uri = 'file:///script.sqf'
+
+    def send(message):
+        message['jsonrpc'] = '2.0'
+        _write_message(server.stdin, message)
+
+    def published():
+        message = _read_message(server.stdout)
+        while message.get('method') != 'textDocument/publishDiagnostics':
+            message = _read_message(server.stdout)
+        return message
+
+    send({'id': 1, 'method': 'initialize', 'params': {'capabilities': {}}})
+    _read_message(server.stdout)
+    send({'method': 'textDocument/didOpen',
+          'params': {'textDocument': {'uri': uri, 'languageId': 'sqf', 'version': 1, 'text': script}}})
+    published()
+
+    times = []
+    for version in range(2, 12):
+        text = script + 'hint str %d;\n' % version
+        start = time.perf_counter()
+        send({'method': 'textDocument/didChange', 'params': {'textDocument': {'uri': uri, 'version': version},
+                                                             'contentChanges': [{'text': text}]}})
+        published()
+        times.append(time.perf_counter() - start)
+    print('%-40s %10.4f s' % ('change with --server', min(times)))
+
+    send({'id': 2, 'method': 'shutdown'})
+    _read_message(server.stdout)
+    send({'method': 'exit'})
+    server.wait()
+    server.stdin.close()
+
+
+def _timed(function):
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    main()
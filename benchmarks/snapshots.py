@@ -0,0 +1,52 @@
+"""
+Measures the analyzer on a script with many code blocks, comparing the snapshots of the namespaces
+of `sqf.analyzer.UnexecutedCode` (copy-on-write) with the deep copy they replaced, in time and memory.
+"""
+import tracemalloc
+from copy import deepcopy
+
+import sqf.analyzer
+from sqf.analyzer import analyze
+from sqf.parser import parse
+
+from benchmarks.common import measure
+
+
+def script(blocks):
+    variables = ''.join('private _v%d = [%d, "%d", [%d]];\n' % (i, i, i, i) for i in range(50))
+    handlers = ''.join('player addEventHandler ["Fired", {hint str _v%d}];\n' % (i % 50) for i in range(blocks))
+    return variables + handlers
+
+
+def deepcopy_init(self, code, analyzer):
+    self.namespaces = deepcopy(analyzer._namespaces)
+    self.namespace_name = analyzer.current_namespace.name
+    self.code = code
+    self.position = code.position
+    self.delete_scope_level = analyzer.delete_scope_level
+
+
+def peak(function):
+    tracemalloc.start()
+    function()
+    size = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return size / 1e6
+
+
+def main():
+    result = parse(script(500))
+    init = sqf.analyzer.UnexecutedCode.__init__
+    try:
+        sqf.analyzer.UnexecutedCode.__init__ = deepcopy_init
+        before = measure('deep copy', lambda: analyze(result))
+        before_memory = peak(lambda: analyze(result))
+    finally:
+        sqf.analyzer.UnexecutedCode.__init__ = init
+    after = measure('snapshot', lambda: analyze(result))
+    print('speedup: %.1fx' % (before / after))
+    print('peak memory: %.1f MB -> %.1f MB' % (before_memory, peak(lambda: analyze(result))))
+
+
+if __name__ == '__main__':
+    main()
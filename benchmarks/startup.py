@@ -0,0 +1,39 @@
+"""
+Measures the cold start of sqflint, i.e. the time a new process takes to import the analyzer and
+to analyze a small script, as paid by each call of the editor integrations.
+"""
+import os
+import subprocess
+import sys
+
+
+IMPORT = 'import time; t = time.perf_counter(); import sqf.analyzer; print(time.perf_counter() - t)'
+
+ANALYZE = 'import time; t = time.perf_counter(); import sqf.analyzer; from sqf.parser import parse; ' \
+          'sqf.analyzer.analyze(parse("private _x = [1, 2]; hint str (_x select 0);")); ' \
+          'print(time.perf_counter() - t)'
+
+
+def cold(name, code, repeat=10):
+    """
+    Prints and returns the best time of `code` (that prints its time) in `repeat` new processes.
+    """
+    root = os.path.join(os.path.dirname(__file__), '..')
+    env = dict(os.environ)
+    # compiled modules are used, like in an installed package
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+    subprocess.check_call([sys.executable, '-c', code], cwd=root, env=env, stdout=subprocess.DEVNULL)
+
+    best = min(float(subprocess.check_output([sys.executable, '-c', code], cwd=root, env=env))
+               for _ in range(repeat))
+    print('%-40s %10.4f s' % (name, best))
+    return best
+
+
+def main():
+    cold('import sqf.analyzer', IMPORT)
+    cold('import and analyze a statement', ANALYZE)
+
+
+if __name__ == '__main__':
+    main()
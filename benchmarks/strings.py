@@ -0,0 +1,45 @@
+"""
+Measures the memory and the number of allocations of lexing a synthetic script with many strings
+and comments, and of reading the values of its strings.
+"""
+import gc
+import tracemalloc
+
+from sqf.parser import lex
+from sqf.types import String
+
+from benchmarks.common import synthetic_script, measure
+
+
+def traced(function):
+    """
+    Returns the result of `function`, and the memory (bytes) it retains, its peak memory (bytes) and
+    the number of blocks it retains.
+    """
+    gc.collect()
+    tracemalloc.start()
+    result = function()
+    size, peak = tracemalloc.get_traced_memory()
+    blocks = sum(stat.count for stat in tracemalloc.take_snapshot().statistics('filename'))
+    tracemalloc.stop()
+    return result, size, peak, blocks
+
+
+def main():
+    script = synthetic_script(20000)
+    print('%d lines, %d characters' % (script.count('\n'), len(script)))
+
+    tokens, size, peak, blocks = traced(lambda: lex(script))
+    strings = [token for token in tokens if isinstance(token, String)]
+    print('lex:    %7.1f MB retained, %7.1f MB peak, %d blocks (%d strings)' % (
+        size / 1e6, peak / 1e6, blocks, len(strings)))
+
+    _, size, peak, blocks = traced(lambda: [string.value for string in strings])
+    print('values: %7.1f MB retained, %7.1f MB peak, %d blocks' % (size / 1e6, peak / 1e6, blocks))
+    del tokens, strings
+
+    measure('lex', lambda: lex(script))
+
+
+if __name__ == '__main__':
+    main()
@@ -43,11 +43,6 @@ STRING_TO_TYPE = {
     'diary': DiaryReport  # diary_record gets split
 }
 
-# the argument the type is initialized with
-TYPE_TO_INIT_ARGS = {
-    Namespace: "'missionNamespace'",
-}
-
 # The return type "ANY" means that we do not know it, so it is Nothing()
 STRING_TO_TYPE_RETURN = STRING_TO_TYPE.copy()
 STRING_TO_TYPE_RETURN['any'] = Anything
@@ -117,123 +112,85 @@ for line in data:
     else:
         return_type = _parse_return_type_names(sections[num_sections-1][:-1])
 
-    # Adds any relevant initialization argument for the return type
-    init_code = ''
-
     # Number of sections allows us to classify the operation
     if num_sections == 6:
-        if return_type in TYPE_TO_INIT_ARGS:
-            init_code = ', action=lambda lhs, rhs, i: %s' % TYPE_TO_INIT_ARGS[return_type]
-
         for lhs_type_name in _parse_type_names(sections[2]):
             lhs_type = STRING_TO_TYPE[lhs_type_name]
             for rhs_type_name in _parse_type_names(sections[3]):
                 rhs_type = STRING_TO_TYPE[rhs_type_name]
-                expression = 'BinaryExpression(' \
-                             '{lhs_type}, ' \
-                             'Keyword(\'{keyword}\'), ' \
-                             '{rhs_type}, {return_type}{init_code})'.format(
-                    lhs_type=lhs_type.__name__,
-                    keyword=op_name,
-                    rhs_type=rhs_type.__name__,
-                    return_type=return_type.__name__,
-                    init_code=init_code
-                )
-                expressions.append(expression)
+                expressions.append((lhs_type.__name__, op_name, rhs_type.__name__, return_type.__name__))
     elif num_sections == 5:
-        if return_type in TYPE_TO_INIT_ARGS:
-            init_code = ', action=lambda rhs, i: %s' % TYPE_TO_INIT_ARGS[return_type]
-
         for rhs_type_name in _parse_type_names(sections[2]):
             rhs_type = STRING_TO_TYPE[rhs_type_name]
-            expression = 'UnaryExpression(' \
-                         'Keyword(\'{keyword}\'), ' \
-                         '{rhs_type}, {return_type}{init_code})'.format(
-                keyword=op_name,
-                rhs_type=rhs_type.__name__,
-                return_type=return_type.__name__,
-                init_code=init_code
-            )
-            expressions.append(expression)
+            expressions.append((op_name, rhs_type.__name__, return_type.__name__))
     else:
-        if return_type in TYPE_TO_INIT_ARGS:
-            init_code = ', action=lambda i: %s' % TYPE_TO_INIT_ARGS[return_type]
-
-        expression = 'NullExpression(' \
-                     'Keyword(\'{keyword}\'), ' \
-                     '{return_type}{init_code})'.format(
-                keyword=op_name,
-                return_type=return_type.__name__,
-                init_code=init_code
-            )
-        expressions.append(expression)
+        expressions.append((op_name, return_type.__name__))
 
 preamble = r'''# This file is generated automatically by `build_database.py`. Change it there.
-from sqf.expressions import BinaryExpression, UnaryExpression, NullExpression
-from sqf.types import Keyword, Type, Nothing, Anything, String, Code, Array, Number, Boolean, Namespace, \
-    Object, Config, Script, Control, Group, Display, Side, Task, Location, NetObject, DiaryReport, TeamMember
-from sqf.interpreter_types import WhileType, \
-    ForType, SwitchType, IfType, TryType, WithType'''
+# The signatures of the SQF expressions: (lhs, keyword, rhs, return) of binary, (keyword, rhs, return)
+# of unary and (keyword, return) of nullary expressions, where the types are names of classes of
+# `sqf.types` and `sqf.interpreter_types`. They are constants (and not expressions) so this module is
+# fast to import; the expressions are built by `sqf.expressions_cache.ExpressionsDatabase` when used.'''
 
 # Expressions that use symbols are hardcoded since they aren't present in the parsed file
 symbols = r'''
-EXPRESSIONS = [
-    BinaryExpression(Array, Keyword('#'), Number, Anything),
-    BinaryExpression(Number, Keyword('!='), Number, Boolean),
-    BinaryExpression(String, Keyword('!='), String, Boolean),
-    BinaryExpression(Object, Keyword('!='), Object, Boolean),
-    BinaryExpression(Group, Keyword('!='), Group, Boolean),
-    BinaryExpression(Side, Keyword('!='), Side, Boolean),
-    BinaryExpression(String, Keyword('!='), String, Boolean),
-    BinaryExpression(Config, Keyword('!='), Config, Boolean),
-    BinaryExpression(Display, Keyword('!='), Display, Boolean),
-    BinaryExpression(Control, Keyword('!='), Control, Boolean),
-    BinaryExpression(TeamMember, Keyword('!='), TeamMember, Boolean),
-    BinaryExpression(NetObject, Keyword('!='), NetObject, Boolean),
-    BinaryExpression(Task, Keyword('!='), Task, Boolean),
-    BinaryExpression(Location, Keyword('!='), Location, Boolean),
-    BinaryExpression(Number, Keyword('%'), Number, Number),
-    BinaryExpression(Boolean, Keyword('&&'), Boolean, Boolean),
-    BinaryExpression(Boolean, Keyword('&&'), Code, Boolean),
-    BinaryExpression(Number, Keyword('*'), Number, Number),
-    BinaryExpression(Number, Keyword('+'), Number, Number),
-    BinaryExpression(String, Keyword('+'), String, String),
-    BinaryExpression(Array, Keyword('+'), Array, Array),
-    BinaryExpression(Number, Keyword('-'), Number, Number),
-    BinaryExpression(Array, Keyword('-'), Array, Array),
-    BinaryExpression(Number, Keyword('/'), Number, Number),
-    BinaryExpression(Config, Keyword('/'), String, Config),
-    BinaryExpression(SwitchType, Keyword(':'), Code, Nothing),
-    BinaryExpression(Number, Keyword('<'), Number, Boolean),
-    BinaryExpression(Number, Keyword('<='), Number, Boolean),
-    BinaryExpression(Number, Keyword('=='), Number, Boolean),
-    BinaryExpression(String, Keyword('=='), String, Boolean),
-    BinaryExpression(Object, Keyword('=='), Object, Boolean),
-    BinaryExpression(Group, Keyword('=='), Group, Boolean),
-    BinaryExpression(Side, Keyword('=='), Side, Boolean),
-    BinaryExpression(String, Keyword('=='), String, Boolean),
-    BinaryExpression(Config, Keyword('=='), Config, Boolean),
-    BinaryExpression(Display, Keyword('=='), Display, Boolean),
-    BinaryExpression(Control, Keyword('=='), Control, Boolean),
-    BinaryExpression(TeamMember, Keyword('=='), TeamMember, Boolean),
-    BinaryExpression(NetObject, Keyword('=='), NetObject, Boolean),
-    BinaryExpression(Task, Keyword('=='), Task, Boolean),
-    BinaryExpression(Location, Keyword('=='), Location, Boolean),
-    BinaryExpression(Number, Keyword('>'), Number, Boolean),
-    BinaryExpression(Number, Keyword('>='), Number, Boolean),
-    BinaryExpression(Config, Keyword('>>'), String, Config),
-    BinaryExpression(Number, Keyword('^'), Number, Number),
-    BinaryExpression(Boolean, Keyword('||'), Boolean, Boolean),
-    BinaryExpression(Boolean, Keyword('||'), Code, Boolean),
-    UnaryExpression(Keyword('!'), Boolean, Boolean),
-    UnaryExpression(Keyword('+'), Number, Number),
-    UnaryExpression(Keyword('+'), Array, Array),
-    UnaryExpression(Keyword('-'), Number, Number),
+SIGNATURES = (
+    ('Array', '#', 'Number', 'Anything'),
+    ('Number', '!=', 'Number', 'Boolean'),
+    ('String', '!=', 'String', 'Boolean'),
+    ('Object', '!=', 'Object', 'Boolean'),
+    ('Group', '!=', 'Group', 'Boolean'),
+    ('Side', '!=', 'Side', 'Boolean'),
+    ('String', '!=', 'String', 'Boolean'),
+    ('Config', '!=', 'Config', 'Boolean'),
+    ('Display', '!=', 'Display', 'Boolean'),
+    ('Control', '!=', 'Control', 'Boolean'),
+    ('TeamMember', '!=', 'TeamMember', 'Boolean'),
+    ('NetObject', '!=', 'NetObject', 'Boolean'),
+    ('Task', '!=', 'Task', 'Boolean'),
+    ('Location', '!=', 'Location', 'Boolean'),
+    ('Number', '%', 'Number', 'Number'),
+    ('Boolean', '&&', 'Boolean', 'Boolean'),
+    ('Boolean', '&&', 'Code', 'Boolean'),
+    ('Number', '*', 'Number', 'Number'),
+    ('Number', '+', 'Number', 'Number'),
+    ('String', '+', 'String', 'String'),
+    ('Array', '+', 'Array', 'Array'),
+    ('Number', '-', 'Number', 'Number'),
+    ('Array', '-', 'Array', 'Array'),
+    ('Number', '/', 'Number', 'Number'),
+    ('Config', '/', 'String', 'Config'),
+    ('SwitchType', ':', 'Code', 'Nothing'),
+    ('Number', '<', 'Number', 'Boolean'),
+    ('Number', '<=', 'Number', 'Boolean'),
+    ('Number', '==', 'Number', 'Boolean'),
+    ('String', '==', 'String', 'Boolean'),
+    ('Object', '==', 'Object', 'Boolean'),
+    ('Group', '==', 'Group', 'Boolean'),
+    ('Side', '==', 'Side', 'Boolean'),
+    ('String', '==', 'String', 'Boolean'),
+    ('Config', '==', 'Config', 'Boolean'),
+    ('Display', '==', 'Display', 'Boolean'),
+    ('Control', '==', 'Control', 'Boolean'),
+    ('TeamMember', '==', 'TeamMember', 'Boolean'),
+    ('NetObject', '==', 'NetObject', 'Boolean'),
+    ('Task', '==', 'Task', 'Boolean'),
+    ('Location', '==', 'Location', 'Boolean'),
+    ('Number', '>', 'Number', 'Boolean'),
+    ('Number', '>=', 'Number', 'Boolean'),
+    ('Config', '>>', 'String', 'Config'),
+    ('Number', '^', 'Number', 'Number'),
+    ('Boolean', '||', 'Boolean', 'Boolean'),
+    ('Boolean', '||', 'Code', 'Boolean'),
+    ('!', 'Boolean', 'Boolean'),
+    ('+', 'Number', 'Number'),
+    ('+', 'Array', 'Array'),
+    ('-', 'Number', 'Number'),
 '''
 
 
 with open('sqf/database.py', 'w') as f:
     f.write(preamble + '\n\n')
     f.write(symbols + '    ')
-    f.write(',\n    '.join(expressions))
-    f.write('\n]\n')
+    f.write(',\n    '.join(repr(expression) for expression in expressions))
+    f.write(',\n)\n')
@@ -1,5 +1,3 @@
-from copy import deepcopy
-
 from sqf.types import Statement, Code, Nothing, Variable, Array, String, Type, File, BaseType, \
     Number, Preprocessor, Script, Anything
 from sqf.interpreter_types import InterpreterType, PrivateType, ForType, SwitchType, \
@@ -8,9 +6,9 @@ from sqf.keywords import Keyword, PREPROCESSORS
 from sqf.expressions import UnaryExpression, BinaryExpression
 from sqf.exceptions import SQFParserError, SQFWarning
 from sqf.base_interpreter import BaseInterpreter
-from sqf.database import EXPRESSIONS
+from sqf.database import SIGNATURES
 from sqf.common_expressions import COMMON_EXPRESSIONS, ForEachExpression, ElseExpression
-from sqf.expressions_cache import values_to_expressions, build_database
+from sqf.expressions_cache import ExpressionsDatabase
 from sqf.parser_types import Comment
 from sqf.parser import parse
 
@@ -20,13 +18,22 @@ def all_equal(iterable):
 
 
 # Replace all expressions in `database` by expressions from `COMMON_EXPRESSIONS` with the same signature
-for exp in COMMON_EXPRESSIONS:
-    if exp in EXPRESSIONS:
-        EXPRESSIONS.remove(exp)
-    EXPRESSIONS.append(exp)
+EXPRESSIONS = ExpressionsDatabase(SIGNATURES, COMMON_EXPRESSIONS)
 
 
-EXPRESSIONS_MAP = build_database(EXPRESSIONS)
+# keywords the analyzer handles specifically, created once since they are compared in every statement
+INCLUDE = Preprocessor('#include')
+PRIVATE = Keyword('private')
+ASSIGN = Keyword('=')
+ISNIL = Keyword('isnil')
+CONFIG_CLASSES = Keyword('configClasses')
+CALL = Keyword('call')
+SPAWN = Keyword('spawn')
+FOREACH = Keyword('foreach')
+CATCH = Keyword('catch')
+DO = Keyword('do')
+# keywords whose code is executed with `_x`
+X_KEYWORDS = (Keyword('select'), Keyword('apply'), Keyword('count'), Keyword('findif'))
 
 
 def is_undefined_define(base_tokens):
@@ -44,9 +51,10 @@ class UnexecutedCode:
     """
     A piece of code that needs to be re-run on a contained env to check for issues.
     We copy the state of the analyzer (namespaces) so we get what that code would run.
+    The namespaces are snapshots (see `Namespace.snapshot`) since values are not modified by the analyzer.
     """
     def __init__(self, code, analyzer):
-        self.namespaces = deepcopy(analyzer._namespaces)
+        self.namespaces = {name: namespace.snapshot() for name, namespace in analyzer._namespaces.items()}
         self.namespace_name = analyzer.current_namespace.name
         self.code = code
         self.position = code.position
@@ -65,32 +73,56 @@ class Analyzer(BaseInterpreter):
     def __init__(self, all_vars=None):
         super().__init__(all_vars)
         self.exceptions = []
+        self.variable_uses = {}
 
         self.privates = set()
         self.unevaluated_interpreter_tokens = []
         self._unexecuted_codes = {}
         self._executed_codes = {}  # executed code -> result
 
-        self.variable_uses = {}
-
         # a counter used by `self.assign` to identify if a variable is deleted (assigned to Anything) or not.
         self.delete_scope_level = 0
 
         # list of variables that we currently know the type during the script.
         self.undefined_variables = set()
 
+    def _push_frame(self, namespaces, delete_scope_level):
+        """
+        Replaces the state of the analysis by the one of a code analyzed on its own (see `execute_unexecuted_code`)
+        and returns the replaced state, to be restored by `_pop_frame`. The exceptions and uses of variables are
+        not replaced, so the code reports them to this analyzer.
+        """
+        frame = (self._namespaces, self.current_namespace, self.delete_scope_level, self.privates,
+                 self.unevaluated_interpreter_tokens, self._unexecuted_codes, self._executed_codes,
+                 self.undefined_variables)
+
+        self._namespaces = namespaces
+        self.current_namespace = self.namespace('missionnamespace')
+        self.delete_scope_level = delete_scope_level
+        self.privates = set()
+        self.unevaluated_interpreter_tokens = []
+        self._unexecuted_codes = {}
+        self._executed_codes = {}
+        self.undefined_variables = set()
+        return frame
+
+    def _pop_frame(self, frame):
+        (self._namespaces, self.current_namespace, self.delete_scope_level, self.privates,
+         self.unevaluated_interpreter_tokens, self._unexecuted_codes, self._executed_codes,
+         self.undefined_variables) = frame
+
     def exception(self, exception):
         self.exceptions.append(exception)
 
     @staticmethod
     def code_key(code):
-        return code.position, str(code)
+        return code.position, code.content_key
 
     @staticmethod
     def exe_code_key(code, extra_scope):
         if extra_scope is None:
             extra_scope = {}
-        return str(code), tuple((x, type(extra_scope[x])) for x in sorted(extra_scope.keys()))
+        return code.content_key, tuple((x, type(extra_scope[x])) for x in sorted(extra_scope.keys()))
 
     def value(self, token, namespace_name=None):
         """
@@ -110,18 +142,18 @@ class Analyzer(BaseInterpreter):
         elif isinstance(token, Statement):
             result = self.value(self.execute_token(token))
         elif isinstance(token, Variable):
-            scope = self.get_scope(token.name, namespace_name)
+            scope = self.get_variable_scope(token, namespace_name)
             if scope.level == 0 and not token.is_global:
                 self.exception(
                     SQFWarning(token.position, 'Local variable "%s" is not from this scope (not private)' % token))
 
             try:
-                result = scope[token.name]
+                result = scope.values[token.normalized_name]
             except KeyError:
                 result = self.private_default_class()
             result.position = token.position
 
-            key = '%s_%s_%s' % (namespace_name, scope.level, scope.normalize(token.name))
+            key = '%s_%s_%s' % (namespace_name, scope.level, token.normalized_name)
             if key in self.variable_uses:
                 self.variable_uses[key]['count'] += 1
 
@@ -129,7 +161,7 @@ class Analyzer(BaseInterpreter):
             result = Array([self.value(self.execute_token(s)) for s in token.value])
             result.position = token.position
         else:
-            null_expressions = values_to_expressions([token], EXPRESSIONS_MAP, EXPRESSIONS)
+            null_expressions = EXPRESSIONS.values_to_expressions([token])
             if null_expressions:
                 result = null_expressions[0].execute([token], self)
             else:
@@ -167,22 +199,17 @@ class Analyzer(BaseInterpreter):
         """
         container = self._unexecuted_codes[code_key]
 
-        analyzer = Analyzer()
-        if not own_namespace:
-            analyzer._namespaces = container.namespaces
-        analyzer.variable_uses = self.variable_uses
-        analyzer.delete_scope_level = container.delete_scope_level
-
         file = File(container.code._tokens)
         file.position = container.position
 
-        this = Anything()
-        this.position = container.position
-
-        analyzer.execute_code(file, extra_scope=extra_scope,
+        # the code is analyzed in a frame with the namespaces of when the code was defined
+        namespaces = self.new_namespaces() if own_namespace else container.namespaces
+        frame = self._push_frame(namespaces, container.delete_scope_level)
+        try:
+            self.execute_code(file, extra_scope=extra_scope,
                               namespace_name=container.namespace_name, delete_mode=True)
-
-        self.exceptions.extend(analyzer.exceptions)
+        finally:
+            self._pop_frame(frame)
 
     def execute_code(self, code, extra_scope=None, namespace_name='missionnamespace', delete_mode=False):
         key = self.code_key(code)
@@ -274,12 +301,10 @@ class Analyzer(BaseInterpreter):
         outcome = Nothing()
         outcome.position = statement.position
 
-        base_tokens = []
         for token in statement.tokens:
             if not statement.is_base_token(token):
                 self.execute_other(token)
-            else:
-                base_tokens.append(token)
+        base_tokens = statement.base_tokens
 
         if not base_tokens:
             return outcome
@@ -287,7 +312,7 @@ class Analyzer(BaseInterpreter):
         # operations that cannot evaluate the value of all base_tokens
         if type(base_tokens[0]) == DefineStatement:
             return base_tokens[0]
-        elif base_tokens[0] == Preprocessor("#include"):
+        elif base_tokens[0] == INCLUDE:
             if len(base_tokens) != 2:
                 exception = SQFParserError(base_tokens[0].position, "#include requires one argument")
                 self.exception(exception)
@@ -298,7 +323,7 @@ class Analyzer(BaseInterpreter):
         elif isinstance(base_tokens[0], Keyword) and base_tokens[0].value in PREPROCESSORS:
             # remaining preprocessors are ignored
             return outcome
-        elif len(base_tokens) == 2 and base_tokens[0] == Keyword('private'):
+        elif len(base_tokens) == 2 and base_tokens[0] == PRIVATE:
             # the rhs may be a variable, so we cannot get the value
             rhs = self.execute_token(base_tokens[1])
             if isinstance(rhs, String):
@@ -321,7 +346,7 @@ class Analyzer(BaseInterpreter):
                 self.exception(SQFParserError(base_tokens[0].position, '`private` used incorrectly'))
             return outcome
         # assignment operator
-        elif len(base_tokens) == 3 and base_tokens[1] == Keyword('='):
+        elif len(base_tokens) == 3 and base_tokens[1] == ASSIGN:
             lhs = self.execute_token(base_tokens[0])
             if isinstance(lhs, PrivateType):
                 self.privates.remove(lhs)
@@ -376,19 +401,15 @@ class Analyzer(BaseInterpreter):
             values.append(v)
 
         # try to find a match for any expression, both typed and un-typed
-        case_found = None
-        possible_expressions = values_to_expressions(values, EXPRESSIONS_MAP, EXPRESSIONS)
-        for case in possible_expressions:
-            if case.is_signature_match(values):  # match first occurrence
-                case_found = case
-                break
+        possible_expressions = EXPRESSIONS.values_to_expressions(values)
+        case_found = EXPRESSIONS.match(values, exact=False)  # match first occurrence
 
         if case_found:
             # if exact match, we run the expression.
             if case_found.is_match(values):
                 # parse and execute the string that is code (to count usage of variables)
-                if case_found.keyword == Keyword('isnil') and type(values[1]) == String or \
-                   case_found.keyword == Keyword('configClasses'):
+                if case_found.keyword == ISNIL and type(values[1]) == String or \
+                   case_found.keyword == CONFIG_CLASSES:
                     code_position = {'isnil': 1, 'configclasses': 0}[case_found.keyword.unique_token]
                     extra_scope = {'isnil': None, 'configclasses': {'_x': Anything()}}[case_found.keyword.unique_token]
 
@@ -412,27 +433,27 @@ class Analyzer(BaseInterpreter):
                     outcome = return_type()
                 if return_type == ForType:
                     outcome.copy(values[0])
-                elif case_found.keyword == Keyword('call'):
+                elif case_found.keyword == CALL:
                     outcome = Anything()
             else:
                 # when a case is found but we cannot decide on the type, it is anything
                 outcome = Anything()
 
             extra_scope = None
-            if case_found.keyword in (Keyword('select'), Keyword('apply'), Keyword('count'), Keyword('findif')):
+            if case_found.keyword in X_KEYWORDS:
                 extra_scope = {'_x': Anything()}
-            elif case_found.keyword == Keyword('foreach'):
+            elif case_found.keyword == FOREACH:
                 extra_scope = {'_foreachindex': Number(), '_x': Anything()}
-            elif case_found.keyword == Keyword('catch'):
+            elif case_found.keyword == CATCH:
                 extra_scope = {'_exception': Anything()}
-            elif case_found.keyword == Keyword('spawn'):
+            elif case_found.keyword == SPAWN:
                 extra_scope = {'_thisScript': Script(), '_this': values[0]}
-            elif case_found.keyword == Keyword('do') and type(values[0]) == ForType:
+            elif case_found.keyword == DO and type(values[0]) == ForType:
                 extra_scope = {values[0].variable.value: Number()}
             for value, t_or_v in zip(values, case_found.types_or_values):
                 # execute all pieces of code
                 if t_or_v == Code and isinstance(value, Code) and self.code_key(value) not in self._executed_codes:
-                    if case_found.keyword == Keyword('spawn'):
+                    if case_found.keyword == SPAWN:
                         self.execute_unexecuted_code(self.code_key(value), extra_scope, True)
                         # this code was executed, so it does not need to be evaluated on an un-executed env.
                         del self._unexecuted_codes[self.code_key(value)]
@@ -11,15 +11,19 @@ class BaseInterpreter:
     private_default_class = Anything
 
     def __init__(self, all_vars=None):
-        self._namespaces = {
+        self._namespaces = self.new_namespaces(all_vars)
+
+        self.current_namespace = self.namespace('missionnamespace')
+
+    @staticmethod
+    def new_namespaces(all_vars=None):
+        return {
             'uinamespace': sqf.namespace.Namespace('uinamespace'),
             'parsingnamespace': sqf.namespace.Namespace('parsingnamespace'),
             'missionnamespace': sqf.namespace.Namespace('missionnamespace', all_vars),
             'profilenamespace': sqf.namespace.Namespace('profilenamespace')
         }
 
-        self.current_namespace = self.namespace('missionnamespace')
-
     def exception(self, exception):
         """
         We can overwrite this method to handle exceptions differently
@@ -101,18 +105,21 @@ class BaseInterpreter:
         if isinstance(token, Statement):
             return self.value(self.execute_single(statement=token))
         elif isinstance(token, Variable):
-            scope = self.get_scope(token.name, namespace_name)
-            try:
-                value = scope[token.name]
-            except KeyError:
-                value = self.private_default_class()
-            assert isinstance(value, Type)
-            return value
+            return self.variable_value(token, namespace_name)
         elif isinstance(token, (Type, Keyword)):
             return token
         else:
             raise NotImplementedError(repr(token))
 
+    def variable_value(self, variable, namespace_name=None):
+        scope = self.get_variable_scope(variable, namespace_name)
+        try:
+            value = scope.values[variable.normalized_name]
+        except KeyError:
+            value = self.private_default_class()
+        assert isinstance(value, Type)
+        return value
+
     def get_variable(self, token):
         if isinstance(token, Statement):
             return self.get_variable(token.base_tokens[0])
@@ -134,6 +141,16 @@ class BaseInterpreter:
             namespace = self.namespace(namespace_name)
         return namespace.get_scope(name)
 
+    def get_variable_scope(self, variable, namespace_name=None):
+        """
+        Same as `get_scope` for a `Variable`, whose name is only normalized once.
+        """
+        if namespace_name is None:
+            namespace = self.current_namespace
+        else:
+            namespace = self.namespace(namespace_name)
+        return namespace.get_normalized_scope(variable.normalized_name)
+
     def _add_private(self, variable):
         assert isinstance(variable, String)
         self.current_scope[variable.value] = Nothing()
@@ -171,6 +188,19 @@ class BaseInterpreter:
         namespace.add_scope(extra_scope)
 
         # execute the code
+        outcome = self.execute_statements(code)
+
+        # cleanup
+        if not isinstance(code, File):  # so we have access to its scope
+            # this has to be the executing namespace because "self.current_namespace" may change
+            namespace.del_scope()
+        self.current_namespace = _previous_namespace
+        return outcome
+
+    def execute_statements(self, code):
+        """
+        Executes the statements of `code` in the current scope, returning the value of the last one.
+        """
         outcome = self.private_default_class()
         outcome.position = code.position
         for statement in code.base_tokens:
@@ -178,12 +208,6 @@ class BaseInterpreter:
             if isinstance(token, tuple):
                 token = token[0]
             outcome = self.value(token)
-
-        # cleanup
-        if not isinstance(code, File):  # so we have access to its scope
-            # this has to be the executing namespace because "self.current_namespace" may change
-            namespace.del_scope()
-        self.current_namespace = _previous_namespace
         return outcome
 
     def execute_single(self, statement):
@@ -1,7 +1,26 @@
 import re
 
+# the len=2 tokens have to be first!
+DELIMITERS = r'\\\n|\r\n|>>|\/\*|\*\/|\|\||//|!=|<=|>=|==|\n|\t|[\"\' =:\{\}\(\)\[\];/,\!\/\*\%\^\-\+<>]'
+
+# a string is closed by a quote that is not followed by another quote (a double quote is an escaped quote)
+STRING = r'"[^"]*(?:""[^"]*)*"(?!")|\'[^\']*(?:\'\'[^\']*)*\'(?!\')'
+
+# comments are closed by the first `*/` or end of line that `tokenize` would split, e.g. `/*/` does not close
+# a block comment and `\` followed by an end of line does not close a line comment.
+COMMENT = r'/\*[^/*]*(?:(?:/\*|//|/(?![*/])|\*(?!/))[^/*]*)*(?:\*/)?|//[^\\\n]*(?:\\\n?[^\\\n]*)*\n?'
+
+SCANNER = re.compile(r'(%s|%s|%s)' % (STRING, COMMENT, DELIMITERS))
+
 
 def tokenize(statement):
-    # the len=2 tokens have to be first!
-    regex = r'(\\\n|\r\n|>>|\/\*|\*\/|\|\||//|!=|<=|>=|==|\n|\t|[\"\' =:\{\}\(\)\[\];/,\!\/\*\%\^\-\+<>])'
+    regex = r'(%s)' % DELIMITERS
     return list(filter(None, re.split(regex, statement)))
+
+
+def scan(script):
+    """
+    Like `tokenize`, but strings and comments are returned as a single token.
+    A string that is not closed is returned as a single quote token.
+    """
+    return list(filter(None, SCANNER.split(script)))
@@ -29,22 +29,54 @@ assert(get_diff('aa\n') == (1, 0))
 assert(get_diff('aa\na') == (1, 1))
 
 
+def advance(position, string):
+    """
+    Returns the coordinate after `string` when `string` starts at coordinate `position`.
+    """
+    if '\n' not in string:
+        return position[0], position[1] + len(string)
+    return position[0] + string.count('\n'), len(string) - string.rindex('\n')
+assert(advance((2, 3), 'aa') == (2, 5))
+assert(advance((2, 3), 'aa\na') == (3, 2))
+
+
 class BaseType:
     """
     This class is used to count the string-coordinate (line, column) of any element in a statement.
     This is used for identifying, in a script, the line and column of an error.
     It also defines the __eq__
+
+    Tokens of the parser are created in large numbers, so they use `__slots__`; subclasses
+    with slots and attributes must define `_key`. For the same reason, the position is stored as
+    two slots (the line number is shared by the tokens of a line) instead of a tuple per token.
     """
+    __slots__ = ('_line', '_column')
+
     def __init__(self):
-        self._position = None
+        self._line = None
+        self._column = None
+
+    @property
+    def _position(self):
+        if self._line is None:
+            return None
+        return self._line, self._column
+
+    @_position.setter
+    def _position(self, position):
+        if position is None:
+            self._line = self._column = None
+        else:
+            self._line, self._column = position
 
     @property
     def _key(self):
         # idiom described in https://stackoverflow.com/a/2909119/931303
-        return tuple(x for x in sorted(self.__dict__.items()) if x[0] != '_position')
+        # (subclasses with slots and no attributes have no __dict__)
+        return tuple(sorted(getattr(self, '__dict__', {}).items()))
 
     def __eq__(self, other):
-        return isinstance(other, self.__class__) and self._key == other._key
+        return self is other or isinstance(other, self.__class__) and self._key == other._key
 
     def __ne__(self, other):
         return not self.__eq__(other)
@@ -57,9 +89,16 @@ class BaseType:
         assert (len(position) == 2)
         self._position = position
 
+    def _set_positions(self, position):
+        """
+        Sets the position of this token (and of its tokens) and returns the position after it.
+        """
+        self._position = position
+        return advance(position, str(self))
+
     @property
     def undefined_position(self):
-        return self._position is None
+        return self._line is None
 
     @property
     def position(self):
@@ -74,7 +113,7 @@ class BaseType:
 
 class ParserType(BaseType):
     # base type ignored by the interpreter
-    pass
+    __slots__ = ()
 
 
 class BaseTypeContainer(BaseType):
@@ -98,22 +137,37 @@ class BaseTypeContainer(BaseType):
     def _as_str(self, func=str):
         raise NotImplementedError
 
-    def set_position(self, position):
-        self._position = position
-        for token in self._tokens:
-            token.set_position(position)
+    def _str_tokens(self):
+        """
+        The tokens whose strings are concatenated to build the string of this container,
+        or None when the string is built by `_as_str`.
+        """
+        return None
 
-            token_delta = get_diff(str(token))
+    def _cached_str(self):
+        """
+        The string of this container when it is stored, or None.
+        """
+        return None
 
-            if token_delta[0] == 0:
-                initial_column = position[1]
-            else:
-                initial_column = 1
+    def set_position(self, position):
+        self._set_positions(position)
 
-            position = (
-                position[0] + token_delta[0],
-                initial_column + token_delta[1]
-            )
+    def _set_positions(self, position):
+        # a single traversal that carries the position, so the string of each container is never built.
+        # Nested containers are traversed with an explicit stack, so their depth is not limited.
+        self._position = position
+        stack = [iter(self._tokens)]
+        while stack:
+            for token in stack[-1]:
+                if isinstance(token, BaseTypeContainer):
+                    token._position = position
+                    stack.append(iter(token._tokens))
+                    break
+                position = token._set_positions(position)
+            else:
+                stack.pop()
+        return position
 
     @BaseType.position.setter
     def position(self, position):
@@ -131,4 +185,21 @@ class BaseTypeContainer(BaseType):
         return [token for token in self._tokens if self.is_base_token(token)]
 
     def __str__(self):
-        return self._as_str()
+        tokens = self._str_tokens()
+        if tokens is None:
+            return self._as_str()
+        # nested containers are rendered with an explicit stack, so their depth is not limited
+        # (and the stored strings of nested containers are used)
+        strings = []
+        stack = [iter(tokens)]
+        while stack:
+            for token in stack[-1]:
+                if isinstance(token, BaseTypeContainer) and token._cached_str() is None:
+                    tokens = token._str_tokens()
+                    if tokens is not None:
+                        stack.append(iter(tokens))
+                        break
+                strings.append(str(token))
+            else:
+                stack.pop()
+        return ''.join(strings)
@@ -0,0 +1,119 @@
+"""
+Compiles code for the interpreter (see `sqf.interpreter.Interpreter`).
+
+The interpreter evaluates a statement by evaluating its base tokens and then executing the statement
+with their values. A program is that evaluation lowered to a flat list of instructions in
+post-order: each instruction is a function and its argument, that pushes the token and value of a
+base token to a stack, or that pops the values of the base tokens of a statement and pushes its
+outcome. Walking the tree (its base tokens and the kind of each token) is therefore done once per
+code, and not every time the code is executed, e.g. on each iteration of a loop.
+"""
+from sqf.types import Statement, Array, Variable, Type, Keyword, Nothing
+
+
+# keywords whose value is computed by the interpreter (see `Interpreter.execute_token`)
+_DYNAMIC_KEYWORDS = (Keyword('isServer'), Keyword('isDedicated'))
+
+
+def _constant(interpreter, stack, token):
+    stack.append((token, token))
+
+
+def _variable(interpreter, stack, token):
+    stack.append((token, interpreter.variable_value(token)))
+
+
+def _token(interpreter, stack, token):
+    stack.append(interpreter.execute_token(token))
+
+
+def _array(interpreter, stack, argument):
+    token, size = argument
+    if size:
+        values = [value for _, value in stack[-size:]]
+        del stack[-size:]
+    else:
+        values = []
+    result = Array(values)
+    result.position = token.position
+    stack.append((result, result))
+
+
+def _statement(interpreter, stack, argument):
+    statement, position, base_tokens = argument
+    size = len(base_tokens)
+    if size:
+        evaluated = stack[-size:]
+        del stack[-size:]
+    else:
+        evaluated = []
+    tokens = [token for token, _ in evaluated]
+    values = [value for _, value in evaluated]
+
+    result = interpreter.execute_values(statement, base_tokens, tokens, values)
+    result.position = position
+    stack.append((result, interpreter.value(result)))
+
+
+def _single_statement(interpreter, stack, argument):
+    """
+    A statement with a single base token, e.g. a variable surrounded by spaces, whose outcome is the value
+    of its token: no expression matches a single value that is not a keyword.
+    """
+    statement, position, base_tokens = argument
+    token, value = stack[-1]
+    if isinstance(value, Keyword):
+        return _statement(interpreter, stack, argument)
+
+    if statement.ending:
+        result = Nothing()
+    else:
+        result = value
+        assert(type(result) is Nothing or not result.is_undefined)
+    result.position = position
+    # values are not variables nor statements, so the value of the result is itself
+    stack[-1] = (result, result)
+
+
+def _compile_token(token, program):
+    if isinstance(token, Statement):
+        base_tokens = token.base_tokens
+        for base_token in base_tokens:
+            _compile_token(base_token, program)
+        instruction = _single_statement if len(base_tokens) == 1 else _statement
+        program.append((instruction, (token, token.position, base_tokens)))
+    elif isinstance(token, Array):
+        # empty statements are ignored
+        elements = [s for s in token.value if s]
+        for element in elements:
+            _compile_token(element, program)
+        program.append((_array, (token, len(elements))))
+    elif isinstance(token, Variable):
+        program.append((_variable, token))
+    elif isinstance(token, Type) or isinstance(token, Keyword) and token not in _DYNAMIC_KEYWORDS:
+        program.append((_constant, token))
+    else:
+        program.append((_token, token))
+
+
+def compile_code(code):
+    """
+    Returns the program of `code`, whose execution pushes the token and value of each of its statements.
+    The program is stored in the code, so it is compiled once.
+    """
+    if code._program is None:
+        program = []
+        for statement in code.base_tokens:
+            _compile_token(statement, program)
+        code._program = tuple(program)
+    return code._program
+
+
+def run(interpreter, program):
+    """
+    Executes `program` with `interpreter`, returning the stack with the token and value of each statement.
+    """
+    stack = []
+    for instruction, argument in program:
+        instruction(interpreter, stack, argument)
+    return stack
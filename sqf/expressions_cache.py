@@ -1,6 +1,10 @@
 import collections
+from operator import itemgetter
 
-from sqf.types import Keyword
+import sqf.types
+import sqf.interpreter_types
+from sqf.types import Keyword, Namespace
+from sqf.expressions import BinaryExpression, UnaryExpression, NullExpression
 
 
 def get_keyword(types_or_values):
@@ -15,15 +19,172 @@ def get_key(types_or_values):
     return keyword, len(types_or_values)
 
 
-def build_database(expressions):
-    database = collections.defaultdict(set)
-    for i, exp in enumerate(expressions):
-        key = get_key(exp.types_or_values)
-        database[key].add(i)
+def _dispatch_key(values):
+    """
+    The types of `values`, with the token of the keywords. Expressions match values by their class
+    (including its subclasses), by being equal keywords or, when not exact, by the value being `Anything`,
+    so whether an expression matches `values` only depends on this key.
+    """
+    return tuple([(type(value), value.unique_token) if isinstance(value, Keyword) else type(value)
+                  for value in values])
 
-    return database
 
+class ExpressionsDispatch:
+    """
+    Finds the first expression of `expressions` that matches values (see `Expression.is_match`).
 
-def values_to_expressions(values, database, expressions):
-    key = get_key(values)
-    return [expressions[i] for i in database[key]]
+    Expressions are indexed by their keyword and number of values (see `get_key`), keeping their order,
+    and the match of each `_dispatch_key` is stored, so the expressions are only compared with the values
+    the first time values with those types (and keywords) are seen.
+    """
+    def __init__(self, expressions):
+        self._database = collections.defaultdict(list)
+        for exp in expressions:
+            self._database[get_key(exp.types_or_values)].append(exp)
+        self._matches = {}
+
+    def values_to_expressions(self, values):
+        """
+        The expressions with the keyword and number of values of `values`, in order
+        (that the caller must not modify).
+        """
+        return self._database.get(get_key(values), [])
+
+    def match(self, values, exact=True):
+        """
+        Returns the first expression that matches `values` (see `Expression.is_match`), or None when there is none.
+        """
+        key = _dispatch_key(values), exact
+        try:
+            return self._matches[key]
+        except KeyError:
+            match = self._matches[key] = next(
+                (exp for exp in self.values_to_expressions(values) if exp.is_match(values, exact)), None)
+            return match
+
+
+# the values that the return types of the database are initialized with (other than their default)
+_RETURN_VALUES = {
+    Namespace: 'missionNamespace',
+}
+
+
+def _type(name):
+    try:
+        return getattr(sqf.types, name)
+    except AttributeError:
+        return getattr(sqf.interpreter_types, name)
+
+
+def _expression(signature):
+    """
+    Returns the expression of a signature of `sqf.database.SIGNATURES`.
+    """
+    return_type = _type(signature[-1])
+    value = _RETURN_VALUES.get(return_type)
+    if len(signature) == 4:
+        action = None if value is None else lambda lhs, rhs, i: value
+        return BinaryExpression(_type(signature[0]), Keyword(signature[1]), _type(signature[2]), return_type, action)
+    elif len(signature) == 3:
+        action = None if value is None else lambda rhs, i: value
+        return UnaryExpression(Keyword(signature[0]), _type(signature[1]), return_type, action)
+    else:
+        action = None if value is None else lambda i: value
+        return NullExpression(Keyword(signature[0]), return_type, action)
+
+
+def _types_or_values(expression):
+    """
+    The `types_or_values` of `expression` in the format of `sqf.database.SIGNATURES`, so expressions can
+    be compared with signatures without building them. Values that are not keywords are kept as they are
+    (no signature is equal to them).
+    """
+    types_or_values = []
+    for t_or_v in expression.types_or_values:
+        if isinstance(t_or_v, Keyword):
+            types_or_values.append(t_or_v.unique_token)
+        elif isinstance(t_or_v, type):
+            types_or_values.append(t_or_v.__name__)
+        else:
+            types_or_values.append(t_or_v)
+    return tuple(types_or_values)
+
+
+class ExpressionsDatabase(ExpressionsDispatch):
+    """
+    The expressions of `signatures` (see `sqf.database`) followed by `expressions`, where each expression
+    replaces the first expression equal to it, i.e. the list built by
+
+        for exp in expressions:
+            if exp in database:
+                database.remove(exp)
+            database.append(exp)
+
+    Expressions are looked up like in `ExpressionsDispatch`, and an expression of a signature is only
+    built when its keyword is first looked up.
+    """
+    def __init__(self, signatures, expressions=()):
+        super().__init__(())
+        self._signatures = signatures
+        self._expressions = []  # the expressions that follow the signatures
+        self._replaced = set()  # the indexes of the signatures replaced by an expression
+
+        # signatures of the database have lower case keywords, so they are compared with their values
+        types_or_values = list(map(itemgetter(slice(-1)), signatures))
+        first_index = dict(zip(reversed(types_or_values), range(len(signatures) - 1, -1, -1)))
+        for expression in expressions:
+            key = _types_or_values(expression)
+            i = first_index.get(key)
+            while i is not None and i in self._replaced:
+                try:
+                    i = types_or_values.index(key, i + 1)
+                except ValueError:
+                    i = None
+
+            if i is not None:
+                self._replaced.add(i)
+            elif expression in self._expressions:
+                self._expressions.remove(expression)
+            self._expressions.append(expression)
+
+        # built on the first lookup
+        self._items = None  # the signature indexes or expressions, in order
+        self._indexes = None  # the indexes of `_items` by key (see `get_key`)
+        self._database = {}  # the expressions by key, built when the key is first looked up
+
+    def _build(self):
+        self._items = [i for i in range(len(self._signatures)) if i not in self._replaced] + self._expressions
+        self._indexes = collections.defaultdict(list)
+        for i, item in enumerate(self._items):
+            if isinstance(item, int):
+                signature = self._signatures[item]
+                keyword = signature[1] if len(signature) == 4 else signature[0]
+                key = keyword.lower(), len(signature) - 1
+            else:
+                key = get_key(item.types_or_values)
+            self._indexes[key].append(i)
+
+    def _expression(self, i):
+        item = self._items[i]
+        if isinstance(item, int):
+            item = self._items[i] = _expression(self._signatures[item])
+        return item
+
+    def values_to_expressions(self, values):
+        key = get_key(values)
+        try:
+            return self._database[key]
+        except KeyError:
+            if self._items is None:
+                self._build()
+            expressions = self._database[key] = [self._expression(i) for i in self._indexes.get(key, ())]
+            return expressions
+
+    def __len__(self):
+        return len(self._signatures) - len(self._replaced) + len(self._expressions)
+
+    def __iter__(self):
+        if self._items is None:
+            self._build()
+        for i in range(len(self._items)):
+            yield self._expression(i)
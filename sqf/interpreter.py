@@ -3,18 +3,32 @@ from sqf.interpreter_types import PrivateType
 from sqf.keywords import Keyword
 from sqf.parser import parse
 from sqf.exceptions import SQFParserError
-from sqf.common_expressions import COMMON_EXPRESSIONS as EXPRESSIONS
+from sqf.common_expressions import COMMON_EXPRESSIONS
 from sqf.interpreter_expressions import INTERPRETER_EXPRESSIONS
+from sqf.expressions_cache import ExpressionsDispatch
 from sqf.base_interpreter import BaseInterpreter
+from sqf.compiler import compile_code, run
 
 
-# Replace all expressions in `database` by expressions from `COMMON_EXPRESSIONS` with the same signature
+# Replace all expressions in `COMMON_EXPRESSIONS` by expressions from `INTERPRETER_EXPRESSIONS` with the same
+# signature. `COMMON_EXPRESSIONS` is copied, so the expressions of the analyzer do not depend on whether the
+# interpreter was imported first.
+EXPRESSIONS = list(COMMON_EXPRESSIONS)
 for exp in INTERPRETER_EXPRESSIONS:
     if exp in EXPRESSIONS:
         EXPRESSIONS.remove(exp)
     EXPRESSIONS.append(exp)
 
 
+EXPRESSIONS_DISPATCH = ExpressionsDispatch(EXPRESSIONS)
+
+PUBLIC_VARIABLE = Keyword('publicVariable')
+PUBLIC_VARIABLE_SERVER = Keyword('publicVariableServer')
+PUBLIC_VARIABLE_CLIENT = Keyword('publicVariableClient')
+PRIVATE = Keyword('private')
+ASSIGN = Keyword('=')
+
+
 class Interpreter(BaseInterpreter):
     private_default_class = Nothing
 
@@ -63,34 +77,43 @@ class Interpreter(BaseInterpreter):
         result.position = token.position
         return result, self.value(result)
 
+    def execute_statements(self, code):
+        outcome = self.private_default_class()
+        outcome.position = code.position
+
+        stack = run(self, compile_code(code))
+        if stack:
+            outcome = stack[-1][1]
+        return outcome
+
     def execute_single(self, statement):
         assert(not isinstance(statement, Code))
 
-        outcome = Nothing()
-        _outcome = outcome
-
         # evaluate the types of all tokens
         base_tokens = statement.base_tokens
         values = []
         tokens = []
-        types = []
 
         for token in base_tokens:
             t, v = self.execute_token(token)
             values.append(v)
             tokens.append(t)
-            types.append(type(v))
 
-        case_found = None
-        for case in EXPRESSIONS:
-            if case.is_match(values):
-                case_found = case
-                break
+        return self.execute_values(statement, base_tokens, tokens, values)
+
+    def execute_values(self, statement, base_tokens, tokens, values):
+        """
+        Executes a statement given the tokens and values of its base tokens (see `execute_token`).
+        """
+        outcome = Nothing()
+        _outcome = outcome
+
+        case_found = EXPRESSIONS_DISPATCH.match(values)
 
         if case_found is not None:
             outcome = case_found.execute(values, self)
         # todo: replace all elif below by expressions
-        elif len(tokens) == 2 and tokens[0] == Keyword('publicVariable'):
+        elif len(tokens) == 2 and tokens[0] == PUBLIC_VARIABLE:
             if not isinstance(tokens[1], String) or tokens[1].value.startswith('_'):
                 raise SQFParserError(statement.position, 'Interpretation of "%s" failed' % statement)
 
@@ -98,7 +121,7 @@ class Interpreter(BaseInterpreter):
             scope = self.get_scope(var_name, 'missionNamespace')
             self.simulation.broadcast(var_name, scope[var_name])
 
-        elif len(tokens) == 2 and tokens[0] == Keyword('publicVariableServer'):
+        elif len(tokens) == 2 and tokens[0] == PUBLIC_VARIABLE_SERVER:
             if not isinstance(tokens[1], String) or tokens[1].value.startswith('_'):
                 raise SQFParserError(statement.position, 'Interpretation of "%s" failed' % statement)
 
@@ -106,7 +129,7 @@ class Interpreter(BaseInterpreter):
             scope = self.get_scope(var_name, 'missionNamespace')
             self.simulation.broadcast(var_name, scope[var_name], -1)  # -1 => to server
 
-        elif len(tokens) == 2 and tokens[0] == Keyword('private'):
+        elif len(tokens) == 2 and tokens[0] == PRIVATE:
             if isinstance(values[1], String):
                 self.add_privates([values[1]])
             elif isinstance(values[1], Array):
@@ -116,18 +139,16 @@ class Interpreter(BaseInterpreter):
                 self.add_privates([String('"' + var.name + '"')])
                 outcome = PrivateType(var)
         # binary operators
-        elif len(tokens) == 3 and tokens[1] in (Keyword('='), Keyword('publicVariableClient')):
+        elif len(tokens) == 3 and tokens[1] in (ASSIGN, PUBLIC_VARIABLE_CLIENT):
             # it is a binary statement: token, operation, token
             lhs = tokens[0]
-            lhs_v = values[0]
-            lhs_t = types[0]
+            lhs_t = type(values[0])
 
             op = tokens[1]
             rhs = tokens[2]
             rhs_v = values[2]
-            rhs_t = types[2]
 
-            if op == Keyword('='):
+            if op == ASSIGN:
                 if isinstance(lhs, PrivateType):
                     lhs = lhs.variable
                 else:
@@ -139,7 +160,7 @@ class Interpreter(BaseInterpreter):
                 scope = self.get_scope(lhs.name)
                 scope[lhs.name] = rhs_v
                 outcome = rhs
-            elif op == Keyword('publicVariableClient'):
+            elif op == PUBLIC_VARIABLE_CLIENT:
                 if not lhs_t == Number or rhs.value.startswith('_'):
                     raise SQFParserError(statement.position, 'Interpretation of "%s" failed' % statement)
                 client_id = lhs.value
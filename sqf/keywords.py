@@ -1,6 +1,5 @@
 from sqf.types import Keyword
-from sqf.expressions import BinaryExpression, UnaryExpression
-from sqf.database import EXPRESSIONS
+from sqf.database import SIGNATURES
 
 # keywords that are not commands, but part of the language
 KEYWORDS = {'=', '\\'}
@@ -16,18 +15,19 @@ NULARY_OPERATORS = set()
 UNARY_OPERATORS = set()
 BINARY_OPERATORS = set()
 
-for expression in EXPRESSIONS:
-    if isinstance(expression, BinaryExpression):
-        op = expression.types_or_values[1]
-        BINARY_OPERATORS.add(op.value.lower())
-    elif isinstance(expression, UnaryExpression):
-        op = expression.types_or_values[0]
-        UNARY_OPERATORS.add(op.value.lower())
+# from the signatures, so the expressions of the database are not built
+for signature in SIGNATURES:
+    if len(signature) == 4:
+        op = signature[1]
+        BINARY_OPERATORS.add(op.lower())
+    elif len(signature) == 3:
+        op = signature[0]
+        UNARY_OPERATORS.add(op.lower())
     else:
-        op = expression.types_or_values[0]
-        NULARY_OPERATORS.add(op)
+        op = signature[0]
+        NULARY_OPERATORS.add(Keyword(op))
 
-    KEYWORDS.add(op.value.lower())
+    KEYWORDS.add(op.lower())
 
 
 OP_ARITHMETIC = [Keyword(s) for s in ('+', '-', '*', '/', '%', 'mod', '^', 'max', 'floor')]
@@ -1,23 +1,54 @@
+import bisect
+
+
 class Scope:
     """
     A scope is a dictionary that stores variables. Its level is controlled by a namespace
     and has no function to the scope itself.
     The values are case insensitive because SQF variables are case-insensitive.
+
+    A scope shares its values with its snapshots (see `snapshot`) until one of them
+    is modified, which then copies them (copy-on-write).
+
+    A scope of a namespace adds the names it defines to the index of the namespace (see `Namespace.get_scope`).
     """
     def __init__(self, level, values=None):
         if values is None:
             values = {}
-        self.values = {self.normalize(key): values[key] for key in values}
+        self._values = {self.normalize(key): values[key] for key in values}
+        self._shared = False
+        self._index = None
         self.level = level
 
+    @property
+    def values(self):
+        return self._values
+
     def __contains__(self, name):
-        return self.normalize(name) in self.values
+        return self.normalize(name) in self._values
 
     def __getitem__(self, name):
-        return self.values[self.normalize(name)]
+        return self._values[self.normalize(name)]
 
     def __setitem__(self, name, value):
-        self.values[self.normalize(name)] = value
+        name = self.normalize(name)
+        if self._shared:
+            self._values = dict(self._values)
+            self._shared = False
+        if self._index is not None and name not in self._values:
+            bisect.insort(self._index.setdefault(name, []), self.level)
+        self._values[name] = value
+
+    def snapshot(self):
+        """
+        Returns a copy of this scope, in O(1). The values themselves are not copied.
+        """
+        scope = Scope.__new__(Scope)
+        scope._values = self._values
+        scope._index = None
+        scope.level = self.level
+        scope._shared = self._shared = True
+        return scope
 
     @staticmethod
     def normalize(name):
@@ -25,8 +56,16 @@ class Scope:
 
 
 class Namespace:
+    """
+    A stack of scopes, where the scope at the bottom stores the global variables and the other scopes
+    the local variables.
+
+    The levels of the scopes that define each local name are indexed, so the scope of a variable is
+    found without searching the stack. The index of a snapshot is only built when it is first used.
+    """
     def __init__(self, name, all_vars=None):
         self._stack = [Scope(0, all_vars)]
+        self._index = {}  # normalized name -> levels of the scopes (other than the base) that define it
         self.name = name
 
     def __repr__(self):
@@ -47,17 +86,51 @@ class Namespace:
         return self._stack[0]
 
     def get_scope(self, name):
+        return self.get_normalized_scope(Scope.normalize(name))
+
+    def get_normalized_scope(self, name):
+        """
+        Returns the scope of a normalized name (see `Scope.normalize`): the innermost scope that defines it
+        when it is local, or the base scope.
+        """
         if name.startswith('_'):
-            for i in reversed(range(1, len(self._stack))):
-                scope = self._stack[i]
-                if name in scope:
-                    return scope
-            return self._stack[0]
-        else:
-            return self._stack[0]
+            if self._index is None:
+                self._index = {}
+                for scope in self._stack[1:]:
+                    self._add_to_index(scope)
+            levels = self._index.get(name)
+            if levels:
+                return self._stack[levels[-1]]
+        return self._stack[0]
+
+    def _add_to_index(self, scope):
+        # the scope is the innermost scope, so its level is the highest of the levels of its names
+        for name in scope.values:
+            self._index.setdefault(name, []).append(scope.level)
+        scope._index = self._index
+
+    def snapshot(self):
+        """
+        Returns a copy of this namespace whose scopes are snapshots of the scopes of this namespace.
+        """
+        namespace = Namespace.__new__(Namespace)
+        namespace._stack = [scope.snapshot() for scope in self._stack]
+        namespace._index = None
+        namespace.name = self.name
+        return namespace
 
     def add_scope(self, values=None):
-        self._stack.append(Scope(len(self._stack), values))
+        scope = Scope(len(self._stack), values)
+        if self._index is not None:
+            self._add_to_index(scope)
+        self._stack.append(scope)
 
     def del_scope(self):
-        del self._stack[-1]
+        scope = self._stack.pop()
+        if scope._index is not None:
+            for name in scope.values:
+                levels = self._index[name]
+                levels.pop()
+                if not levels:
+                    del self._index[name]
+            scope._index = None
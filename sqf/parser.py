@@ -1,8 +1,10 @@
+from bisect import bisect_right
 from collections import defaultdict
+from functools import partial
 import re
 
 import sqf.base_type
-from sqf.base_tokenizer import tokenize
+from sqf.base_tokenizer import scan
 
 from sqf.exceptions import SQFParenthesisError, SQFParserError
 from sqf.types import Statement, Code, Number, Boolean, Variable, Array, String, Keyword, Namespace, Preprocessor, ParserType
@@ -10,10 +12,14 @@ from sqf.keywords import KEYWORDS, NAMESPACES, PREPROCESSORS
 from sqf.parser_types import Comment, Space, Tab, EndOfLine, BrokenEndOfLine, EndOfFile, ParserKeyword
 from sqf.interpreter_types import DefineStatement, DefineResult, IfDefStatement, IfDefResult
 from sqf.parser_exp import parse_exp
+from sqf import parser_flat
 
 
 def rindex(the_list, value):
-    return len(the_list) - the_list[::-1].index(value) - 1
+    for i in reversed(range(len(the_list))):
+        if the_list[i] == value:
+            return i
+    raise ValueError('%s is not in list' % value)
 
 
 _LEVELS = {'[]': 0, '()': 0, '{}': 0, '#include': 0, '#define': 0, 'ifdef': 0, 'ifdef_open_close': 0}
@@ -26,15 +32,77 @@ STOP_KEYWORDS = {
 
 OPEN_PARENTHESIS = (ParserKeyword('['), ParserKeyword('('), ParserKeyword('{'))
 CLOSE_PARENTHESIS = (ParserKeyword(']'), ParserKeyword(')'), ParserKeyword('}'))
+OPEN_SQUARE, OPEN_ROUND, OPEN_CURLY = OPEN_PARENTHESIS
+CLOSE_SQUARE, CLOSE_ROUND, CLOSE_CURLY = CLOSE_PARENTHESIS
+COMMA = ParserKeyword(',')
+
+# the preprocessor tokens used by the parser, so they are not created on every comparison
+DEFINE = Preprocessor('#define')
+INCLUDE = Preprocessor('#include')
+IFDEF = Preprocessor('#ifdef')
+IFNDEF = Preprocessor('#ifndef')
+ELSE = Preprocessor('#else')
+ENDIF = Preprocessor('#endif')
 
 
 def get_coord(tokens):
     return sqf.base_type.get_coord(''.join([str(x) for x in tokens]))
 
 
-def add_coords(coord1, tokens):
-    coord2 = get_coord(tokens)
-    return coord1[0] + coord2[0], coord1[1] + coord2[1] - 1
+def get_position(all_tokens, i):
+    """
+    Returns the coordinate where `all_tokens[i]` starts (or where `all_tokens` ends when `i == len(all_tokens)`).
+    Uses the positions set by `lex`, so it is O(1) for tokens of the script. Tokens created during parsing
+    (e.g. replacements of #define) are positioned after the closest previous token with a position.
+    """
+    j = min(i, len(all_tokens))
+    while j > 0 and (j == len(all_tokens) or all_tokens[j].undefined_position):
+        j -= 1
+    if j < len(all_tokens) and not all_tokens[j].undefined_position:
+        position = all_tokens[j].position
+    else:
+        position = (1, 1)
+    for token in all_tokens[j:i]:
+        position = sqf.base_type.advance(position, str(token))
+    return position
+
+
+# the BaseType of tokens that can be identified by their exact string
+_EXACT_FACTORIES = {
+    ' ': Space,
+    '\t': Tab,
+    '\\\n': BrokenEndOfLine,
+    'true': partial(Boolean, True),
+    'false': partial(Boolean, False),
+}
+_EXACT_FACTORIES.update({token: partial(ParserKeyword, token) for token in ('(', ')', '[', ']', '{', '}', ',', ';')})
+_EXACT_FACTORIES.update({token: partial(EndOfLine, token) for token in ('\n', '\r\n')})
+_EXACT_FACTORIES.update({token: partial(Preprocessor, token) for token in PREPROCESSORS})
+
+# the BaseType of tokens that can be identified by their lower-cased string
+_LOWER_CLASSES = {token: Keyword for token in KEYWORDS}
+_LOWER_CLASSES.update({token: Namespace for token in NAMESPACES})
+
+# the literals that `int` and `float` accept
+_DIGITS = r'\d(?:_?\d)*'
+_INT = re.compile(r'\s*[-+]?%s\s*' % _DIGITS)
+_FLOAT = re.compile(r'\s*[-+]?(?:(?:{0}(?:\.(?:{0})?)?|\.{0})(?:[eE][-+]?{0})?|inf|infinity|nan)\s*'.format(_DIGITS),
+                    re.IGNORECASE)
+
+
+def _token_factory(token):
+    """
+    Returns a callable that converts the string `token` from tokenize to its BaseType.
+    """
+    try:
+        return _EXACT_FACTORIES[token]
+    except KeyError:
+        pass
+    if _INT.fullmatch(token):
+        return partial(Number, int(token))
+    if _FLOAT.fullmatch(token):
+        return partial(Number, float(token))
+    return partial(_LOWER_CLASSES.get(token.lower(), Variable), token)
 
 
 def identify_token(token):
@@ -43,118 +111,203 @@ def identify_token(token):
     """
     if isinstance(token, (Comment, String)):
         return token
-    if token == ' ':
-        return Space()
-    if token == '\t':
-        return Tab()
-    if token == '\\\n':
-        return BrokenEndOfLine()
-    if token in ('(', ')', '[', ']', '{', '}', ',', ';'):
-        return ParserKeyword(token)
-    if token in ('\n', '\r\n'):
-        return EndOfLine(token)
-    if token in ('true', 'false'):
-        return Boolean(token == 'true')
-    try:
-        return Number(int(token))
-    except ValueError:
-        pass
-    try:
-        return Number(float(token))
-    except ValueError:
-        pass
-    if token in PREPROCESSORS:
-        return Preprocessor(token)
-    if token.lower() in NAMESPACES:
-        return Namespace(token)
-    elif token.lower() in KEYWORDS:
-        return Keyword(token)
-    else:
-        return Variable(token)
+    return _token_factory(token)()
 
 
-def replace_in_expression(expression, args, arg_indexes, all_tokens):
+def lex(script):
     """
-    Recursively replaces matches of `args` in expression (a list of Types).
+    Converts a script into a list of BaseTypes with their positions set, reading the script
+    only once. Equivalent to `identify_token` over `parse_strings_and_comments(tokenize(script))`.
     """
-    replacing_expression = []
+    tokens = []
+    line = 1
+    line_start = 0  # the offset of the first character of the current line
+    start = 0  # the offset of the current token
+    factories = {}  # token -> _token_factory(token), as tokens repeat a lot within a script
+    for string in scan(script):
+        if string[0] in ('"', "'"):
+            if len(string) == 1:
+                raise SQFParserError((line, start - line_start + 1), 'String is not closed')
+            token = String(string)
+        elif string.startswith(('//', '/*')):
+            token = Comment(string)
+        else:
+            try:
+                token = factories[string]()
+            except KeyError:
+                factory = factories[string] = _token_factory(string)
+                token = factory()
+        token._line = line
+        token._column = start - line_start + 1
+        tokens.append(token)
+
+        if '\n' in string:
+            line += string.count('\n')
+            line_start = start + string.rindex('\n') + 1
+        start += len(string)
+    return tokens
+
+
+def _make_template(expression, args):
+    """
+    Returns `expression` (a list of Types) where each token that matches an argument in `args` is
+    replaced by the index of the argument, and each Statement by a tuple (template, ending, parenthesis).
+    """
+    template = []
     for token in expression:
         if isinstance(token, Statement):
-            new_expression = replace_in_expression(token.content, args, arg_indexes, all_tokens)
-            token = Statement(new_expression, ending=token.ending, parenthesis=token.parenthesis)
-            replacing_expression.append(token)
+            template.append((_make_template(token.content, args), token.ending, token.parenthesis))
         else:
-            for arg, arg_index in zip(args, arg_indexes):
-                if str(token) == arg:
-                    replacing_expression.append(all_tokens[arg_index])
-                    break
-            else:
-                replacing_expression.append(token)
-    return replacing_expression
+            string = str(token)
+            template.append(args.index(string) if string in args else token)
+    return template
+
+
+def _expand_template(template, arguments):
+    """
+    Returns the expression of a template (see `_make_template`) with its arguments replaced by `arguments`.
+    """
+    expression = []
+    for item in template:
+        if type(item) == int:
+            expression.append(arguments[item])
+        elif type(item) == tuple:
+            content, ending, parenthesis = item
+            expression.append(Statement(_expand_template(content, arguments), ending=ending, parenthesis=parenthesis))
+        else:
+            expression.append(item)
+    return expression
+
+
+class _Defines(defaultdict):
+    """
+    The #define of a script, by name and number of arguments, with a cache of the template
+    of their expression, so each #define is only analyzed once regardless of how often it is used.
+    """
+    def __init__(self):
+        super().__init__(dict)
+        self._templates = {}  # id(define_statement) -> (define_statement, template)
+
+    def template(self, define_statement):
+        try:
+            return self._templates[id(define_statement)][1]
+        except KeyError:
+            template = _make_template(define_statement.expression, define_statement.args)
+            self._templates[id(define_statement)] = define_statement, template
+            return template
+
+
+class _SplicedTokens:
+    """
+    The tokens `all_tokens[:start] + replacement + all_tokens[end:]`, where `all_tokens` is a list or
+    another `_SplicedTokens`, without copying `all_tokens`. It is used to parse the expansion of a #define
+    in the place of the tokens it replaces, so each expansion does not cost a copy of the whole script.
+    """
+    def __init__(self, all_tokens, start, replacement, end):
+        self._segments = []  # a list of (tokens, first, last) whose tokens[first:last] are concatenated
+        self._ends = []  # the index after each segment
+        for segment in _segments(all_tokens, 0, start) + [(replacement, 0, len(replacement))] + \
+                _segments(all_tokens, end, len(all_tokens)):
+            if segment[1] < segment[2]:
+                self._segments.append(segment)
+                self._ends.append((self._ends[-1] if self._ends else 0) + segment[2] - segment[1])
+
+    def __len__(self):
+        return self._ends[-1] if self._ends else 0
+
+    def _slice_segments(self, start, end):
+        segments = []
+        segment_start = 0
+        for (tokens, first, last), segment_end in zip(self._segments, self._ends):
+            if start < segment_end and segment_start < end:
+                segments.append((tokens, first + max(start - segment_start, 0),
+                                 first + min(end, segment_end) - segment_start))
+            segment_start = segment_end
+        return segments
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, end, step = index.indices(len(self))
+            assert (step == 1)
+            result = []
+            for tokens, first, last in self._slice_segments(start, end):
+                result += tokens[first:last]
+            return result
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('token index out of range')
+        i = bisect_right(self._ends, index)
+        tokens, first, _ = self._segments[i]
+        return tokens[first + index - (self._ends[i - 1] if i else 0)]
+
+
+def _segments(all_tokens, start, end):
+    if isinstance(all_tokens, _SplicedTokens):
+        return all_tokens._slice_segments(start, end)
+    return [(all_tokens, start, end)]
 
 
 def parse_strings_and_comments(all_tokens):
     """
     Function that parses the strings of a script, transforming them into `String`.
     """
-    string = ''  # the buffer for the activated mode
+    parts = []  # the tokens of the activated mode, joined when it ends
     tokens = []  # the final result
     in_double = False
     mode = None  # [None, "string_single", "string_double", "comment_line", "comment_bulk"]
 
     for i, token in enumerate(all_tokens):
         if mode == "string_double":
-            string += token
+            parts.append(token)
             if token == '"':
                 if in_double:
                     in_double = False
                 elif not in_double and i != len(all_tokens) - 1 and all_tokens[i+1] == '"':
                     in_double = True
                 else:
-                    tokens.append(String(string))
+                    tokens.append(String(''.join(parts)))
                     mode = None
                     in_double = False
         elif mode == "string_single":
-            string += token
+            parts.append(token)
             if token == "'":
                 if in_double:
                     in_double = False
                 elif not in_double and i != len(all_tokens) - 1 and all_tokens[i + 1] == "'":
                     in_double = True
                 else:
-                    tokens.append(String(string))
+                    tokens.append(String(''.join(parts)))
                     mode = None
                     in_double = False
         elif mode == "comment_bulk":
-            string += token
+            parts.append(token)
             if token == '*/':
                 mode = None
-                tokens.append(Comment(string))
-                string = ''
+                tokens.append(Comment(''.join(parts)))
         elif mode == "comment_line":
-            string += token
+            parts.append(token)
             if token in ('\n', '\r\n'):
                 mode = None
-                tokens.append(Comment(string))
-                string = ''
+                tokens.append(Comment(''.join(parts)))
         else:  # mode is None
             if token == '"':
-                string = token
+                parts = [token]
                 mode = "string_double"
             elif token == "'":
-                string = token
+                parts = [token]
                 mode = "string_single"
             elif token == '/*':
-                string = token
+                parts = [token]
                 mode = "comment_bulk"
             elif token == '//':
-                string = token
+                parts = [token]
                 mode = "comment_line"
             else:
                 tokens.append(token)
 
     if mode in ("comment_line", "comment_bulk"):
-        tokens.append(Comment(string))
+        tokens.append(Comment(''.join(parts)))
     elif mode is not None:
         raise SQFParserError(get_coord(tokens), 'String is not closed')
 
@@ -180,15 +333,15 @@ def _analyze_tokens(tokens):
     return statement
 
 
-def _analyze_array(tokens, analyze_tokens, tokens_until):
+def _analyze_array(tokens, analyze_tokens, position):
     result = []
     part = []
     first_comma_found = False
     for token in tokens:
-        if token == ParserKeyword(','):
+        if token == COMMA:
             first_comma_found = True
             if not part:
-                raise SQFParserError(get_coord(tokens_until), 'Array cannot have an empty element')
+                raise SQFParserError(position, 'Array cannot have an empty element')
             result.append(analyze_tokens(part))
             part = []
         else:
@@ -196,19 +349,19 @@ def _analyze_array(tokens, analyze_tokens, tokens_until):
 
     # an empty array is a valid array
     if part == [] and first_comma_found:
-        raise SQFParserError(get_coord(tokens_until), 'Array cannot have an empty element')
+        raise SQFParserError(position, 'Array cannot have an empty element')
     elif tokens:
         result.append(analyze_tokens(part))
     return result
 
 
 def _analyze_define(tokens):
-    assert(tokens[0] == Preprocessor('#define'))
+    assert(tokens[0] == DEFINE)
 
     valid_indexes = [i for i in range(len(tokens)) if not isinstance(tokens[i], ParserType)]
 
     if len(valid_indexes) < 2:
-        raise SQFParserError(get_coord(str(tokens[0])), '#define needs at least one argument')
+        raise SQFParserError(get_position(tokens, 0), '#define needs at least one argument')
     variable = str(tokens[valid_indexes[1]])
     if len(valid_indexes) == 2:
         return DefineStatement(tokens, variable)
@@ -260,7 +413,7 @@ def find_match_if_def(all_tokens, i, defines, token):
     return found, define_statement, arg_indexes
 
 
-def get_ifdef_variable(tokens, ifdef_i, coord_until_here):
+def get_ifdef_variable(tokens, ifdef_i):
     variable = None
     eol_i = None
     for i, token in enumerate(tokens[ifdef_i:]):
@@ -271,35 +424,34 @@ def get_ifdef_variable(tokens, ifdef_i, coord_until_here):
             variable = str(token)
     if variable is not None and eol_i is not None:
         return variable, eol_i
-    raise SQFParserError(add_coords(coord_until_here, tokens[:ifdef_i]), '#ifdef statement must contain a variable')
+    raise SQFParserError(get_position(tokens, ifdef_i), '#ifdef statement must contain a variable')
 
 
-def parse_ifdef_block(expression, defines, coord_until_here):
+def parse_ifdef_block(expression, defines):
     """
     Given a IfDefStatement and the defines, converts the statement.tokens into
     a list of tokens that can be analyzed after processing the #ifdef statement.
-    `position_until_here` used to compute position of errors
     """
     assert(isinstance(expression, IfDefStatement))
     tokens = expression.tokens
     try:
-        ifdef_i = rindex(tokens, Preprocessor('#ifdef'))
+        ifdef_i = rindex(tokens, IFDEF)
         is_ifdef = True
     except ValueError:
-        ifdef_i = rindex(tokens, Preprocessor('#ifndef'))
+        ifdef_i = rindex(tokens, IFNDEF)
         is_ifdef = False
     try:
-        else_i = rindex(tokens, Preprocessor('#else'))
+        else_i = rindex(tokens, ELSE)
     except ValueError:
         else_i = None
-    endif_i = rindex(tokens, Preprocessor('#endif'))
+    endif_i = rindex(tokens, ENDIF)
     try:
         # if there is an if_def statement before #endif, the remaining tokens are transferred to it
         nested_if_def = next(i for i, x in enumerate(tokens) if type(x) == IfDefStatement and i < endif_i)
     except StopIteration:
         nested_if_def = None
 
-    variable, eol_i = get_ifdef_variable(tokens, ifdef_i, coord_until_here)
+    variable, eol_i = get_ifdef_variable(tokens, ifdef_i)
 
     is_def = (variable in defines)
 
@@ -325,7 +477,9 @@ def parse_ifdef_block(expression, defines, coord_until_here):
         replacing_expression.append(next_if_def)
         remaining_tokens = tokens[if_def_i + 1:]
         next_if_def.tokens.extend(remaining_tokens)
+        next_if_def._changed()
         expression._tokens = tokens[:if_def_i + 1]
+        expression._changed()
     except StopIteration:
         replacing_expression += tokens[endif_i + 1:]
 
@@ -333,13 +487,13 @@ def parse_ifdef_block(expression, defines, coord_until_here):
 
 
 def is_finish_ifdef_condition(tokens, lvls):
-    return lvls['ifdef'] == sum(1 for token in tokens if token == Preprocessor('#endif')) > 0 and \
-        lvls['ifdef_open_close'] == 0
+    return lvls['ifdef'] > 0 and lvls['ifdef_open_close'] == 0 and \
+        lvls['ifdef'] == sum(1 for token in tokens if token == ENDIF)
 
 
 def is_finish_ifdef_parenthesis(token, lvls):
-    for lvl_type in ('()', '[]', '{}'):
-        if lvls[lvl_type] != 0 and token == ParserKeyword(lvl_type[1]):
+    for lvl_type, close in (('()', CLOSE_ROUND), ('[]', CLOSE_SQUARE), ('{}', CLOSE_CURLY)):
+        if lvls[lvl_type] != 0 and token == close:
             return True
     return False
 
@@ -355,10 +509,37 @@ def is_end_statement(token, stop_statement):
 
 
 def parse_block(all_tokens, analyze_tokens, start=0, initial_lvls=None, stop_statement='both', defines=None):
+    """
+    Parses `all_tokens` from `start` until the end of the block and returns the parsed expression and
+    the number of tokens it took. Each nested block (parenthesis, #define, #ifdef, etc.) is a
+    `_parse_block` generator that yields the arguments of the block it needs and receives its result,
+    so the blocks are parsed with an explicit stack and the nesting of a script is not limited by
+    Python's recursion limit.
+    """
+    stack = [_parse_block(all_tokens, analyze_tokens, start, initial_lvls, stop_statement, defines)]
+    result = None
+    while True:
+        try:
+            arguments = stack[-1].send(result)
+        except StopIteration as finished:
+            stack.pop()
+            if not stack:
+                return finished.value
+            result = finished.value
+        else:
+            stack.append(_parse_block(*arguments))
+            result = None
+
+
+def _parse_block(all_tokens, analyze_tokens, start, initial_lvls, stop_statement, defines, stop_after=None):
+    """
+    See `parse_block`. When `stop_after` is not None, the block is the expansion of a #define, and
+    it ends with the first statement that ends at or after the index `stop_after` (the end of the expansion).
+    """
     if not initial_lvls:
         initial_lvls = _LEVELS
     if defines is None:
-        defines = defaultdict(dict)
+        defines = _Defines()
     lvls = initial_lvls.copy()
 
     statements = []
@@ -375,20 +556,18 @@ def parse_block(all_tokens, analyze_tokens, start=0, initial_lvls=None, stop_sta
             lvls['ifdef_open_close'] += 1
 
         stop = False
-        if token in (Preprocessor('#ifdef'), Preprocessor('#ifndef')):
+        if token in (IFDEF, IFNDEF):
             stop = True
             lvls['ifdef'] += 1
-            expression, size = parse_block(all_tokens, _analyze_simple, i + 1, lvls, stop_statement,
-                                           defines=defines)
+            expression, size = (yield (all_tokens, _analyze_simple, i + 1, lvls, stop_statement, defines))
             lvls['ifdef'] -= 1
             if lvls['ifdef'] == 0:
                 assert (isinstance(expression, IfDefStatement))
-                replacing_expression = parse_ifdef_block(expression, defines, get_coord(all_tokens[:i - 1]))
+                replacing_expression = parse_ifdef_block(expression, defines)
 
                 new_all_tokens = sqf.base_type.get_all_tokens(tokens + replacing_expression)
 
-                result, _ = parse_block(new_all_tokens, analyze_tokens, 0, None, stop_statement,
-                                        defines=defines)
+                result, _ = (yield (new_all_tokens, analyze_tokens, 0, None, stop_statement, defines))
 
                 expression.prepend(tokens)
 
@@ -406,9 +585,9 @@ def parse_block(all_tokens, analyze_tokens, start=0, initial_lvls=None, stop_sta
         elif is_finish_ifdef_condition(tokens, lvls) and (
                     is_end_statement(token, stop_statement) or
                     is_finish_ifdef_parenthesis(token, lvls)
-                ) or lvls['ifdef'] > 1 and token == Preprocessor('#endif'):
+                ) or lvls['ifdef'] > 1 and token == ENDIF:
 
-            if token != EndOfFile() and token not in CLOSE_PARENTHESIS:
+            if type(token) != EndOfFile and token not in CLOSE_PARENTHESIS:
                 tokens.append(token)
 
             if_def = finish_ifdef(tokens, all_tokens, start, statements)
@@ -438,23 +617,23 @@ def parse_block(all_tokens, analyze_tokens, start=0, initial_lvls=None, stop_sta
                 replaced_expression = all_tokens[i:i + extra_tokens_to_move]
 
                 # the `all_tokens` after replacement
-                replacing_expression = replace_in_expression(define_statement.expression, define_statement.args,
-                                                             arg_indexes, all_tokens)
-
-                new_all_tokens = all_tokens[:i - len(tokens)] + tokens + replacing_expression + all_tokens[
-                                                                                                i + extra_tokens_to_move:]
+                replacing_expression = _expand_template(defines.template(define_statement),
+                                                        [all_tokens[arg_index] for arg_index in arg_indexes])
 
                 new_start = i - len(tokens)
 
-                expression, size = parse_block(new_all_tokens, analyze_tokens, new_start, lvls,
-                                               stop_statement, defines=defines)
+                new_all_tokens = _SplicedTokens(all_tokens, new_start, tokens + replacing_expression,
+                                                i + extra_tokens_to_move)
+
+                expression, size = (yield (new_all_tokens, analyze_tokens, new_start, lvls, stop_statement, defines,
+                                           new_start + len(tokens) + len(replacing_expression)))
 
                 # the all_tokens of the statement before replacement
                 original_tokens_taken = len(replaced_expression) - len(replacing_expression) + size
 
                 original_tokens = all_tokens[i - len(tokens):i - len(tokens) + original_tokens_taken]
 
-                if isinstance(expression, Statement):
+                if isinstance(expression, Statement) and len(expression.content) == 1:
                     expression = expression.content[0]
 
                 if type(original_tokens[-1]) in (EndOfLine, Comment, EndOfFile):
@@ -469,48 +648,49 @@ def parse_block(all_tokens, analyze_tokens, start=0, initial_lvls=None, stop_sta
                 tokens = []
         if stop:
             pass
-        elif token == ParserKeyword('['):
+        elif token == OPEN_SQUARE:
             lvls['[]'] += 1
-            expression, size = parse_block(all_tokens, analyze_tokens, i + 1, lvls, stop_statement='single', defines=defines)
+            expression, size = (yield (all_tokens, analyze_tokens, i + 1, lvls, 'single', defines))
             lvls['[]'] -= 1
             tokens.append(expression)
             i += size + 1
-        elif token == ParserKeyword('('):
+        elif token == OPEN_ROUND:
             lvls['()'] += 1
-            expression, size = parse_block(all_tokens, analyze_tokens, i + 1, lvls, stop_statement, defines=defines)
+            expression, size = (yield (all_tokens, analyze_tokens, i + 1, lvls, stop_statement, defines))
             lvls['()'] -= 1
             tokens.append(expression)
             i += size + 1
-        elif token == ParserKeyword('{'):
+        elif token == OPEN_CURLY:
             lvls['{}'] += 1
-            expression, size = parse_block(all_tokens, analyze_tokens, i + 1, lvls, stop_statement, defines=defines)
+            expression, size = (yield (all_tokens, analyze_tokens, i + 1, lvls, stop_statement, defines))
             lvls['{}'] -= 1
             tokens.append(expression)
             i += size + 1
 
-        elif token == ParserKeyword(']'):
+        elif token == CLOSE_SQUARE:
             if lvls['[]'] == 0:
-                raise SQFParenthesisError(get_coord(all_tokens[:i]), 'Trying to close right parenthesis without them opened.')
+                raise SQFParenthesisError(get_position(all_tokens, i), 'Trying to close right parenthesis without them opened.')
 
             if statements:
                 if isinstance(statements[0], DefineResult):
-                    statements[0]._tokens = [Array(_analyze_array(statements[0]._tokens, analyze_tokens, all_tokens[:i]))]
+                    statements[0]._tokens = [Array(_analyze_array(statements[0]._tokens, analyze_tokens, get_position(all_tokens, i)))]
+                    statements[0]._changed()
                     return statements[0], i - start
                 else:
-                    raise SQFParserError(get_coord(all_tokens[:i]), 'A statement %s cannot be in an array' % Statement(statements))
+                    raise SQFParserError(get_position(all_tokens, i), 'A statement %s cannot be in an array' % Statement(statements))
 
-            return Array(_analyze_array(tokens, analyze_tokens, all_tokens[:i])), i - start
-        elif token == ParserKeyword(')'):
+            return Array(_analyze_array(tokens, analyze_tokens, get_position(all_tokens, i))), i - start
+        elif token == CLOSE_ROUND:
             if lvls['()'] == 0:
-                raise SQFParenthesisError(get_coord(all_tokens[:i]), 'Trying to close parenthesis without opened parenthesis.')
+                raise SQFParenthesisError(get_position(all_tokens, i), 'Trying to close parenthesis without opened parenthesis.')
 
             if tokens:
                 statements.append(analyze_tokens(tokens))
 
             return Statement(statements, parenthesis=True), i - start
-        elif token == ParserKeyword('}'):
+        elif token == CLOSE_CURLY:
             if lvls['{}'] == 0:
-                raise SQFParenthesisError(get_coord(all_tokens[:i]), 'Trying to close brackets without opened brackets.')
+                raise SQFParenthesisError(get_position(all_tokens, i), 'Trying to close brackets without opened brackets.')
 
             if tokens:
                 statements.append(analyze_tokens(tokens))
@@ -524,7 +704,9 @@ def parse_block(all_tokens, analyze_tokens, start=0, initial_lvls=None, stop_sta
                 statements.append(analyze_tokens(tokens))
 
             tokens = []
-        elif token in (Preprocessor('#define'), Preprocessor('#include')):
+            if stop_after is not None and i >= stop_after:
+                return Statement(statements), i - start + 1
+        elif token in (DEFINE, INCLUDE):
             # notice that `token` is ignored here. It will be picked up in the end
             if tokens:
                 # a pre-processor starts a new statement
@@ -532,14 +714,14 @@ def parse_block(all_tokens, analyze_tokens, start=0, initial_lvls=None, stop_sta
                 tokens = []
 
             lvls[token.value] += 1
-            expression, size = parse_block(all_tokens, analyze_tokens, i + 1, lvls, stop_statement, defines=defines)
+            expression, size = (yield (all_tokens, analyze_tokens, i + 1, lvls, stop_statement, defines))
             lvls[token.value] -= 1
 
             statements.append(expression)
             i += size
         elif type(token) in (EndOfLine, Comment, EndOfFile) and any(lvls[x] != 0 for x in {'#define', '#include'}):
             tokens.insert(0, all_tokens[start - 1])  # pick the token that triggered the statement
-            if tokens[0] == Preprocessor('#define'):
+            if tokens[0] == DEFINE:
                 define_statement = _analyze_define(tokens)
                 defines[define_statement.variable_name][len(define_statement.args)] = define_statement
                 statements.append(define_statement)
@@ -560,7 +742,7 @@ def parse_block(all_tokens, analyze_tokens, start=0, initial_lvls=None, stop_sta
             if lvl_type == 'ifdef':
                 message = '#ifdef statement not closed'
 
-            raise SQFParenthesisError(get_coord(all_tokens[:start - 1]), message)
+            raise SQFParenthesisError(get_position(all_tokens, start - 1), message)
 
     if tokens:
         statements.append(analyze_tokens(tokens))
@@ -569,10 +751,200 @@ def parse_block(all_tokens, analyze_tokens, start=0, initial_lvls=None, stop_sta
 
 
 def parse(script):
-    tokens = [identify_token(x) for x in parse_strings_and_comments(tokenize(script))]
+    tokens = lex(script)
 
     result = parse_block(tokens + [EndOfFile()], _analyze_tokens)[0]
 
     result.set_position((1, 1))
 
     return result
+
+
+def _ends_statement(statement):
+    """
+    Whether a top-level statement ends with `;`, so the statement after it is parsed regardless of the text before it.
+    """
+    tokens = statement.tokens
+    return bool(tokens) and type(tokens[-1]) == ParserKeyword and str(tokens[-1]) == ';'
+
+
+def reparse(result, script, new_script):
+    """
+    Returns the same as `parse(new_script)`, where `result` is `parse(script)`. The top-level statements of
+    `result` before and after the text that changed are reused, so only the statements of the changed text are
+    parsed again. A script with preprocessor directives is parsed in full, since a #define changes the
+    statements after it.
+    """
+    if '#' in script or '#' in new_script:
+        return parse(new_script)
+
+    statements = result.tokens
+    ends = []
+    end = 0
+    for statement in statements:
+        end += len(str(statement))
+        ends.append(end)
+    if end != len(script):
+        # the statements do not have the text of the script (e.g. of a statement that is not closed)
+        return parse(new_script)
+
+    # the length of the text that did not change at the start and at the end of the script
+    limit = min(len(script), len(new_script))
+    prefix = 0
+    while prefix < limit and script[prefix] == new_script[prefix]:
+        prefix += 1
+    suffix = 0
+    while suffix < limit - prefix and script[-1 - suffix] == new_script[-1 - suffix]:
+        suffix += 1
+
+    # the statements before `first` end within the text that did not change at the start
+    first = 0
+    while first < len(statements) and ends[first] <= prefix and _ends_statement(statements[first]):
+        first += 1
+    # the statements from `last` start within the text that did not change at the end, after a `;`
+    last = len(statements)
+    while last - 1 > first and ends[last - 2] >= len(script) - suffix and _ends_statement(statements[last - 2]):
+        last -= 1
+
+    start = ends[first - 1] if first else 0
+    end = len(new_script) - (len(script) - ends[last - 1]) if last < len(statements) else len(new_script)
+    try:
+        middle = parse(new_script[start:end]).tokens
+    except SQFParserError:
+        # the position of the error is the one of the whole script
+        return parse(new_script)
+    if last < len(statements) and (not middle or not _ends_statement(middle[-1])):
+        # the changed text does not end a statement, so the statements after it are parsed differently
+        return parse(new_script)
+
+    result = Statement(statements[:first] + middle + statements[last:])
+    # the positions of all tokens are set, also of the reused ones, since values of the tokens are positioned
+    # by the analyzer
+    result.set_position((1, 1))
+    return result
+
+
+def _set_container_positions(container):
+    """
+    Sets the position of `container` and of the containers within it to the position of their first token,
+    keeping the positions of the tokens. Tokens created during parsing are positioned after the previous token.
+    """
+    position = (1, 1)  # the position after the previous token
+    waiting = [container]  # the containers whose first token was not reached yet
+    stack = [iter(container.tokens)]
+    while stack:
+        for token in stack[-1]:
+            if isinstance(token, sqf.base_type.BaseTypeContainer):
+                waiting.append(token)
+                stack.append(iter(token.tokens))
+                break
+            if token.undefined_position:
+                token.position = position
+            for waiting_container in waiting:
+                waiting_container._position = token.position
+            waiting = []
+            position = sqf.base_type.advance(token.position, str(token))
+        else:
+            stack.pop()
+    for waiting_container in waiting:
+        waiting_container._position = position
+
+
+def parse_tokens(tokens):
+    """
+    Parses tokens that have their positions in a script, e.g. the tokens of `sqf.preprocessor.preprocess`.
+    Unlike `parse`, the positions are not derived from the strings of the tokens, so they remain the
+    positions in the script of the tokens of a macro or of an included file.
+    """
+    result = parse_block(list(tokens) + [EndOfFile()], _analyze_tokens)[0]
+
+    _set_container_positions(result)
+
+    return result
+
+
+_FLAT_OPEN = {'[': parser_flat.ARRAY, '(': parser_flat.PARENTHESIS, '{': parser_flat.CODE}
+_FLAT_CLOSE = {
+    ']': (parser_flat.ARRAY, 'Trying to close right parenthesis without them opened.'),
+    ')': (parser_flat.PARENTHESIS, 'Trying to close parenthesis without opened parenthesis.'),
+    '}': (parser_flat.CODE, 'Trying to close brackets without opened brackets.'),
+}
+
+
+def parse_flat(script):
+    """
+    Parses a script into a `parser_flat.FlatTree`, where tokens and the nodes of the structure
+    (statements, arrays, parenthesis, code and preprocessor directives) are arrays of integers
+    that refer to the script. Unlike `parse`, expressions are not analyzed, #define are not
+    expanded and both branches of #ifdef are kept.
+    """
+    tree = parser_flat.FlatTree(script)
+
+    kinds = {}  # token -> kind, as tokens repeat a lot within a script
+    start = 0
+    for string in scan(script):
+        if string[0] in ('"', "'"):
+            if len(string) == 1:
+                raise SQFParserError(tree.position(start), 'String is not closed')
+            kind = parser_flat.STRING
+        elif string.startswith(('//', '/*')):
+            kind = parser_flat.COMMENT
+        else:
+            kind = kinds.get(string)
+            if kind is None:
+                factory = _token_factory(string)
+                kind = kinds[string] = parser_flat.KIND_OF_CLASS[getattr(factory, 'func', factory)]
+        tree.add_token(kind, start, len(string))
+        start += len(string)
+
+    # each level of the stack is [container node, open statement node or None]
+    stack = [[tree.add_node(parser_flat.FILE, 0, -1), None]]
+    directive = None
+    for i, kind in enumerate(tree.kinds):
+        if directive is not None:
+            # a directive is everything until the end of the line; its tokens need not be balanced
+            if kind not in (parser_flat.EOL, parser_flat.COMMENT):
+                continue
+            tree.close_node(directive, i)
+            directive = None
+
+        level = stack[-1]
+        if kind == parser_flat.PREPROCESSOR:
+            if level[1] is not None:
+                tree.close_node(level[1], i)
+                level[1] = None
+            directive = tree.add_node(parser_flat.DIRECTIVE, i, level[0])
+            continue
+
+        character = script[tree.starts[i]] if kind == parser_flat.PARSER_KEYWORD else None
+        if character in _FLAT_CLOSE:
+            node_kind, message = _FLAT_CLOSE[character]
+            if len(stack) == 1 or tree.node_kinds[level[0]] != node_kind:
+                raise SQFParenthesisError(tree.token_position(i), message)
+            if level[1] is not None:
+                tree.close_node(level[1], i)
+            tree.close_node(level[0], i + 1)
+            stack.pop()
+            continue
+
+        if level[1] is None:
+            level[1] = tree.add_node(parser_flat.STATEMENT, i, level[0])
+        if character in _FLAT_OPEN:
+            stack.append([tree.add_node(_FLAT_OPEN[character], i, level[1]), None])
+        elif character is not None:  # ; or ,
+            tree.close_node(level[1], i + 1)
+            level[1] = None
+
+    if len(stack) > 1:
+        container = stack[-1][0]
+        first = tree.node_firsts[container]
+        raise SQFParenthesisError(tree.token_position(first),
+                                  'Parenthesis "%s" not closed' % tree.token_string(first))
+
+    end = len(tree.kinds)
+    if directive is not None:
+        tree.close_node(directive, end)
+    if stack[0][1] is not None:
+        tree.close_node(stack[0][1], end)
+    tree.close_node(stack[0][0], end)
+    return tree
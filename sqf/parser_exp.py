@@ -1,64 +1,86 @@
 from sqf.base_type import ParserType
 from sqf.keywords import BINARY_OPERATORS, UNARY_OPERATORS, OP_COMPARISON, PREPROCESSORS_UNARY
+from sqf.types import Keyword, Statement, Array, Code
 
 
 class EndToken:
     pass
 
 
+def _binding_powers():
+    """
+    Returns the left binding power of each operator. When an operator matches more than one rule,
+    the first rule wins.
+    """
+    rules = (
+        (('=',), 0.8),
+        (('private',), 0.9),
+        (('||', 'or'), 1),
+        (('&&', 'and'), 2),
+        ([x.value for x in OP_COMPARISON], 3),
+        (('*', '/', '%', 'mod', 'atan2'), 7),
+        (('+', 'max', 'min', '-'), 6),
+        (('else',), 5),
+        (('^',), 8),  # it is a binary, but it has higher precedence
+        (BINARY_OPERATORS, 4),
+        (('#',), 9),
+        (UNARY_OPERATORS, 10),
+    )
+    powers = {}
+    for operators, power in rules:
+        for operator in operators:
+            powers.setdefault(operator, power)
+    return powers
+
+
+# resolved once, so the parser does a single lookup per token
+BINDING_POWERS = _binding_powers()
+DEFAULT_BINDING_POWER = 0.1
+
+
 def _normalize(item):
+    if isinstance(item, Keyword):
+        return item.unique_token
+    if isinstance(item, (Array, Code)) or isinstance(item, Statement) and item.parenthesis:
+        # their string starts with a parenthesis, so they are never operators
+        return ''
     return str(item).lower()
 
 
+def _starts_with_parenthesis(token):
+    """
+    Returns whether the string of `token` starts with `(`, without building the string of containers.
+    """
+    while isinstance(token, Statement) and not token.parenthesis and token.tokens:
+        token = token.tokens[0]
+    if isinstance(token, Statement):
+        return bool(token.parenthesis)
+    if isinstance(token, (Array, Code)):
+        return False
+    return str(token)[:1] == '('
+
+
 def nud(token, parser):
     n_token = _normalize(token)
     if n_token in UNARY_OPERATORS:
         return parser.container([token, parser.expression(100)])
-    elif str(token) in PREPROCESSORS_UNARY:
+    elif isinstance(token, Keyword) and str(token) in PREPROCESSORS_UNARY:
         return parser.container([token, parser.expression(100)])
-    elif str(token) == '#define':
+    elif isinstance(token, Keyword) and str(token) == '#define':
         arg = parser.expression(100)
         args = parser.expression(100)
         func = parser.expression(100)
         return parser.container([token, arg, args, func])
-    elif str(token).isupper():
+    elif _starts_with_parenthesis(parser.next) and str(token).isupper():
         # heuristic to catch global defines with arguments
-        if str(parser.next)[0] == '(':
-            return parser.container([token, parser.expression(100)])
+        return parser.container([token, parser.expression(100)])
     return token
 
 
 def get_lbp(token):
-    n_token = _normalize(token)
-
-    if token == EndToken:
+    if token is EndToken:
         return 0
-    elif n_token == '=':
-        return 0.8
-    elif n_token == 'private':
-        return 0.9
-    elif n_token in ('||', 'or'):
-        return 1
-    elif n_token in {'&&', 'and'}:
-        return 2
-    elif n_token in set(x.value for x in OP_COMPARISON):
-        return 3
-    elif n_token in {'*', '/', '%', 'mod', 'atan2'}:
-        return 7
-    elif n_token in {'+', 'max', 'min', '-'}:
-        return 6
-    elif n_token == 'else':
-        return 5
-    elif n_token == '^':  # it is a binary, but it has higher precedence
-        return 8
-    elif n_token in BINARY_OPERATORS:
-        return 4
-    elif n_token == '#':
-        return 9
-    elif n_token in UNARY_OPERATORS:
-        return 10
-    else:
-        return 0.1
+    return BINDING_POWERS.get(_normalize(token), DEFAULT_BINDING_POWER)
 
 
 class Parser:
@@ -96,13 +118,15 @@ class Parser:
             left = self.container(cum_prefix + [left] + self.cumulator)
             self.cumulator = []
 
-        while rbp < get_lbp(self.next):
+        lbp = get_lbp(self.next)
+        while rbp < lbp:
             current = self.next
             self.next = next(self.iterator)
             if self.next is EndToken:
                 return self.container([left, current])
-            right = self.expression(get_lbp(current))
+            right = self.expression(lbp)
             left = self.container([left, current, right])
+            lbp = get_lbp(self.next)
 
         return left
 
@@ -0,0 +1,109 @@
+"""
+A compact representation of a parsed script for tools that only need positions and structure
+(e.g. linters, outlines and search). See `sqf.parser.parse_flat`.
+"""
+from array import array
+from bisect import bisect_right
+
+from sqf.types import String, Number, Boolean, Variable, Keyword, Namespace, Preprocessor
+from sqf.parser_types import Comment, Space, Tab, EndOfLine, BrokenEndOfLine, ParserKeyword
+
+
+# the kinds of tokens, in the order of `TOKEN_CLASSES`
+TOKEN_CLASSES = (Space, Tab, BrokenEndOfLine, EndOfLine, Comment, String, ParserKeyword,
+                 Number, Boolean, Preprocessor, Namespace, Keyword, Variable)
+SPACE, TAB, BROKEN_EOL, EOL, COMMENT, STRING, PARSER_KEYWORD, \
+    NUMBER, BOOLEAN, PREPROCESSOR, NAMESPACE, KEYWORD, VARIABLE = range(len(TOKEN_CLASSES))
+KIND_OF_CLASS = {cls: kind for kind, cls in enumerate(TOKEN_CLASSES)}
+
+# the kinds of nodes
+FILE, STATEMENT, ARRAY, PARENTHESIS, CODE, DIRECTIVE = range(6)
+NODE_NAMES = ('File', 'Statement', 'Array', 'Parenthesis', 'Code', 'Directive')
+
+
+class FlatTree:
+    """
+    The tokens of a script and the nodes of its structure, stored in parallel arrays of integers.
+
+    Token `i` is `script[starts[i]:starts[i] + lengths[i]]` and has kind `kinds[i]`.
+    Node `n` has kind `node_kinds[n]`, spans the tokens `node_firsts[n]` to `node_ends[n]` (exclusive)
+    and its parent is `node_parents[n]` (-1 for the file). Nodes are stored in pre-order, and the nodes
+    of the sub-tree of `n` are `n` to `node_subtree_ends[n]` (exclusive).
+    """
+    def __init__(self, script):
+        self.script = script
+
+        self.kinds = array('B')
+        self.starts = array('L')
+        self.lengths = array('L')
+
+        self.node_kinds = array('B')
+        self.node_firsts = array('L')
+        self.node_ends = array('L')
+        self.node_parents = array('l')
+        self.node_subtree_ends = array('L')
+
+        self._line_starts = array('L', [0])
+        index = script.find('\n')
+        while index != -1:
+            self._line_starts.append(index + 1)
+            index = script.find('\n', index + 1)
+
+    def __len__(self):
+        return len(self.kinds)
+
+    def add_token(self, kind, start, length):
+        self.kinds.append(kind)
+        self.starts.append(start)
+        self.lengths.append(length)
+
+    def add_node(self, kind, first, parent):
+        self.node_kinds.append(kind)
+        self.node_firsts.append(first)
+        self.node_ends.append(first)
+        self.node_parents.append(parent)
+        self.node_subtree_ends.append(0)
+        return len(self.node_kinds) - 1
+
+    def close_node(self, node, end):
+        self.node_ends[node] = end
+        self.node_subtree_ends[node] = len(self.node_kinds)
+
+    def position(self, offset):
+        """
+        The coordinate (line, column) of an offset of the script, in O(log(lines)).
+        """
+        line = bisect_right(self._line_starts, offset)
+        return line, offset - self._line_starts[line - 1] + 1
+
+    def token_string(self, i):
+        start = self.starts[i]
+        return self.script[start:start + self.lengths[i]]
+
+    def token_position(self, i):
+        return self.position(self.starts[i])
+
+    def token_class(self, i):
+        return TOKEN_CLASSES[self.kinds[i]]
+
+    def node_string(self, node):
+        first = self.node_firsts[node]
+        end = self.node_ends[node]
+        if first == end:
+            return ''
+        return self.script[self.starts[first]:self.starts[end - 1] + self.lengths[end - 1]]
+
+    def node_position(self, node):
+        first = self.node_firsts[node]
+        if first == len(self.kinds):
+            return self.position(len(self.script))
+        return self.token_position(first)
+
+    def children(self, node):
+        child = node + 1
+        while child < self.node_subtree_ends[node]:
+            yield child
+            child = self.node_subtree_ends[child]
+
+    def __repr__(self):
+        return '<FlatTree %d tokens, %d nodes>' % (len(self.kinds), len(self.node_kinds))
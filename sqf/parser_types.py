@@ -2,12 +2,17 @@ from sqf.base_type import ParserType
 
 
 class Comment(ParserType):
+    __slots__ = ('_string',)
 
     def __init__(self, string):
         super().__init__()
         assert (string.startswith('/*') or string.startswith('//'))
         self._string = string
 
+    @property
+    def _key(self):
+        return self._string,
+
     def __str__(self):
         return self._string
 
@@ -16,6 +21,8 @@ class Comment(ParserType):
 
 
 class Space(ParserType):
+    __slots__ = ()
+
     def __str__(self):
         return ' '
 
@@ -24,6 +31,8 @@ class Space(ParserType):
 
 
 class Tab(ParserType):
+    __slots__ = ()
+
     def __str__(self):
         return '\t'
 
@@ -32,11 +41,23 @@ class Tab(ParserType):
 
 
 class EndOfLine(ParserType):
+    __slots__ = ('value',)
+
     def __init__(self, value):
         super().__init__()
         assert(value in ['\n', '\r\n'])
         self.value = value
 
+    @property
+    def _key(self):
+        return self.value,
+
+    def __eq__(self, other):
+        return isinstance(other, EndOfLine) and self.value == other.value
+
+    def __hash__(self):
+        return hash(self.value)
+
     def __str__(self):
         return self.value
 
@@ -45,6 +66,8 @@ class EndOfLine(ParserType):
 
 
 class BrokenEndOfLine(ParserType):
+    __slots__ = ()
+
     def __str__(self):
         return '\\\n'
 
@@ -53,6 +76,8 @@ class BrokenEndOfLine(ParserType):
 
 
 class EndOfFile(ParserType):
+    __slots__ = ()
+
     def __str__(self):
         return ''
 
@@ -61,10 +86,23 @@ class EndOfFile(ParserType):
 
 
 class ParserKeyword(ParserType):
+    __slots__ = ('value',)
+
     def __init__(self, value):
         super().__init__()
         self.value = value
 
+    @property
+    def _key(self):
+        return self.value,
+
+    # the parser compares tokens with parser keywords all the time, so this is as cheap as possible
+    def __eq__(self, other):
+        return isinstance(other, ParserKeyword) and self.value == other.value
+
+    def __hash__(self):
+        return hash(self.value)
+
     def __str__(self):
         return self.value
 
@@ -0,0 +1,388 @@
+"""
+A preprocessor of SQF scripts, independent of the parser. It resolves `#include` against include roots,
+expands `#define` and evaluates `#ifdef`/`#ifndef`/`#else`/`#endif`, yielding the resulting tokens:
+
+    >>> from sqf.preprocessor import preprocess
+    >>> ''.join(str(token) for token in preprocess('#define A(x) x + 1\\nhint str A(2);'))
+    '\\nhint str 2 + 1;'
+
+Tokens of the script keep their position; tokens of a macro expansion have the position of the macro use
+and tokens of an included file have the position of the #include. Use `sqf.parser.parse_tokens` to parse them.
+"""
+import copy
+import hashlib
+import os
+
+from sqf.exceptions import SQFParserError
+from sqf.parser import lex
+from sqf.parser_types import Comment, EndOfLine, BrokenEndOfLine, ParserKeyword
+from sqf.base_type import ParserType
+from sqf.types import Preprocessor, String
+
+
+class Macro:
+    """
+    A #define: its name, its arguments (None when it is not used with parenthesis) and the token strings of its body.
+    """
+    def __init__(self, name, args, body):
+        self.name = name
+        self.args = args
+        self.body = body
+
+    def expand(self, arguments):
+        """
+        Returns the string of this macro with `arguments` (a list of strings) replacing its arguments,
+        including the stringizing (`#arg`) and concatenation (`a##b`) operators.
+        """
+        values = dict(zip(self.args or (), arguments))
+        strings = []
+        for string in self.body:
+            if string in values:
+                strings.append(values[string])
+            elif '#' in string and string[0] not in ('"', "'"):
+                parts = []
+                for part in string.split('##'):
+                    if part.startswith('#') and part[1:] in values:
+                        parts.append('"%s"' % values[part[1:]])
+                    else:
+                        parts.append(values.get(part, part))
+                strings.append(''.join(parts))
+            else:
+                strings.append(string)
+        return ''.join(strings)
+
+    def __repr__(self):
+        if self.args is None:
+            return '<Macro %s>' % self.name
+        return '<Macro %s(%s)>' % (self.name, ','.join(self.args))
+
+
+class HeaderCache:
+    """
+    The headers read during a run (e.g. a run of sqflint over a directory), by path, so each
+    header (e.g. a `script_component.hpp`) is read and split into lines once regardless of
+    how many scripts include it.
+    """
+    def __init__(self):
+        self._texts = {}
+        self._lines = {}
+        self._digests = {}
+
+    def __contains__(self, path):
+        return path in self._lines
+
+    def discard(self, path):
+        """
+        Discards the header `path`, so it is read again (e.g. when it changed).
+        """
+        for values in (self._texts, self._lines, self._digests):
+            values.pop(path, None)
+
+    def _text(self, path):
+        try:
+            return self._texts[path]
+        except KeyError:
+            with open(path) as f:
+                text = self._texts[path] = f.read()
+            return text
+
+    def get(self, path):
+        """
+        Returns the lines of the header `path` (see `_split_lines`). Their tokens are shared by
+        every script that includes the header, so they must not be modified.
+        """
+        try:
+            return self._lines[path]
+        except KeyError:
+            lines = self._lines[path] = _split_lines(lex(self._text(path)))
+            return lines
+
+    def digest(self, path):
+        """
+        Returns a hash of the content of the header `path` as it is read during the run,
+        or None when it cannot be read.
+        """
+        try:
+            return self._digests[path]
+        except KeyError:
+            try:
+                text = self._text(path)
+            except OSError:
+                return None
+            digest = self._digests[path] = hashlib.sha256(text.encode('utf-8', 'surrogatepass')).hexdigest()
+            return digest
+
+
+def _is_directive(tokens):
+    """
+    Whether a line (a list of tokens) is a directive, i.e. starts with a preprocessor keyword.
+    """
+    for token in tokens:
+        if not isinstance(token, ParserType):
+            return type(token) == Preprocessor
+    return False
+
+
+def _split_lines(tokens):
+    """
+    Splits `tokens` in lines, where a line is ended by an end of line (or a line comment) that is not escaped.
+    Returns a list of (is_directive, tokens).
+    """
+    lines = []
+    line = []
+    for token in tokens:
+        line.append(token)
+        if type(token) == EndOfLine or type(token) == Comment and str(token).endswith('\n'):
+            lines.append((_is_directive(line), line))
+            line = []
+    if line:
+        lines.append((_is_directive(line), line))
+    return lines
+
+
+def _arguments(tokens):
+    """
+    Returns the tokens of a directive after its preprocessor keyword that are not whitespace or comments.
+    """
+    return [token for token in tokens[1:] if not isinstance(token, ParserType) or type(token) == ParserKeyword]
+
+
+class _Run:
+    """
+    The state of the preprocessing of a script: the macros, the conditions of the open #ifdef and
+    the files being included.
+    """
+    def __init__(self, include_roots, defines, headers, included):
+        self.include_roots = include_roots
+        self.defines = defines
+        self.headers = headers
+        self.included = included
+        self.conditions = []  # a stack of [is_active, in_else] of the open #ifdef
+        self.including = []  # the files being included, to detect recursive includes
+
+    @property
+    def is_active(self):
+        return not self.conditions or self.conditions[-1][0]
+
+    def process(self, lines, path):
+        """
+        Yields the tokens of `lines` (see `_split_lines`) of the file `path` (None for a script without file).
+        Consecutive lines without directives are expanded together, since the arguments of a macro can span lines.
+        """
+        depth = len(self.conditions)
+        chunk = []
+        for is_directive, line in lines:
+            if not is_directive:
+                if self.is_active:
+                    chunk += line
+                continue
+            if chunk:
+                yield from self.expand(chunk)
+                chunk = []
+            yield from self.directive(line, path)
+        if chunk:
+            yield from self.expand(chunk)
+
+        if len(self.conditions) != depth:
+            position = lines[-1][1][-1].position if lines else (1, 1)
+            raise SQFParserError(position, '#ifdef statement not closed')
+
+    def directive(self, tokens, path):
+        start = next(i for i, token in enumerate(tokens) if type(token) == Preprocessor)
+        preprocessor = tokens[start]
+        name = str(preprocessor)
+        arguments = _arguments(tokens[start:])
+        # whether the region that contains the directive is active (for #else and #endif, the one of its #ifdef)
+        is_active = self.is_active if name not in ('#else', '#endif') else \
+            len(self.conditions) < 2 or self.conditions[-2][0]
+
+        if name in ('#ifdef', '#ifndef'):
+            if not arguments:
+                raise SQFParserError(preprocessor.position, '#ifdef statement must contain a variable')
+            is_defined = str(arguments[0]) in self.defines
+            self.conditions.append([self.is_active and is_defined == (name == '#ifdef'), False])
+        elif name in ('#else', '#endif'):
+            if not self.conditions or self.conditions[-1][1] and name == '#else':
+                raise SQFParserError(preprocessor.position, '%s without #ifdef' % name)
+            if name == '#endif':
+                self.conditions.pop()
+            else:
+                # the #else is active when the region of its #ifdef is active and the #ifdef was not
+                self.conditions[-1] = [is_active and not self.conditions[-1][0], True]
+        elif not is_active:
+            pass
+        elif name == '#define':
+            macro = self.define(tokens[start:])
+            self.defines[macro.name] = macro
+        elif name == '#undef':
+            if arguments:
+                self.defines.pop(str(arguments[0]), None)
+        elif name == '#include':
+            yield from self.include(preprocessor, arguments, path)
+
+        # the end of line of the directive (and of each line it continues) is kept, so the lines of the script
+        # are kept
+        if is_active:
+            for token in tokens:
+                if type(token) == BrokenEndOfLine:
+                    yield EndOfLine('\n')
+            if type(tokens[-1]) in (EndOfLine, Comment):
+                yield tokens[-1] if type(tokens[-1]) == EndOfLine else EndOfLine('\n')
+
+    @staticmethod
+    def define(tokens):
+        tokens = [token for token in tokens if type(token) != BrokenEndOfLine]
+        if type(tokens[-1]) in (EndOfLine, Comment):
+            del tokens[-1]
+        valid_indexes = [i for i in range(len(tokens)) if not isinstance(tokens[i], ParserType)]
+        if len(valid_indexes) < 2:
+            raise SQFParserError(tokens[0].position, '#define needs at least one argument')
+
+        name_i = valid_indexes[1]
+        args = None
+        body_i = name_i + 1
+        if body_i < len(tokens) and str(tokens[body_i]) == '(':
+            try:
+                close_i = next(i for i in range(body_i, len(tokens)) if str(tokens[i]) == ')')
+            except StopIteration:
+                raise SQFParserError(tokens[body_i].position, 'Parenthesis "(" not closed')
+            args = [x.strip() for x in ''.join(str(x) for x in tokens[body_i + 1:close_i]).split(',')]
+            body_i = close_i + 1
+
+        return Macro(str(tokens[name_i]), args, _strip([str(token) for token in tokens[body_i:]]))
+
+    def include(self, preprocessor, arguments, path):
+        if not arguments:
+            raise SQFParserError(preprocessor.position, '#include requires one argument')
+        if type(arguments[0]) == String:
+            name = arguments[0].value
+        elif str(arguments[0]) == '<' and str(arguments[-1]) == '>':
+            name = ''.join(str(x) for x in arguments[1:-1])
+        else:
+            raise SQFParserError(preprocessor.position, '#include first argument must be a string')
+
+        include_path = self.resolve(name, path)
+        if include_path is None:
+            raise SQFParserError(preprocessor.position, 'Cannot find the file "%s" to #include' % name)
+        if include_path in self.including:
+            raise SQFParserError(preprocessor.position, 'The file "%s" is included recursively' % name)
+
+        if self.included is not None and include_path not in self.included:
+            self.included.append(include_path)
+        self.including.append(include_path)
+        # the tokens of a header are shared by the scripts that include it, so copies are yielded
+        for token in self.process(self.headers.get(include_path), include_path):
+            token = copy.copy(token)
+            token.position = preprocessor.position
+            yield token
+        self.including.pop()
+
+    def resolve(self, name, path):
+        """
+        Returns the path of the file `name` of an #include, relative to the directory of `path`
+        or to one of the include roots, or None when it is not found.
+        """
+        name = name.replace('\\', os.sep).replace('/', os.sep)
+        candidates = []
+        if path is not None and not name.startswith(os.sep):
+            candidates.append(os.path.join(os.path.dirname(path), name))
+        candidates += [os.path.join(root, name.lstrip(os.sep)) for root in self.include_roots]
+        for candidate in candidates:
+            if os.path.isfile(candidate):
+                return os.path.abspath(candidate)
+        return None
+
+    def expand(self, tokens, disabled=frozenset()):
+        """
+        Yields `tokens` with their macros expanded. The expansion of a macro is expanded again,
+        except for the macros in `disabled` (the macros being expanded).
+        """
+        i = 0
+        while i < len(tokens):
+            token = tokens[i]
+            macro = self.defines.get(str(token))
+            if macro is None or macro.name in disabled or isinstance(token, (String, ParserType)):
+                yield token
+                i += 1
+                continue
+
+            arguments = []
+            end = i + 1
+            if macro.args is not None:
+                if end >= len(tokens) or str(tokens[end]) != '(':
+                    # a macro with arguments used without them is not expanded
+                    yield token
+                    i += 1
+                    continue
+                arguments, end = self.read_arguments(tokens, end, token)
+                if len(arguments) != len(macro.args):
+                    raise SQFParserError(token.position, 'Macro "%s" expects %d arguments, got %d' %
+                                         (macro.name, len(macro.args), len(arguments)))
+                # like the preprocessor of the game (and unlike C's), arguments are expanded before `#` and `##`
+                arguments = [''.join(str(x) for x in self.expand(lex(argument), disabled)) for argument in arguments]
+
+            expansion = lex(macro.expand(arguments))
+            for expanded_token in expansion:
+                expanded_token.position = token.position
+            yield from self.expand(expansion, disabled | {macro.name})
+            i = end
+
+    @staticmethod
+    def read_arguments(tokens, start, token):
+        """
+        Returns the arguments (as strings) of the macro `token` whose parenthesis starts at `start`,
+        and the index after its parenthesis.
+        """
+        arguments = []
+        argument = []
+        depth = 0
+        for i in range(start, len(tokens)):
+            string = str(tokens[i])
+            if string in ('(', '[', '{'):
+                depth += 1
+                if depth == 1:
+                    continue
+            elif string in (')', ']', '}'):
+                depth -= 1
+                if depth == 0:
+                    arguments.append(''.join(argument).strip())
+                    return arguments, i + 1
+            elif string == ',' and depth == 1:
+                arguments.append(''.join(argument).strip())
+                argument = []
+                continue
+            argument.append(string)
+        raise SQFParserError(token.position, 'The arguments of macro "%s" are not closed' % token)
+
+
+def _strip(strings):
+    """
+    Removes the whitespace at the beginning and end of a list of token strings.
+    """
+    start = 0
+    while start < len(strings) and not strings[start].strip():
+        start += 1
+    end = len(strings)
+    while end > start and not strings[end - 1].strip():
+        end -= 1
+    return strings[start:end]
+
+
+def preprocess(script, path=None, include_roots=(), defines=None, headers=None, included=None):
+    """
+    Yields the tokens of `script` after preprocessing it.
+
+    `path` is the file of `script`, used to resolve relative #include; `include_roots` are the directories
+    where #include are also searched (e.g. the root of the project for `\\x\\tag\\addons\\main\\macros.hpp`).
+    `defines` is a dictionary of `Macro` by name, updated with the #define of the script. `headers` is a
+    `HeaderCache` that should be shared by the scripts of a run, so each header is only read once.
+    `included` is a list to which the paths of the files included by the script are appended.
+    """
+    if defines is None:
+        defines = {}
+    if headers is None:
+        headers = HeaderCache()
+    run = _Run(include_roots, defines, headers, included)
+    if path is not None:
+        run.including.append(os.path.abspath(path))
+    yield from run.process(_split_lines(lex(script)), path)
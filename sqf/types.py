@@ -6,6 +6,8 @@ class Type(BaseType):
     """
     A type represents a type of variable. Every quantity that has a value is a type.
     """
+    __slots__ = ()
+
     @property
     def is_undefined(self):
         """
@@ -22,6 +24,8 @@ class ConstantValue(Type):
     """
     A constant (literal) value. For example, a number, a string, code.
     """
+    __slots__ = ('_value', '_hash')
+
     def __init__(self, value=None):
         super().__init__()
         self._value = value
@@ -30,11 +34,25 @@ class ConstantValue(Type):
     def value(self):
         return self._value
 
+    @property
+    def _key(self):
+        return self._value,
+
+    def __hash__(self):
+        # constant values do not change, so their hash is computed once
+        try:
+            return self._hash
+        except AttributeError:
+            self._hash = hash(self._key)
+            return self._hash
+
     def __str__(self):
         return self.__class__.__name__
 
 
 class Boolean(ConstantValue):
+    __slots__ = ()
+
     def __init__(self, value=None):
         assert (value in (None, True, False))
         super().__init__(value)
@@ -52,22 +70,49 @@ class Boolean(ConstantValue):
 
 
 class String(ConstantValue):
+    """
+    A string, created from its text with quotes (e.g. `"a"`). The text is stored as it is (e.g. the
+    token of the script) and the value without quotes is only created when it is first read, since the
+    values of most strings of a script (e.g. large strings of code) are never read.
+    """
+    __slots__ = ('_string',)
 
     def __init__(self, value=None):
-        self.container = None
+        self._string = value
         if value is not None:
             assert(isinstance(value, str))
             assert(value[0] == value[-1])
             assert (value[0] in ["'", '"'])
-            self.container = value[0]
-            super().__init__(value[1:-1])
-        else:
-            super().__init__(value)
+        super().__init__(None)
+
+    @property
+    def container(self):
+        """
+        The quote of the string (`"` or `'`).
+        """
+        if self._string is None:
+            return None
+        return self._string[0]
+
+    @property
+    def is_undefined(self):
+        return self._string is None
+
+    @property
+    def value(self):
+        if self._value is None and self._string is not None:
+            self._value = self._string[1:-1]
+        return self._value
+
+    @property
+    def _key(self):
+        # the text identifies the value and the quote, so it is compared without creating the value
+        return self._string,
 
     def __str__(self):
-        if self.is_undefined:
+        if self._string is None:
             return "undefined"
-        return "%s%s%s" % (self.container, self.value, self.container)
+        return self._string
 
     def __repr__(self):
         return 's<%s>' % self
@@ -77,6 +122,8 @@ class Nothing(ConstantValue):
     """
     A type of unknown type
     """
+    __slots__ = ()
+
     def __str__(self):
         return 'Nothing'
 
@@ -88,11 +135,15 @@ class Anything(Type):
     """
     A type of unknown type
     """
+    __slots__ = ()
+
     def __repr__(self):
         return '<Anything>'
 
 
 class Number(ConstantValue):
+    __slots__ = ()
+
     def __init__(self, value=None):
         assert(value is None or isinstance(value, (int, float)))
         super().__init__(value)
@@ -113,14 +164,31 @@ class Variable(Type):
     """
     A variable that holds values. It has a name (e.g. "_x").
     """
+    __slots__ = ('_name', '_normalized_name')
+
     def __init__(self, name):
         super().__init__()
         self._name = name
 
+    @property
+    def _key(self):
+        return self._name,
+
     @property
     def name(self):
         return self._name
 
+    @property
+    def normalized_name(self):
+        """
+        The name as stored in scopes (see `sqf.namespace.Scope.normalize`), computed once.
+        """
+        try:
+            return self._normalized_name
+        except AttributeError:
+            self._normalized_name = self._name.lower()
+            return self._normalized_name
+
     @property
     def is_undefined(self):
         return False
@@ -137,6 +205,9 @@ class Variable(Type):
 
 
 class _Statement(BaseTypeContainer):
+    # slots, so they are not part of `_key` (i.e. of the equality of statements)
+    __slots__ = ('_base_tokens', '_string')
+
     def __init__(self, tokens, parenthesis=None, ending=None):
         assert (ending in (None, ',', ';'))
         assert (parenthesis in (None, '()', '[]', '{}'))
@@ -158,6 +229,21 @@ class _Statement(BaseTypeContainer):
         for i, s in enumerate(tokens):
             assert (isinstance(s, (Type, Keyword, Preprocessor, Statement, ParserType)))
         self._tokens = tokens + self._tokens
+        self._changed()
+
+    def _changed(self):
+        """
+        Called when the tokens of this statement change, to clear what is computed from them.
+        """
+        self._base_tokens = None
+        self._string = None
+
+    @property
+    def base_tokens(self):
+        # computed once, since statements are read far more often than they are modified (see `_changed`)
+        if self._base_tokens is None:
+            self._base_tokens = [token for token in self._tokens if self.is_base_token(token)]
+        return self._base_tokens
 
     @property
     def content(self):
@@ -186,6 +272,7 @@ class _Statement(BaseTypeContainer):
         if ending is not None:
             self._tokens.append(ParserKeyword(ending))
         self._ending = ending
+        self._changed()
 
     def __len__(self):
         return len(self._tokens)
@@ -196,12 +283,30 @@ class _Statement(BaseTypeContainer):
     def _as_str(self, func=str):
         return ''.join(func(item) for item in self._tokens)
 
+    def _str_tokens(self):
+        return self._tokens
+
+    def _cached_str(self):
+        return self._string
+
+    def __str__(self):
+        # stored, since statements are not modified after they are parsed (see `_changed`)
+        if self._string is None:
+            self._string = super().__str__()
+        return self._string
+
     @property
     def parenthesis(self):
         return self._parenthesis
 
 
 class Array(Type, BaseTypeContainer):
+    """
+    An array of values. Arrays are modified by the interpreter (e.g. `pushBack`), so their tokens
+    (the values separated by commas) are only built when they are used, after the last modification.
+    """
+    # a slot, so it is not part of `_key` (i.e. arrays are equal when their values are equal)
+    __slots__ = ('_built_tokens',)
 
     def __init__(self, tokens=None):
         Type.__init__(self)
@@ -213,8 +318,21 @@ class Array(Type, BaseTypeContainer):
         BaseTypeContainer.__init__(self, tokens)
         self.update_tokens()
 
+    @property
+    def _tokens(self):
+        if self._built_tokens is None:
+            self._built_tokens = [ParserKeyword('[')] + list(self._with_commas()) + [ParserKeyword(']')]
+        return self._built_tokens
+
+    @_tokens.setter
+    def _tokens(self, tokens):
+        self._built_tokens = tokens
+
     def update_tokens(self):
-        self._tokens = [ParserKeyword('[')] + list(self._with_commas()) + [ParserKeyword(']')]
+        """
+        Called when the values of this array change.
+        """
+        self._built_tokens = None
 
     def _with_commas(self):
         if self._values in [None, []]:
@@ -234,6 +352,11 @@ class Array(Type, BaseTypeContainer):
             return '[undefined]'
         return ''.join(func(item) for item in self._tokens)
 
+    def _str_tokens(self):
+        if self.is_undefined:
+            return None
+        return self._tokens
+
     def __len__(self):
         assert(not self.is_undefined)
         return len(self._values)
@@ -311,6 +434,9 @@ class Code(_Statement, Type):
     """
     The class that holds (non-interpreted) code.
     """
+    # a slot, so it is not part of `_key` (i.e. of the equality of codes)
+    __slots__ = ('_program',)
+
     def __init__(self, tokens=None):
         Type.__init__(self)
         if tokens is not None:
@@ -318,8 +444,21 @@ class Code(_Statement, Type):
         else:
             self._undefined = True
             tokens = []
+        self._program = None  # see `sqf.compiler.compile_code`
         _Statement.__init__(self, tokens, parenthesis='{}')
 
+    def _changed(self):
+        super()._changed()
+        self._program = None
+
+    @property
+    def content_key(self):
+        """
+        A key of the content of this code: equal for codes with the same string. Its string is
+        computed once, so using it as a key of a dictionary is O(1).
+        """
+        return str(self)
+
     @property
     def is_undefined(self):
         return self._undefined
@@ -329,6 +468,8 @@ class Code(_Statement, Type):
 
 
 class Keyword(BaseType):
+    __slots__ = ('_token', '_unique_token')
+
     def __init__(self, token):
         assert isinstance(token, str)
         super().__init__()
@@ -353,8 +494,16 @@ class Keyword(BaseType):
     def _key(self):
         return self._unique_token,
 
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self._unique_token == other._unique_token
+
+    def __hash__(self):
+        return hash(self._unique_token)
+
 
 class Namespace(Type):
+    __slots__ = ('_token', '_unique_token')
+
     def __init__(self, token):
         assert isinstance(token, str)
         super().__init__()
@@ -396,7 +545,7 @@ class File(Code):
 
 
 class Preprocessor(Keyword):
-    pass
+    __slots__ = ()
 
 
 class Script(ConstantValue):
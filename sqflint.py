@@ -1,11 +1,22 @@
 import argparse
+import collections
+import hashlib
+import json
+import multiprocessing
+import multiprocessing.pool
 import os
+import queue
 import re
 import sys
+import tempfile
+import threading
+import urllib.parse
+import urllib.request
 
-from sqf.parser import parse
+from sqf.parser import parse, parse_tokens, reparse
+from sqf.preprocessor import preprocess, HeaderCache
 import sqf.analyzer
-from sqf.exceptions import SQFParserError, SQFWarning
+from sqf.exceptions import SQFError, SQFParserError, SQFParenthesisError, SQFWarning
 
 
 class Writer:
@@ -16,47 +27,516 @@ class Writer:
         self.strings.append(message)
 
 
-def analyze(code, writer, exceptions_list):
+def _sources_hash():
+    """
+    Returns a hash of the source of sqflint and of the `sqf` package (which includes the database
+    of expressions), so a cache is invalidated by any change of the tool.
+    """
+    sha = hashlib.sha256()
+    package = os.path.dirname(sqf.analyzer.__file__)
+    paths = [os.path.abspath(__file__)] + \
+        sorted(os.path.join(package, name) for name in os.listdir(package) if name.endswith('.py'))
+    for path in paths:
+        with open(path, 'rb') as f:
+            sha.update(f.read())
+    return sha.hexdigest()
+
+
+_EXCEPTIONS = {cls.__name__: cls for cls in (SQFError, SQFParserError, SQFParenthesisError, SQFWarning)}
+
+
+def _dump_exceptions(exceptions):
+    """
+    Returns `exceptions` as a list of (class name, position, message), or None when they
+    cannot be represented that way. Used to store them and to send them between processes.
+    """
+    if any(type(e).__name__ not in _EXCEPTIONS for e in exceptions):
+        return None
+    return [(type(e).__name__, e.position, e.message) for e in exceptions]
+
+
+def _load_exceptions(entries):
+    exceptions = []
+    for name, position, message in entries:
+        # the message already has its prefix (e.g. "error:"), so it is not passed to the constructor
+        exception = _EXCEPTIONS[name](tuple(position), '')
+        exception.message = message
+        exceptions.append(exception)
+    return exceptions
+
+
+class Includes:
+    """
+    The include roots of a run of sqflint and the headers read during the run. Scripts of a run with
+    include roots are preprocessed (see `sqf.preprocessor.preprocess`), so their #include are resolved,
+    and each header is read once.
+    """
+    def __init__(self, roots):
+        self.roots = roots
+        self.headers = HeaderCache()
+
+
+class Cache:
+    """
+    An on-disk cache of the exceptions of scripts, keyed by the hash of the script and of the tool,
+    so unchanged scripts are neither parsed nor analyzed. With `includes`, the key also has the path
+    of the script and the include roots, and an entry is only used while the headers that the
+    script included are unchanged.
+    """
+    def __init__(self, directory, includes=None):
+        self.directory = directory
+        self.includes = includes
+        self.hits = 0
+        self.misses = 0
+        self._tool_hash = _sources_hash()
+
+    def _path(self, code, path=None):
+        sha = hashlib.sha256(self._tool_hash.encode())
+        if self.includes is not None:
+            # relative #include depend on the path of the script
+            sha.update(json.dumps([self.includes.roots, path and os.path.abspath(path)]).encode())
+        sha.update(code.encode('utf-8', 'surrogatepass'))
+        key = sha.hexdigest()
+        return os.path.join(self.directory, key[:2], key + '.json')
+
+    def _digests(self, headers):
+        return [self.includes.headers.digest(header) for header in headers]
+
+    def get(self, code, path=None):
+        """
+        Returns the list of exceptions of `code` (of the file `path`), or None when it is not in the cache.
+        """
+        try:
+            with open(self._path(code, path)) as f:
+                entry = json.load(f)
+            exceptions = _load_exceptions(entry['exceptions'])
+            headers = [header for header, _ in entry['headers']]
+            if headers and self._digests(headers) != [digest for _, digest in entry['headers']]:
+                raise ValueError('An included header changed')
+        except (OSError, ValueError, TypeError, KeyError):
+            # a missing, truncated, modified or outdated entry is a miss
+            self.misses += 1
+            return None
+        self.hits += 1
+        return exceptions
+
+    def set(self, code, exceptions, path=None, headers=()):
+        """
+        Stores the exceptions of `code` (of the file `path`), that included the files `headers`.
+        """
+        entries = _dump_exceptions(exceptions)
+        if entries is None:
+            return
+        digests = self._digests(headers) if headers else []
+        if None in digests:
+            return
+
+        path = self._path(code, path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # written to a temporary file first, so a concurrent run never reads a partial entry
+        with tempfile.NamedTemporaryFile('w', dir=os.path.dirname(path), delete=False) as f:
+            json.dump({'exceptions': entries, 'headers': list(zip(headers, digests))}, f)
+        os.replace(f.name, path)
+
+    @property
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0
+
+    def report(self):
+        return 'cache: %d hits, %d misses (%.1f%% hit rate)\n' % (self.hits, self.misses, 100 * self.hit_rate)
+
+
+def _exceptions(code, path=None, includes=None, included=None):
+    """
+    Returns the exceptions of `code` (of the file `path`). With `includes`, the script is preprocessed
+    and the paths of the files it included are appended to `included`.
+    """
     try:
-        result = parse(code)
+        if includes is None:
+            result = parse(code)
+        else:
+            result = parse_tokens(preprocess(code, path, includes.roots, headers=includes.headers,
+                                             included=included))
     except SQFParserError as e:
-        writer.write('[%d,%d]:%s\n' % (e.position[0], e.position[1] - 1, e.message))
-        exceptions_list += [e]
-        return
+        return [e]
+    return sqf.analyzer.analyze(result).exceptions
+
+
+# the includes of the run of a worker process
+_worker_includes = None
+
+
+def _init_worker(include_roots=()):
+    global _worker_includes
+    if include_roots:
+        _worker_includes = Includes(include_roots)
+    # the first analysis builds the state shared by all analyses (e.g. the database of expressions),
+    # so it is paid once per worker process instead of in its first file
+    sqf.analyzer.analyze(parse('private _x = [1] + [2]; if (_x isEqualTo []) then {hint str _x};'))
+
+
+def _worker_exceptions(code, path):
+    # the exceptions are None when they cannot be sent to the main process, which then analyzes the script itself
+    included = []
+    return _dump_exceptions(_exceptions(code, path, _worker_includes, included)), included
+
+
+def analyze(code, writer, exceptions_list, cache=None, exceptions=None, path=None, includes=None):
+    """
+    Analyzes `code` (of the file `path`) and writes its exceptions to `writer`. `exceptions` are
+    the exceptions of `code` when they were computed elsewhere (e.g. by a worker process).
+    """
+    if exceptions is None and cache is not None:
+        exceptions = cache.get(code, path)
+    if exceptions is None:
+        included = []
+        exceptions = _exceptions(code, path, includes, included)
+        if cache is not None:
+            cache.set(code, exceptions, path, included)
 
-    exceptions = sqf.analyzer.analyze(result).exceptions
     for e in exceptions:
         writer.write('[%d,%d]:%s\n' % (e.position[0], e.position[1] - 1, e.message))
     exceptions_list += exceptions
 
-def analyze_dir(directory, writer, exceptions_list, exclude):
+
+def _ready(result):
+    return not isinstance(result, multiprocessing.pool.AsyncResult) or result.ready()
+
+
+def analyze_dir(directory, writer, exceptions_list, exclude, cache=None, jobs=1, includes=None):
     """
-    Analyzes a directory recursively
+    Analyzes a directory recursively. With `jobs` > 1, the files are analyzed by a pool of
+    `jobs` processes; the output is the same, and in the same order, as with one process.
+    With `includes`, the scripts are preprocessed (see `Includes`).
     """
-    for root, dirs, files in os.walk(directory):
-        if any([re.match(s, root) for s in exclude.copy()]):
-            writer.write(root + ' EXCLUDED\n')
-            continue
-        files.sort()
-        for file in files:
-            if file.endswith(".sqf"):
-                file_path = os.path.join(root, file)
-                if any([re.match(s, file_path) for s in exclude.copy()]):
-                    writer.write(file_path + ' EXCLUDED\n')
-                    continue
-
-                writer_helper = Writer()
-
-                with open(file_path) as f:
-                    analyze(f.read(), writer_helper, exceptions_list)
-
-                if writer_helper.strings:
-                    writer.write(os.path.relpath(file_path, directory) + '\n')
-                    for string in writer_helper.strings:
-                        writer.write('\t%s' % string)
+    pool = None
+    # the number of files read but not yet written, beyond which reading waits for the oldest one
+    max_pending = 0
+    if jobs > 1:
+        # each process reads the headers once
+        pool = multiprocessing.Pool(jobs, initializer=_init_worker, initargs=(includes.roots if includes else (),))
+        max_pending = 4 * jobs
+    # (path, code, result) of the paths in order, where code is None for an excluded path
+    pending = collections.deque()
+
+    def write(file_path, code, result=None):
+        if code is None:
+            writer.write(file_path + ' EXCLUDED\n')
+            return
+        exceptions = None
+        if isinstance(result, list):
+            exceptions = result
+        elif result is not None:
+            entries, included = result.get()
+            if entries is None:
+                # the worker could not send the exceptions, so the script is analyzed here
+                included = []
+                exceptions = _exceptions(code, file_path, includes, included)
+            else:
+                exceptions = _load_exceptions(entries)
+            if cache is not None:
+                cache.set(code, exceptions, file_path, included)
+
+        writer_helper = Writer()
+        analyze(code, writer_helper, exceptions_list, cache, exceptions, file_path, includes)
+
+        if writer_helper.strings:
+            writer.write(os.path.relpath(file_path, directory) + '\n')
+            for string in writer_helper.strings:
+                writer.write('\t%s' % string)
+
+    def flush(size):
+        # writes the paths in order, while more than `size` are pending or the oldest one is ready
+        while pending and (len(pending) > size or _ready(pending[0][2])):
+            write(*pending.popleft())
+
+    try:
+        for root, dirs, files in os.walk(directory):
+            if any([re.match(s, root) for s in exclude.copy()]):
+                pending.append((root, None, None))
+                flush(max_pending)
+                continue
+            files.sort()
+            for file in files:
+                if file.endswith(".sqf"):
+                    file_path = os.path.join(root, file)
+                    if any([re.match(s, file_path) for s in exclude.copy()]):
+                        pending.append((file_path, None, None))
+                        flush(max_pending)
+                        continue
+
+                    with open(file_path) as f:
+                        code = f.read()
+
+                    result = None
+                    if pool is not None:
+                        # the exceptions from the cache, or the pending exceptions from the pool
+                        if cache is not None:
+                            result = cache.get(code, file_path)
+                        if result is None:
+                            result = pool.apply_async(_worker_exceptions, (code, file_path))
+                    pending.append((file_path, code, result))
+                    flush(max_pending)
+
+        flush(0)
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
     return writer
 
 
+def _read_message(stream):
+    """
+    Returns the next message of the language server protocol (a JSON-RPC message preceded by its headers)
+    of the binary `stream`, or None at its end. Raises ValueError when the message is invalid.
+    """
+    length = None
+    headers = False
+    while True:
+        line = stream.readline()
+        if not line:
+            return None
+        line = line.strip()
+        if not line:
+            if length is not None:
+                break
+            if headers:
+                # without its length, the content of the message cannot be told apart from the next headers
+                raise ValueError('The headers of the message have no Content-Length')
+            continue
+        headers = True
+        name, _, value = line.decode('ascii').partition(':')
+        if name.strip().lower() == 'content-length':
+            length = int(value)
+
+    body = stream.read(length)
+    if len(body) < length:
+        return None
+    message = json.loads(body.decode('utf-8'))
+    if not isinstance(message, dict):
+        raise ValueError('The message is not an object')
+    return message
+
+
+def _write_message(stream, message):
+    body = json.dumps(message).encode('utf-8')
+    stream.write(b'Content-Length: %d\r\n\r\n' % len(body))
+    stream.write(body)
+    stream.flush()
+
+
+def _lsp_range(lines, position):
+    """
+    Returns the range (of the language server protocol) of the word at `position` (1-based line and column)
+    of a script with `lines`. Ranges are 0-based and count characters in UTF-16 code units.
+    """
+    line = min(max(position[0] - 1, 0), len(lines) - 1)
+    text = lines[line]
+    start = min(max(position[1] - 1, 0), len(text))
+    match = re.compile(r'\w+').match(text, start)
+    end = match.end() if match else min(start + 1, len(text))
+
+    def character(column):
+        return len(text[:column].encode('utf-16-le')) // 2
+
+    return {'start': {'line': line, 'character': character(start)},
+            'end': {'line': line, 'character': character(end)}}
+
+
+def _diagnostics(code, exceptions):
+    """
+    Returns the `exceptions` of `code` as diagnostics of the language server protocol.
+    """
+    lines = code.split('\n')
+    diagnostics = []
+    for e in exceptions:
+        message = e.message
+        if isinstance(e, (SQFParserError, SQFWarning)):
+            # without its prefix (e.g. "error:"), since it is the severity of the diagnostic
+            message = message.split(':', 1)[1]
+        diagnostics.append({
+            'range': _lsp_range(lines, e.position),
+            'severity': 2 if isinstance(e, SQFWarning) else 1,
+            'source': 'sqflint',
+            'message': message,
+        })
+    return diagnostics
+
+
+def _uri_path(uri):
+    """
+    Returns the path of the file of `uri`, or None when it is not a file.
+    """
+    uri = urllib.parse.urlparse(uri)
+    if uri.scheme != 'file':
+        return None
+    return os.path.abspath(urllib.request.url2pathname(uri.path))
+
+
+class Server:
+    """
+    A language server (of the language server protocol, over stdio) that publishes the exceptions of the
+    open documents as diagnostics. Unlike a call of sqflint per save, the process and the state shared by
+    analyses (e.g. the database of expressions) are kept between analyses, a document is only analyzed
+    when its text changes, and changes received while a document is analyzed are analyzed together,
+    so only the last text of each document is analyzed.
+
+    The parse tree of each document is kept, so a change only parses the statements of the text that changed
+    (see `sqf.parser.reparse`); the document is still analyzed in full. With `includes`, documents are
+    preprocessed instead and the headers are kept until they change.
+    """
+    def __init__(self, input, output, includes=None):
+        self._input = input
+        self._output = output
+        self._includes = includes
+        self._documents = {}  # uri: (version, text) of the open documents
+        self._analyzed = {}  # uri: (text, parse tree or None) of the last analysis of the document
+        self._shutdown = False
+
+    def _send(self, message):
+        message['jsonrpc'] = '2.0'
+        _write_message(self._output, message)
+
+    def _notify(self, method, params):
+        self._send({'method': method, 'params': params})
+
+    def _read(self, messages):
+        while True:
+            try:
+                message = _read_message(self._input)
+            except ValueError:
+                messages.put(ValueError)
+                continue
+            messages.put(message)
+            if message is None:
+                return
+
+    def run(self):
+        """
+        Handles the messages of the input until the exit notification (or the end of the input) and
+        returns the exit code.
+        """
+        _init_worker()
+
+        messages = queue.Queue()
+        threading.Thread(target=self._read, args=(messages,), daemon=True).start()
+        while True:
+            batch = [messages.get()]
+            while True:
+                try:
+                    batch.append(messages.get_nowait())
+                except queue.Empty:
+                    break
+            exit_code = self.handle(batch)
+            if exit_code is not None:
+                return exit_code
+
+    def handle(self, messages):
+        """
+        Handles `messages` and then analyzes the documents they changed. Returns the exit code when
+        the server exits, None otherwise.
+        """
+        changed = []
+        for message in messages:
+            if message is ValueError:
+                self._send({'id': None, 'error': {'code': -32700, 'message': 'Parse error'}})
+            elif message is None or message.get('method') == 'exit':
+                return 0 if self._shutdown else 1
+            else:
+                try:
+                    self._handle(message, changed)
+                except (KeyError, IndexError, TypeError):
+                    if 'id' in message:
+                        self._send({'id': message['id'], 'error': {'code': -32602, 'message': 'Invalid params'}})
+        self._analyze(changed)
+
+    def _handle(self, message, changed):
+        method = message.get('method')
+        params = message.get('params') or {}
+        if method == 'initialize':
+            capabilities = {'textDocumentSync': {'openClose': True, 'change': 1, 'save': {'includeText': True}}}
+            self._send({'id': message['id'], 'result': {'capabilities': capabilities,
+                                                        'serverInfo': {'name': 'sqflint'}}})
+        elif method == 'shutdown':
+            self._shutdown = True
+            self._send({'id': message['id'], 'result': None})
+        elif method in ('textDocument/didOpen', 'textDocument/didChange', 'textDocument/didSave'):
+            document = params['textDocument']
+            if method == 'textDocument/didOpen':
+                text = document['text']
+            elif method == 'textDocument/didChange':
+                # the documents are synchronized in full, so the last change is the text of the document
+                text = params['contentChanges'][-1]['text']
+            else:
+                text = params.get('text')
+                if text is None:
+                    return
+            version = document.get('version', self._documents.get(document['uri'], (None,))[0])
+            self._documents[document['uri']] = (version, text)
+            changed.append(document['uri'])
+            self._header_changed(document['uri'], changed)
+        elif method == 'workspace/didChangeWatchedFiles':
+            for change in params['changes']:
+                self._header_changed(change['uri'], changed)
+        elif method == 'textDocument/didClose':
+            uri = params['textDocument']['uri']
+            self._documents.pop(uri, None)
+            self._analyzed.pop(uri, None)
+            self._notify('textDocument/publishDiagnostics', {'uri': uri, 'diagnostics': []})
+        elif 'id' in message:
+            self._send({'id': message['id'], 'error': {'code': -32601, 'message': 'Method not found: %s' % method}})
+
+    def _header_changed(self, uri, changed):
+        """
+        Discards the header of `uri` when it was read, so it is read again, and analyzes the open documents again.
+        """
+        path = _uri_path(uri)
+        if self._includes is None or path is None or path not in self._includes.headers:
+            return
+        self._includes.headers.discard(path)
+        self._analyzed.clear()
+        changed += self._documents
+
+    def _parse(self, uri, text):
+        if self._includes is not None:
+            return parse_tokens(preprocess(text, _uri_path(uri), self._includes.roots,
+                                           headers=self._includes.headers))
+        previous_text, previous_result = self._analyzed.get(uri, (None, None))
+        if previous_result is None:
+            return parse(text)
+        return reparse(previous_result, previous_text, text)
+
+    def _analyze(self, uris):
+        for uri in dict.fromkeys(uris):
+            if uri not in self._documents:
+                continue
+            version, text = self._documents[uri]
+            if self._analyzed.get(uri, (None,))[0] == text:
+                continue
+
+            try:
+                try:
+                    result = self._parse(uri, text)
+                except SQFParserError as e:
+                    result = None
+                    exceptions = [e]
+                else:
+                    exceptions = sqf.analyzer.analyze(result).exceptions
+                self._analyzed[uri] = (text, result)
+                diagnostics = _diagnostics(text, exceptions)
+            except Exception as e:
+                self._analyzed[uri] = (text, None)
+                # an error of the analyzer is reported to the client instead of stopping the server
+                self._notify('window/logMessage', {'type': 1, 'message': 'sqflint: %s: %r' % (uri, e)})
+                continue
+            params = {'uri': uri, 'diagnostics': diagnostics}
+            if version is not None:
+                params['version'] = version
+            self._notify('textDocument/publishDiagnostics', params)
+
+
 def readable_dir(prospective_dir):
     if not os.path.isdir(prospective_dir):
         raise Exception("readable_dir:{0} is not a valid path".format(prospective_dir))
@@ -78,6 +558,18 @@ def parse_args(args):
                         help='How the parser should exit. \'\': exit code 0;\n'
                              '\'e\': exit with code 1 when any error is found;\n'
                              '\'w\': exit with code 1 when any error or warning is found.')
+    parser.add_argument('-I', '--include', action='append', type=readable_dir, default=[],
+                        help='A directory where #include are searched (e.g. the root of the project). When given, '
+                             'scripts are preprocessed, so their #include are resolved')
+    parser.add_argument('-j', '--jobs', type=int, default=1,
+                        help='The number of processes that analyze the files of a directory (0 for one per CPU)')
+    parser.add_argument('--cache-dir', type=str, default=None,
+                        help='A directory to cache the results of unchanged files between runs')
+    parser.add_argument('--cache-stats', action='store_true',
+                        help='Write the hit rate of the cache to stderr')
+    parser.add_argument('--server', action='store_true',
+                        help='Run as a language server (LSP) over stdio, that publishes the exceptions of the '
+                             'open documents')
 
     return parser.parse_args(args)
 
@@ -85,6 +577,19 @@ def parse_args(args):
 def entry_point(args):
     args = parse_args(args)
 
+    # the headers are read once per run
+    includes = None
+    if args.include:
+        includes = Includes(args.include)
+
+    if args.server:
+        exit_code = Server(sys.stdin.buffer, sys.stdout.buffer, includes).run()
+        # the thread that reads the messages may be blocked reading stdin, which blocks (and aborts) the
+        # shutdown of the interpreter, so the process exits without it after the output is flushed
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(exit_code)
+
     if args.output is None:
         writer = sys.stdout
     else:
@@ -92,17 +597,25 @@ def entry_point(args):
 
     exceptions_list = []
 
+    cache = None
+    if args.cache_dir is not None:
+        cache = Cache(args.cache_dir, includes)
+
     if args.file is None and args.directory is None:
         code = sys.stdin.read()
-        analyze(code, writer, exceptions_list)
+        analyze(code, writer, exceptions_list, cache, includes=includes)
     elif args.file is not None:
         code = args.file.read()
         args.file.close()
-        analyze(code, writer, exceptions_list)
+        analyze(code, writer, exceptions_list, cache, path=args.file.name, includes=includes)
     else:
         directory = args.directory.rstrip('/')
         exclude = list(map(lambda x: x if x.startswith('/') else os.path.join(directory, x), args.exclude))
-        analyze_dir(directory, writer, exceptions_list, exclude)
+        jobs = args.jobs if args.jobs > 0 else os.cpu_count() or 1
+        analyze_dir(directory, writer, exceptions_list, exclude, cache, jobs, includes)
+
+    if cache is not None and args.cache_stats:
+        sys.stderr.write(cache.report())
 
     if args.output is not None:
         writer.close()
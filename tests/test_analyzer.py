@@ -1,6 +1,11 @@
+import os
+import subprocess
+import sys
 from unittest import TestCase, expectedFailure
 
-from sqf.types import Number, String, Boolean, Array, Code, Anything, Nothing
+from sqf.types import Number, String, Boolean, Array, Code, Anything, Nothing, Keyword, Namespace
+from sqf.expressions import BinaryExpression, UnaryExpression
+from sqf.expressions_cache import ExpressionsDatabase as Database, ExpressionsDispatch, _expression
 from sqf.parser import parse
 from sqf.analyzer import analyze, Analyzer
 
@@ -812,6 +817,17 @@ class Switch(TestCase):
         analyzer = analyze(parse(code))
         self.assertEqual(len(analyzer.exceptions), 0)
 
+    def test_default_after_importing_interpreter(self):
+        # the interpreter must not change the expressions of the analyzer, which is built when it is imported
+        script = 'import sqf.interpreter\n' \
+                 'from sqf.parser import parse\n' \
+                 'from sqf.analyzer import analyze\n' \
+                 'code = \'z = switch (2) do {case 1: {"a"}; case 2: {"b"}; default {"c"}};\'\n' \
+                 'print(len(analyze(parse(code)).exceptions))\n'
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        output = subprocess.check_output([sys.executable, '-c', script], cwd=root)
+        self.assertEqual(b'0', output.strip())
+
     def test_default_error(self):
         code = 'switch (x) do {default : {[]}}'
         analyzer = analyze(parse(code))
@@ -1404,3 +1420,148 @@ class StringAsCodeFunctions(TestCase):
                '"isClass _x && {getNumber (_x >> \'scope\') == 2} && {getText (_x >> \'crew\') != _defaultCrew}" configClasses (configFile >> "cfgVehicles")'
         analyzer = analyze(parse(code))
         self.assertEqual(len(analyzer.exceptions), 0)
+
+
+class ExpressionsDatabase(TestCase):
+
+    SIGNATURES = (
+        ('Number', '+', 'Number', 'Number'),
+        ('String', '+', 'String', 'String'),
+        ('String', '+', 'String', 'String'),
+        ('abs', 'Number', 'Number'),
+        ('missionnamespace', 'Namespace'),
+    )
+
+    def test_replacement(self):
+        replacements = [BinaryExpression(String, Keyword('+'), String, String),
+                        UnaryExpression(Keyword('ABS'), Number, Number),
+                        UnaryExpression(Keyword('abs'), Number, Number),
+                        BinaryExpression(String, Keyword('+'), String, String)]
+        database = Database(self.SIGNATURES, replacements)
+
+        expected = [_expression(signature) for signature in self.SIGNATURES]
+        for exp in replacements:
+            if exp in expected:
+                expected.remove(exp)
+            expected.append(exp)
+
+        self.assertEqual(len(expected), len(database))
+        self.assertEqual([(type(x), x.types_or_values, x.return_type) for x in expected],
+                         [(type(x), x.types_or_values, x.return_type) for x in database])
+        # both signatures "String + String" were replaced
+        expressions = database.values_to_expressions([String(), Keyword('+'), String()])
+        self.assertEqual(3, len(expressions))
+        self.assertTrue(any(x is replacements[0] for x in expressions))
+        self.assertTrue(any(x is replacements[3] for x in expressions))
+
+    def test_lazy(self):
+        database = Database(self.SIGNATURES)
+        self.assertEqual([], database.values_to_expressions([Keyword('abs'), Number(), Number()]))
+
+        expressions = database.values_to_expressions([Keyword('missionNamespace')])
+        self.assertEqual(Namespace('missionNamespace'), expressions[0].execute([Keyword('missionNamespace')], None))
+        # only the expressions of the keywords that were looked up are built
+        self.assertEqual(1, sum(not isinstance(item, int) for item in database._items))
+
+    def test_match_memo(self):
+        expression = BinaryExpression(Number, Keyword('+'), Number, Number)
+        dispatch = ExpressionsDispatch([expression])
+
+        # `Anything` only matches a type when not exact
+        values = [Anything(), Keyword('+'), Number()]
+        self.assertIsNone(dispatch.match(values))
+        self.assertIs(expression, dispatch.match(values, exact=False))
+        self.assertIsNone(dispatch.match(values, exact=True))
+
+        # the match is stored by the types of the values, the keywords and `exact`
+        self.assertEqual(2, len(dispatch._matches))
+        self.assertIs(expression, dispatch.match([Number(1), Keyword('+'), Number(2)]))
+        self.assertIs(expression, dispatch.match([Number(3), Keyword('+'), Number(4)]))
+        self.assertEqual(3, len(dispatch._matches))
+        self.assertIsNone(dispatch.match([Number(3), Keyword('-'), Number(4)]))
+        self.assertEqual(4, len(dispatch._matches))
+
+        # the stored match is returned without comparing the expressions again
+        dispatch._database.clear()
+        self.assertIs(expression, dispatch.match([Number(1), Keyword('+'), Number(2)]))
+
+class NamespaceSnapshot(TestCase):
+
+    def test_copy_on_write(self):
+        from sqf.namespace import Namespace
+
+        namespace = Namespace('missionnamespace', {'a': Number(1)})
+        namespace.add_scope({'_x': Number(2)})
+        snapshot = namespace.snapshot()
+        self.assertIs(namespace.current_scope.values, snapshot.current_scope.values)
+
+        namespace.current_scope['_X'] = String('"x"')
+        snapshot.base_scope['b'] = Number(3)
+        namespace.add_scope()
+        self.assertEqual(Number(2), snapshot['_x'])
+        self.assertEqual(String('"x"'), namespace['_x'])
+        self.assertNotIn('b', namespace)
+        self.assertIn('b', snapshot)
+        self.assertEqual(2, len(snapshot._stack))
+        # both scopes were modified, so neither shares its values
+        self.assertIsNot(namespace.base_scope.values, snapshot.base_scope.values)
+
+    def test_scope_index(self):
+        from sqf.namespace import Namespace
+
+        namespace = Namespace('missionnamespace')
+        namespace.add_scope({'_x': Number(1)})
+        namespace.add_scope()
+        namespace.current_scope['_X'] = Number(2)
+        self.assertEqual(Number(2), namespace['_x'])
+
+        snapshot = namespace.snapshot()
+        namespace.del_scope()
+        self.assertEqual(Number(1), namespace['_x'])
+        self.assertEqual(Number(2), snapshot['_x'])
+
+        snapshot.current_scope['_y'] = Number(3)
+        snapshot.add_scope({'_y': Number(4)})
+        self.assertEqual(Number(4), snapshot['_y'])
+        snapshot.del_scope()
+        self.assertEqual(Number(3), snapshot['_y'])
+        self.assertNotIn('_y', namespace)
+
+    def test_code_sees_state_when_defined(self):
+        # the code is analyzed with the values of when it was defined
+        analyzer = analyze(parse('private _x = 1; private _f = {_x + 1}; _x = "a"; _f'))
+        self.assertEqual([], analyzer.exceptions)
+
+        analyzer = analyze(parse('private _x = "a"; private _f = {_x + 1}; _x = 1; _f'))
+        self.assertEqual(1, len(analyzer.exceptions))
+
+
+class CodeAnalyzer(TestCase):
+
+    def test_frame(self):
+        analyzer = Analyzer()
+        state = (analyzer._namespaces, analyzer.current_namespace, analyzer.privates, analyzer._unexecuted_codes)
+        frame = analyzer._push_frame(Analyzer.new_namespaces(), 1)
+        self.assertIsNot(state[0], analyzer._namespaces)
+        self.assertIsNot(state[3], analyzer._unexecuted_codes)
+        self.assertEqual(1, analyzer.delete_scope_level)
+
+        analyzer._pop_frame(frame)
+        self.assertEqual(state, (analyzer._namespaces, analyzer.current_namespace, analyzer.privates,
+                                 analyzer._unexecuted_codes))
+        self.assertEqual(0, analyzer.delete_scope_level)
+
+    def test_code_state_is_restored(self):
+        # the analysis of a code does not change the state of the analysis of the script
+        code = 'private _a = 1; [] spawn {private _a = "a"; _b = 2}; {_c = 3} forEach []; _a + 1'
+        analyzer = analyze(parse(code))
+        self.assertEqual([], [e.message for e in analyzer.exceptions if '_a' in e.message])
+        self.assertEqual(0, analyzer.delete_scope_level)
+        self.assertEqual(Number, type(analyzer['_a']))
+
+    def test_nested_codes(self):
+        # the exceptions of codes within codes are reported in order
+        code = 'player addEventHandler ["Fired", {_a; [] spawn {_b; {_c} forEach []; _d}; _e}]'
+        analyzer = analyze(parse(code))
+        self.assertEqual([(1, 35), (1, 49), (1, 54), (1, 70), (1, 75)],
+                         [e.position for e in analyzer.exceptions])
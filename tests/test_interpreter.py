@@ -1,8 +1,13 @@
 from unittest import TestCase
 
 from sqf.exceptions import SQFParserError
-from sqf.types import String, Number, Array, Boolean, Nothing, Number as N
-from sqf.interpreter import interpret
+from sqf.types import String, Number, Array, Boolean, Nothing, Number as N, Keyword, Type, Code, File
+from sqf.expressions import BinaryExpression, UnaryExpression
+from sqf.expressions_cache import ExpressionsDispatch as Dispatch
+from sqf.base_interpreter import BaseInterpreter
+from sqf.compiler import compile_code
+from sqf.parser import parse
+from sqf.interpreter import interpret, Interpreter
 
 
 class TestInterpreter(TestCase):
@@ -483,3 +488,51 @@ class Operators(TestCase):
     def test_assign_array(self):
         interpreter = interpret('_y = [];')[0]
         self.assertEqual(Array([]), interpreter['_y'])
+
+
+class ExpressionsDispatch(TestCase):
+
+    def test_first_match(self):
+        expressions = [UnaryExpression(Keyword('call'), Code, Nothing),
+                       UnaryExpression(Keyword('call'), Type, Nothing),
+                       UnaryExpression(Keyword('CALL'), Code, Nothing),
+                       BinaryExpression(Type, Keyword('call'), Code, Nothing)]
+        dispatch = Dispatch(expressions)
+
+        for _ in range(2):
+            self.assertIs(expressions[0], dispatch.match([Keyword('Call'), Code()]))
+            # subclasses match
+            self.assertIs(expressions[0], dispatch.match([Keyword('call'), File([])]))
+            self.assertIs(expressions[1], dispatch.match([Keyword('call'), Number(1)]))
+            self.assertIs(expressions[3], dispatch.match([Number(1), Keyword('call'), Code()]))
+            self.assertIsNone(dispatch.match([Keyword('spawn'), Code()]))
+            self.assertIsNone(dispatch.match([Number(1), Keyword('call'), Number(1)]))
+
+
+class Compiler(TestCase):
+
+    def test_compiled_once(self):
+        code = Code(parse('_x = _x + 1; [_x, 2]')._tokens)
+        program = compile_code(code)
+        self.assertIs(program, compile_code(code))
+
+        # changing the code compiles it again
+        code.prepend(parse('_x = 1;')._tokens)
+        self.assertIsNot(program, compile_code(code))
+
+    def test_loop_body(self):
+        interpreter, outcome = interpret('_l = []; _t = 0; for "_i" from 1 to 10 do '
+                                         '{if (_i % 2 == 0) then {_l pushBack _i}; _t = _t + _i;}; _t')
+        self.assertEqual(N(55), outcome)
+        self.assertEqual(Array([N(2), N(4), N(6), N(8), N(10)]), interpreter['_l'])
+
+    def test_positions(self):
+        # the positions of the values are the ones of executing the statements without compiling them
+        script = '_x = 1;\n_y = [_x, _x + 1, [2]]; _y'
+        results = []
+        for execute_statements in (BaseInterpreter.execute_statements, Interpreter.execute_statements):
+            interpreter = Interpreter()
+            interpreter.execute_statements = lambda code: execute_statements(interpreter, code)
+            interpreter, outcome = interpret(script, interpreter)
+            results.append([outcome.position] + [x.position for x in outcome.value])
+        self.assertEqual(results[0], results[1])
@@ -7,7 +7,10 @@ from sqf.types import String, Statement, Code, Array, Boolean, Variable as V, \
     Number as N, BaseTypeContainer, Keyword, Preprocessor, Nothing
 from sqf.interpreter_types import DefineStatement, IfDefStatement, DefineResult, IfDefResult
 from sqf.parser_types import Comment, Space, Tab, EndOfLine, BrokenEndOfLine, ParserKeyword
-from sqf.parser import parse, parse_strings_and_comments, identify_token
+from sqf.parser import parse, parse_strings_and_comments, identify_token, lex, parse_flat, parse_tokens, \
+    reparse
+from sqf.preprocessor import preprocess
+from sqf import parser_flat
 from sqf.base_tokenizer import tokenize
 
 
@@ -854,6 +857,20 @@ class ParseArray(ParserTestCase):
 
         self.assertEqual(expected, result, code)
 
+    def test_deep_nesting(self):
+        # deeper than Python's recursion limit
+        depth = 5000
+        code = '_x = %s1%s;' % ('[' * depth, ']' * depth)
+        result = parse(code)
+        self.assertEqual(code, str(result))
+
+        token = result[0][2][1]
+        for _ in range(depth):
+            self.assertEqual(Array, type(token))
+            token = token.value[0][0]
+        self.assertEqual(N(1), token)
+        self.assertEqual((1, 6 + depth), token.position)
+
     def test_or_together(self):
         code = '||isNull'
         result = parse(code)
@@ -1009,6 +1026,176 @@ class ParseStrings(ParserTestCase):
         self.assertEqualStatement(expected, result, code)
 
 
+class Lexer(TestCase):
+    """
+    `lex` must be equivalent to `tokenize` followed by `parse_strings_and_comments`.
+    """
+    def assertSameTokens(self, code):
+        expected = [identify_token(x) for x in parse_strings_and_comments(tokenize(code))]
+        result = lex(code)
+        self.assertEqual([(type(x), str(x)) for x in expected], [(type(x), str(x)) for x in result])
+
+        indexes = build_indexes(code + ' ')
+        for token in result:
+            index = indexes[token.position]
+            self.assertEqual(code[index:index + len(str(token))], str(token))
+
+    def test_basic(self):
+        self.assertSameTokens('_x = [1, 25, "a"];\r\nhint str _x; // the end')
+
+    def test_strings(self):
+        self.assertSameTokens('_x = "a ""b"" \'c\'" + \'d \'\'e\'\'\' + ""')
+
+    def test_comments(self):
+        self.assertSameTokens('/* a\n // b */ _x /**/ // c \\\n d\n_y')
+
+    def test_comment_split_by_tokenizer(self):
+        # `/*/` is tokenized as `/*` and `/`, so it does not close the comment
+        self.assertSameTokens('/* /*/ _x')
+        self.assertSameTokens('_x */* _y */')
+
+    def test_identify_token(self):
+        self.assertEqual(N(10), identify_token('10'))
+        self.assertEqual(N(1000.0), identify_token('1e3'))
+        self.assertEqual(N(0.5), identify_token('.5'))
+        self.assertEqual(Boolean(True), identify_token('true'))
+        self.assertEqual(Keyword('hint'), identify_token('HINT'))
+        self.assertEqual(Preprocessor('#define'), identify_token('#define'))
+        self.assertEqual(ParserKeyword(';'), identify_token(';'))
+        self.assertEqual(EndOfLine('\r\n'), identify_token('\r\n'))
+        self.assertEqual(V('_x1'), identify_token('_x1'))
+
+    def test_unclosed_string(self):
+        with self.assertRaises(SQFParserError) as cm:
+            lex('_x = 1;\n_y = "a""')
+        self.assertEqual((2, 6), cm.exception.position)
+
+
+class ParseFlat(TestCase):
+
+    def structure(self, tree, node=0):
+        return (parser_flat.NODE_NAMES[tree.node_kinds[node]], tree.node_string(node),
+                [self.structure(tree, child) for child in tree.children(node)])
+
+    def test_tokens(self):
+        code = '_x = [1, "a ""b"""];\r\nhint str _x; // the end'
+        tree = parse_flat(code)
+        tokens = lex(code)
+        self.assertEqual(len(tokens), len(tree))
+        for i, token in enumerate(tokens):
+            self.assertEqual(str(token), tree.token_string(i))
+            self.assertEqual(type(token), tree.token_class(i))
+            self.assertEqual(token.position, tree.token_position(i))
+
+    def test_structure(self):
+        tree = parse_flat('x = [1, (2)];\nif (a) then {b}')
+        self.assertEqual(('File', 'x = [1, (2)];\nif (a) then {b}', [
+            ('Statement', 'x = [1, (2)];', [
+                ('Array', '[1, (2)]', [
+                    ('Statement', '1,', []),
+                    ('Statement', ' (2)', [('Parenthesis', '(2)', [('Statement', '2', [])])])])]),
+            ('Statement', '\nif (a) then {b}', [
+                ('Parenthesis', '(a)', [('Statement', 'a', [])]),
+                ('Code', '{b}', [('Statement', 'b', [])])])]), self.structure(tree))
+        self.assertEqual((2, 13), tree.node_position(10))
+
+    def test_empty(self):
+        self.assertEqual(('File', '', []), self.structure(parse_flat('')))
+        self.assertEqual(('File', '[]', [('Statement', '[]', [('Array', '[]', [])])]),
+                         self.structure(parse_flat('[]')))
+
+    def test_directive(self):
+        # the tokens of a directive are not required to be balanced
+        tree = parse_flat('#define A(x) [x\n#define B ]\nA(1)')
+        self.assertEqual(('File', '#define A(x) [x\n#define B ]\nA(1)', [
+            ('Directive', '#define A(x) [x', []),
+            ('Statement', '\n', []),
+            ('Directive', '#define B ]', []),
+            ('Statement', '\nA(1)', [('Parenthesis', '(1)', [('Statement', '1', [])])])]),
+            self.structure(tree))
+
+    def test_errors(self):
+        with self.assertRaises(SQFParenthesisError) as cm:
+            parse_flat('x = 1;\n x = (1 + 2;')
+        self.assertEqual((2, 6), cm.exception.position)
+        self.assertIn('Parenthesis "(" not closed', cm.exception.message)
+
+        with self.assertRaises(SQFParenthesisError) as cm:
+            parse_flat('x = [1, 2);')
+        self.assertEqual((1, 10), cm.exception.position)
+
+        with self.assertRaises(SQFParserError) as cm:
+            parse_flat('_x = 1;\n_y = "a""')
+        self.assertEqual((2, 6), cm.exception.position)
+
+
+def positions(token):
+    result = [(type(token), str(token), token.position)]
+    for sub_token in getattr(token, 'tokens', ()):
+        result += positions(sub_token)
+    return result
+
+
+class ParseTokens(TestCase):
+
+    def test_same_as_parse(self):
+        code = 'x = 1;\nif (x) then {\n  hint str [_y, (2 + 3)];\n};\n'
+        self.assertEqual(positions(parse(code)), positions(parse_tokens(lex(code))))
+
+    def test_preprocessed(self):
+        # the tokens keep the positions in the script, not in the preprocessed script
+        result = parse_tokens(preprocess('#define A(x) [x, 1]\nx = A(2); y = 3;'))
+        self.assertEqual('\nx = [2, 1]; y = 3;', str(result))
+        # the array of the macro has the position of its use
+        self.assertEqual((2, 5), result[0][2][1].position)
+        self.assertEqual((2, 5), result[0][2][1][1].position)
+        # the tokens after the macro keep their positions
+        self.assertEqual((2, 10), result[1].position)
+        self.assertEqual((2, 13), result[1][1].position)
+
+    def test_errors(self):
+        with self.assertRaises(SQFParenthesisError) as cm:
+            parse_tokens(preprocess('#define A(x) (x\n\nx = A(1);'))
+        self.assertEqual((3, 5), cm.exception.position)
+
+
+class Reparse(TestCase):
+
+    def assertReparsed(self, script, new_script):
+        result = reparse(parse(script), script, new_script)
+        self.assertEqual(positions(parse(new_script)), positions(result))
+        return result
+
+    def test_same_as_parse(self):
+        script = 'x = 1;\nif (x) then {\n  hint str [_y, 2];\n};\ny = 2;'
+        for new_script in ['x = 1;\nif (x) then {\n  hint str [_y, 2, 3];\n};\ny = 2;',
+                           'x = 12;\nif (x) then {\n  hint str [_y, 2];\n};\ny = 2;',
+                           'x = 1;\nif (x) then {\n  hint str [_y, 2];\n};\ny = 2; z = 3;',
+                           'x = 1;\ny = 2;',
+                           'x = 1 y = 2;',
+                           '']:
+            self.assertReparsed(script, new_script)
+
+    def test_reuses_statements(self):
+        script = 'x = 1;\nif (x) then {\n  hint str [_y, 2];\n};\ny = 2;'
+        result = parse(script)
+        new_result = reparse(result, script, script.replace('_y', '_z'))
+        self.assertIs(result[0], new_result[0])
+        self.assertIsNot(result[1], new_result[1])
+        self.assertIs(result[2], new_result[2])
+        self.assertEqual((4, 3), new_result[2].position)
+
+    def test_fallback(self):
+        # the changed statement is not closed, so the statements after it are parsed with it
+        self.assertReparsed('x = 1; y = 2; z = 3;', 'x = 1; y = 2 z = 3;')
+        # a #define changes the statements after it
+        self.assertReparsed('x = 1; y = A;', '#define A 2\nx = 1; y = A;')
+
+        with self.assertRaises(SQFParenthesisError) as cm:
+            reparse(parse('x = 1;\ny = 2;'), 'x = 1;\ny = 2;', 'x = 1;\ny = (2;')
+        self.assertEqual((2, 5), cm.exception.position)
+
+
 class ParsePreprocessor(ParserTestCase):
 
     def test_include(self):
@@ -1094,6 +1281,12 @@ class TestIfDefStatement(ParserTestCase):
         self.assertEqual((3, 1), m.exception.position)
         self.assertEqual('error:#ifdef statement not closed', m.exception.message)
 
+    def test_error_after_ifdef(self):
+        # the position is of the script, not of the tokens after processing the #ifdef
+        with self.assertRaises(SQFParenthesisError) as m:
+            parse('#ifdef A\nx\n#endif\n)')
+        self.assertEqual((4, 1), m.exception.position)
+
     def test_if_def_wrong(self):
         with self.assertRaises(SQFParserError) as m:
             parse('\n\n#ifdef\nx=2\n#endif\n')
@@ -1535,6 +1728,23 @@ class TestDefineResult(ParserTestCase):
                               DefineResult([EndOfLine('\n'), V('x'), Keyword('*'), V('A')], define, expected_statement)])
         self.assertEqualStatement(expected, result, code)
 
+    def test_statements_after(self):
+        # a define only replaces the statement where it is used
+        code = '#define A 1\nx = A;\ny = A + 2;\nz = 3;'
+        result = parse(code)
+        self.assertEqual(code, str(result))
+        self.assertEqual([Statement, DefineResult, DefineResult, Statement], [type(x) for x in result.tokens])
+        self.assertEqual('\nx = A;', str(result[1]))
+        self.assertEqual('\nx = 1;', str(result[1].result))
+        self.assertEqual('\ny = 1 + 2;', str(result[2].result))
+        self.assertEqual('\nz = 3;', str(result[3]))
+
+        code = '#define A 1\nx = {A; b};'
+        code_result = parse(code)[1][2][1]
+        self.assertEqual(Code, type(code_result))
+        self.assertEqual([DefineResult, Statement], [type(x) for x in code_result.base_tokens])
+        self.assertEqual('1;', str(code_result.base_tokens[0].result))
+
     def test_parenthesis_after(self):
         code = '#define A 1\n{X = A}'
         parse(code)
@@ -1545,6 +1755,10 @@ class TestDefineResult(ParserTestCase):
         with self.assertRaises(SQFParserError):
             parse(code)
 
+        with self.assertRaises(SQFParserError) as m:
+            parse('x = 1;\n#define\n')
+        self.assertEqual((2, 1), m.exception.position)
+
     def test_define_array_bit(self):
         define = parse('#define A 1,2')[0][0]
         assert (isinstance(define, DefineStatement))
@@ -0,0 +1,177 @@
+import os
+import tempfile
+from unittest import TestCase
+
+from sqf.exceptions import SQFParserError
+from sqf.preprocessor import preprocess, HeaderCache
+from sqf.types import String, Variable
+
+
+def preprocessed(script, **kwargs):
+    return ''.join(str(token) for token in preprocess(script, **kwargs))
+
+
+class TestDefine(TestCase):
+
+    def test_constant(self):
+        self.assertEqual('\nx = 1 + 2;', preprocessed('#define A 1 + 2\nx = A;'))
+
+    def test_arguments(self):
+        self.assertEqual('\nx = [1, (2 + 3)];', preprocessed('#define A(x,y) [x, (y)]\nx = A(1,2 + 3);'))
+
+    def test_arguments_with_parenthesis(self):
+        self.assertEqual('\nx = [[1, 2], 3];', preprocessed('#define A(x) [x, 3]\nx = A([1, 2]);'))
+
+    def test_arguments_in_lines(self):
+        self.assertEqual('\nx = [1, 2];', preprocessed('#define A(x,y) [x, y]\nx = A(1, \n2);'))
+
+    def test_without_arguments(self):
+        # a macro with arguments used without them is not expanded
+        self.assertEqual('\nx = A;', preprocessed('#define A(x) x\nx = A;'))
+
+    def test_wrong_arguments(self):
+        with self.assertRaises(SQFParserError) as cm:
+            preprocessed('#define A(x) x\nx = A(1, 2);')
+        self.assertEqual((2, 5), cm.exception.position)
+
+    def test_stringize_and_concatenate(self):
+        code = '#define PREFIX tag\n' \
+               '#define DOUBLES(var1,var2) var1##_##var2\n' \
+               '#define GVAR(var1) DOUBLES(PREFIX,var1)\n' \
+               '#define QUOTE(var1) #var1\n' \
+               '#define QGVAR(var1) QUOTE(GVAR(var1))\n' \
+               'GVAR(x) = QGVAR(y);'
+        tokens = list(preprocess(code))
+        self.assertEqual('\n\n\n\n\ntag_x = "tag_y";', ''.join(str(token) for token in tokens))
+        self.assertIn(Variable('tag_x'), tokens)
+        self.assertIn(String('"tag_y"'), tokens)
+
+    def test_multiline(self):
+        # the lines continued by the #define are kept
+        self.assertEqual('\n\nx = 1 +  2;', preprocessed('#define A 1 + \\\n 2\nx = A;'))
+        tokens = list(preprocess('#define A 1 + \\\n 2 + \\\n 3\nx = A;'))
+        self.assertEqual((4, 1), tokens[3].position)
+
+    def test_recursive(self):
+        self.assertEqual('\n\nX', preprocessed('#define X Y\n#define Y X\nX'))
+
+    def test_undef(self):
+        self.assertEqual('\n\nA', preprocessed('#define A 1\n#undef A\nA'))
+
+    def test_positions(self):
+        tokens = list(preprocess('#define A 1 + 2\nx = A;'))
+        self.assertEqual([(2, 1), (2, 2), (2, 3), (2, 4), (2, 5), (2, 5), (2, 5), (2, 5), (2, 5), (2, 6)],
+                         [token.position for token in tokens[1:]])
+
+    def test_defines(self):
+        defines = {}
+        list(preprocess('#define A(x) x\n', defines=defines))
+        self.assertEqual(['x'], defines['A'].args)
+
+    def test_empty_error(self):
+        with self.assertRaises(SQFParserError) as cm:
+            preprocessed('x = 1;\n#define\n')
+        self.assertEqual((2, 1), cm.exception.position)
+
+
+class TestIfDef(TestCase):
+
+    def test_ifdef(self):
+        code = '#define A\n#ifdef A\nx = 1;\n#else\nx = 2;\n#endif\n'
+        self.assertEqual('\n\nx = 1;\n\n\n', preprocessed(code))
+
+    def test_ifndef(self):
+        code = '#ifndef A\nx = 1;\n#else\nx = 2;\n#endif\n'
+        self.assertEqual('\nx = 1;\n\n\n', preprocessed(code))
+
+    def test_nested(self):
+        code = '#ifdef A\n#ifdef B\nx = 1;\n#else\nx = 2;\n#endif\n#define C\n#else\nx = 3;\n#endif\nC'
+        self.assertEqual('\n\nx = 3;\n\nC', preprocessed(code))
+
+    def test_errors(self):
+        with self.assertRaises(SQFParserError):
+            preprocessed('#ifdef A\nx = 1;\n')
+        with self.assertRaises(SQFParserError):
+            preprocessed('x = 1;\n#endif\n')
+        with self.assertRaises(SQFParserError):
+            preprocessed('#ifdef\n#endif\n')
+
+
+class TestInclude(TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.root = self.directory.name
+        os.makedirs(os.path.join(self.root, 'x', 'tag', 'addons', 'main'))
+        self.write('x/tag/addons/main/macros.hpp', '#define GVAR(var1) tag_##var1\n')
+        self.write('x/tag/addons/main/script_component.hpp', '#include "\\x\\tag\\addons\\main\\macros.hpp"\n')
+        self.write('x/tag/addons/main/recursive.hpp', '#include "recursive.hpp"\n')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write(self, name, content):
+        with open(os.path.join(self.root, name), 'w') as f:
+            f.write(content)
+
+    def test_relative_and_root(self):
+        path = os.path.join(self.root, 'x', 'tag', 'addons', 'main', 'fnc_test.sqf')
+        code = '#include "script_component.hpp"\nGVAR(x) = 1;'
+        self.assertEqual('\n\n\ntag_x = 1;', preprocessed(code, path=path, include_roots=[self.root]))
+
+    def test_not_found(self):
+        with self.assertRaises(SQFParserError) as cm:
+            preprocessed('x = 1;\n#include "script_component.hpp"\n')
+        self.assertEqual((2, 1), cm.exception.position)
+
+    def test_recursive(self):
+        with self.assertRaises(SQFParserError):
+            preprocessed('#include "\\x\\tag\\addons\\main\\recursive.hpp"\n', include_roots=[self.root])
+
+    def test_header_cache(self):
+        headers = HeaderCache()
+        path = os.path.join(self.root, 'x', 'tag', 'addons', 'main', 'fnc_test.sqf')
+        for _ in range(2):
+            self.assertEqual('\n\n\ntag_x', preprocessed('#include "script_component.hpp"\nGVAR(x)', path=path,
+                                                         include_roots=[self.root], headers=headers))
+        self.assertIn(os.path.join(self.root, 'x', 'tag', 'addons', 'main', 'macros.hpp'), headers)
+
+        # the header is not read again
+        self.write('x/tag/addons/main/macros.hpp', '#define GVAR(var1) other_##var1\n')
+        self.assertEqual('\n\n\ntag_x', preprocessed('#include "script_component.hpp"\nGVAR(x)', path=path,
+                                                     include_roots=[self.root], headers=headers))
+
+    def test_header_tokens_are_copies(self):
+        # the tokens of a header have the position of the #include and are not shared between scripts
+        self.write('x/tag/addons/main/code.hpp', 'hint "a";\n')
+        headers = HeaderCache()
+        path = os.path.join(self.root, 'x', 'tag', 'addons', 'main', 'code.hpp')
+        scripts = [list(preprocess('x = 1;\n#include "\\x\\tag\\addons\\main\\code.hpp"\n',
+                                   include_roots=[self.root], headers=headers)) for _ in range(2)]
+        header_tokens = [token for _, line in headers.get(path) for token in line]
+        for tokens in scripts:
+            self.assertEqual('hint "a";', ''.join(str(token) for token in tokens[7:11]))
+            self.assertEqual([(2, 1)] * 4, [token.position for token in tokens[7:11]])
+            self.assertFalse(any(token is header_token for token in tokens for header_token in header_tokens))
+        self.assertEqual((1, 1), header_tokens[0].position)
+
+    def test_included(self):
+        included = []
+        path = os.path.join(self.root, 'x', 'tag', 'addons', 'main', 'fnc_test.sqf')
+        preprocessed('#include "script_component.hpp"\n#include "script_component.hpp"\n', path=path,
+                     include_roots=[self.root], included=included)
+        main = os.path.join(self.root, 'x', 'tag', 'addons', 'main')
+        self.assertEqual([os.path.join(main, 'script_component.hpp'), os.path.join(main, 'macros.hpp')], included)
+
+    def test_digest(self):
+        headers = HeaderCache()
+        path = os.path.join(self.root, 'x', 'tag', 'addons', 'main', 'macros.hpp')
+        digest = headers.digest(path)
+        self.assertEqual(64, len(digest))
+        self.assertNotIn(path, headers)
+        # the digest and the lines are the ones of the content read during the run
+        self.write('x/tag/addons/main/macros.hpp', '#define GVAR(var1) other_##var1\n')
+        self.assertEqual(digest, headers.digest(path))
+        script = os.path.join(os.path.dirname(path), 'fnc_test.sqf')
+        self.assertEqual('tag_x', preprocessed('#include "macros.hpp"\nGVAR(x)', path=script, headers=headers).strip())
+        self.assertIsNone(headers.digest(os.path.join(self.root, 'missing.hpp')))
@@ -1,10 +1,14 @@
 import sys
 import os
 import io
+import subprocess
+import tempfile
 from contextlib import contextmanager
 from unittest import TestCase
 
-from sqflint import parse_args, entry_point
+import sqflint
+from sqflint import parse_args, entry_point, analyze_dir, Writer, Cache, Includes, Server, _read_message, \
+    _write_message
 
 
 @contextmanager
@@ -97,6 +101,47 @@ class ParseCode(TestCase):
             'tests/test_dir/test1.sqf EXCLUDED\n'
             'tests/test_dir/subdir EXCLUDED\n')
 
+    def test_directory_run_with_jobs(self):
+        with captured_output() as (out, err):
+            exit_code = entry_point(['--directory', 'tests/test_dir', '-j', '2', '-x', 'test1', '-e', 'w'])
+
+        self.assertEqual(exit_code, 1)
+        self.assertEqual(
+            out.getvalue(),
+            'test.sqf\n\t[1,5]:warning:Local variable "_0" is not from this scope (not private)\n'
+            'tests/test_dir/test1.sqf EXCLUDED\n'
+            'subdir/test2.sqf\n\t[1,5]:warning:Local variable "_2" is not from this scope (not private)\n'
+            'subdir/test3.sqf\n\t[1,5]:warning:Local variable "_3" is not from this scope (not private)\n')
+
+    def test_directory_run_with_jobs_streams(self):
+        # the results are written while the directory is walked, in the order of the paths
+        with tempfile.TemporaryDirectory() as directory:
+            os.mkdir(os.path.join(directory, 'subdir'))
+            for i in range(20):
+                with open(os.path.join(directory, 'test%02d.sqf' % i), 'w') as f:
+                    f.write('hint _%d' % i)
+            with open(os.path.join(directory, 'subdir', 'test.sqf'), 'w') as f:
+                f.write('hint _x')
+
+            writer = Writer()
+            written = []
+            original_walk = os.walk
+
+            def walk(top):
+                for item in original_walk(top):
+                    written.append(len(writer.strings))
+                    yield item
+
+            os.walk = walk
+            try:
+                analyze_dir(directory, writer, [], [], jobs=2)
+            finally:
+                os.walk = original_walk
+
+        # at most 8 files (4 per process) are pending when the subdirectory is walked
+        self.assertGreaterEqual(written[1], 2 * (20 - 8))
+        self.assertEqual(['test%02d.sqf\n' % i for i in range(20)] + ['subdir/test.sqf\n'], writer.strings[::2])
+
     def test_directory_run_to_file(self):
         entry_point(['--directory', 'tests/test_dir', '-o', 'tests/result.txt'])
 
@@ -114,3 +159,303 @@ class ParseCode(TestCase):
             'test1.sqf\n\t[1,5]:warning:Local variable "_1" is not from this scope (not private)\n'
             'subdir/test2.sqf\n\t[1,5]:warning:Local variable "_2" is not from this scope (not private)\n'
             'subdir/test3.sqf\n\t[1,5]:warning:Local variable "_3" is not from this scope (not private)\n')
+
+
+def _unsendable_exceptions(code, path):
+    return None, []
+
+
+class TestCache(TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_directory_run(self):
+        expected = 'test.sqf\n\t[1,5]:warning:Local variable "_0" is not from this scope (not private)\n' \
+                   'test1.sqf\n\t[1,5]:warning:Local variable "_1" is not from this scope (not private)\n' \
+                   'subdir/test2.sqf\n\t[1,5]:warning:Local variable "_2" is not from this scope (not private)\n' \
+                   'subdir/test3.sqf\n\t[1,5]:warning:Local variable "_3" is not from this scope (not private)\n'
+
+        runs = [('1', 'cache: 0 hits, 4 misses (0.0% hit rate)\n'),
+                ('1', 'cache: 4 hits, 0 misses (100.0% hit rate)\n'),
+                ('2', 'cache: 4 hits, 0 misses (100.0% hit rate)\n')]
+        for jobs, stats in runs:
+            with captured_output() as (out, err):
+                exit_code = entry_point(['--directory', 'tests/test_dir', '--cache-dir', self.directory.name,
+                                         '--cache-stats', '-e', 'w', '-j', jobs])
+            self.assertEqual(expected, out.getvalue())
+            self.assertEqual(stats, err.getvalue())
+            self.assertEqual(1, exit_code)
+
+    def test_jobs(self):
+        # results computed by worker processes are stored
+        with captured_output():
+            entry_point(['--directory', 'tests/test_dir', '--cache-dir', self.directory.name, '-j', '2'])
+        with captured_output() as (out, err):
+            entry_point(['--directory', 'tests/test_dir', '--cache-dir', self.directory.name, '--cache-stats'])
+        self.assertEqual('cache: 4 hits, 0 misses (100.0% hit rate)\n', err.getvalue())
+
+    def test_jobs_unsendable_exceptions(self):
+        # a script whose exceptions the worker cannot send is counted as one miss
+        worker_exceptions = sqflint._worker_exceptions
+        sqflint._worker_exceptions = _unsendable_exceptions
+        try:
+            with captured_output() as (out, err):
+                entry_point(['--directory', 'tests/test_dir', '--cache-dir', self.directory.name,
+                             '--cache-stats', '-j', '2'])
+        finally:
+            sqflint._worker_exceptions = worker_exceptions
+        self.assertEqual('cache: 0 hits, 4 misses (0.0% hit rate)\n', err.getvalue())
+        self.assertEqual(4, out.getvalue().count('warning'))
+
+    def test_exceptions(self):
+        cache = Cache(self.directory.name)
+        code = 'if (true) then {private _x = 1;'
+        self.assertEqual(None, cache.get(code))
+
+        with captured_output():
+            sys.stdin = io.StringIO(code)
+            entry_point(['--cache-dir', self.directory.name])
+        exceptions = cache.get(code)
+
+        self.assertEqual(1, len(exceptions))
+        self.assertEqual('SQFParenthesisError', type(exceptions[0]).__name__)
+        self.assertEqual((1, 16), exceptions[0].position)
+        self.assertEqual('error:Parenthesis "{" not closed', exceptions[0].message)
+        self.assertEqual((1, 1), (cache.hits, cache.misses))
+
+    def test_changed_code(self):
+        cache = Cache(self.directory.name)
+        cache.set('hint _x', [])
+        self.assertEqual([], cache.get('hint _x'))
+        self.assertEqual(None, cache.get('hint _y'))
+
+    def test_invalid_entry(self):
+        cache = Cache(self.directory.name)
+        code = 'hint _x'
+        for exceptions in ['[["SQFWarning", [1, 6], "warn', '[["SQFWarning", [1, 6]]]', '[["Unknown", [1, 6], "x"]]',
+                           '[["SQFWarning", 1, "x"]]', '1']:
+            content = '{"exceptions": %s, "headers": []}' % exceptions
+            cache.set(code, [])
+            with open(cache._path(code), 'w') as f:
+                f.write(content)
+            self.assertEqual(None, cache.get(code))
+        self.assertEqual((0, 5), (cache.hits, cache.misses))
+
+
+class TestInclude(TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.root = self.directory.name
+        self.cache_dir = os.path.join(self.root, 'cache')
+        self.main = os.path.join(self.root, 'x', 'tag', 'addons', 'main')
+        os.makedirs(self.main)
+        self.write('script_component.hpp', '#define DEFAULT(var1) private _value = var1\n')
+        self.write('fnc_a.sqf', '#include "\\x\\tag\\addons\\main\\script_component.hpp"\n'
+                                'DEFAULT(1);\nhint str _value;\nhint _z;\n')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write(self, name, content):
+        with open(os.path.join(self.main, name), 'w') as f:
+            f.write(content)
+
+    def run_sqflint(self, *args):
+        with captured_output() as (out, err):
+            entry_point(['--directory', self.main, '-I', self.root] + list(args))
+        return out.getvalue(), err.getvalue()
+
+    def test_directory_run(self):
+        expected = 'fnc_a.sqf\n\t[4,5]:warning:Local variable "_z" is not from this scope (not private)\n'
+        self.assertEqual(expected, self.run_sqflint()[0])
+        self.assertEqual(expected, self.run_sqflint('-j', '2')[0])
+
+        # without include roots, the #include is not resolved
+        with captured_output() as (out, err):
+            entry_point(['--directory', self.main])
+        self.assertIn('[3,9]:warning:Local variable "_value" is not from this scope', out.getvalue())
+
+    def test_file_run(self):
+        with captured_output() as (out, err):
+            entry_point([os.path.join(self.main, 'fnc_a.sqf'), '-I', self.root])
+        self.assertEqual('[4,5]:warning:Local variable "_z" is not from this scope (not private)\n', out.getvalue())
+
+    def test_not_found(self):
+        self.write('fnc_a.sqf', '#include "missing.hpp"\n')
+        self.assertEqual('fnc_a.sqf\n\t[1,0]:error:Cannot find the file "missing.hpp" to #include\n',
+                         self.run_sqflint()[0])
+
+    def test_cache(self):
+        for jobs in ('1', '2'):
+            self.run_sqflint('--cache-dir', self.cache_dir, '-j', jobs)
+            self.assertEqual('cache: 1 hits, 0 misses (100.0% hit rate)\n',
+                             self.run_sqflint('--cache-dir', self.cache_dir, '--cache-stats', '-j', jobs)[1])
+
+            # a change of a header that the script includes is a miss
+            self.write('script_component.hpp', '#define DEFAULT(var1) _value = var1\n')
+            out, err = self.run_sqflint('--cache-dir', self.cache_dir, '--cache-stats', '-j', jobs)
+            self.assertEqual('cache: 0 hits, 1 misses (0.0% hit rate)\n', err)
+            self.assertIn('"_value" assigned to an outer scope', out)
+            self.write('script_component.hpp', '#define DEFAULT(var1) private _value = var1\n')
+
+
+def messages(data):
+    stream = io.BytesIO(data)
+    result = []
+    message = _read_message(stream)
+    while message is not None:
+        result.append(message)
+        message = _read_message(stream)
+    return result
+
+
+def open_document(uri, text, version=1):
+    return {'jsonrpc': '2.0', 'method': 'textDocument/didOpen',
+            'params': {'textDocument': {'uri': uri, 'languageId': 'sqf', 'version': version, 'text': text}}}
+
+
+def change_document(uri, text, version):
+    return {'jsonrpc': '2.0', 'method': 'textDocument/didChange',
+            'params': {'textDocument': {'uri': uri, 'version': version}, 'contentChanges': [{'text': text}]}}
+
+
+class TestServer(TestCase):
+
+    def setUp(self):
+        self.output = io.BytesIO()
+        self.server = Server(io.BytesIO(), self.output)
+
+    def published(self):
+        result = [message['params'] for message in messages(self.output.getvalue())
+                  if message.get('method') == 'textDocument/publishDiagnostics']
+        self.output.seek(0)
+        self.output.truncate()
+        return result
+
+    def test_diagnostics(self):
+        self.server.handle([open_document('file:///a.sqf', 'hint _x')])
+        self.assertEqual([{'uri': 'file:///a.sqf', 'version': 1, 'diagnostics': [{
+            'range': {'start': {'line': 0, 'character': 5}, 'end': {'line': 0, 'character': 7}},
+            'severity': 2,
+            'source': 'sqflint',
+            'message': 'Local variable "_x" is not from this scope (not private)'}]}], self.published())
+
+        self.server.handle([change_document('file:///a.sqf', 'private _x = 1;\nhint (_x', 2)])
+        diagnostics = self.published()[0]['diagnostics']
+        self.assertEqual(1, len(diagnostics))
+        self.assertEqual(1, diagnostics[0]['severity'])
+        self.assertEqual('Parenthesis "(" not closed', diagnostics[0]['message'])
+        self.assertEqual({'line': 1, 'character': 5}, diagnostics[0]['range']['start'])
+
+    def test_utf16(self):
+        # positions count characters outside of the basic plane as two
+        self.server.handle([open_document('file:///a.sqf', 'hint "\U0001F600"; hint _x')])
+        diagnostic = self.published()[0]['diagnostics'][0]
+        self.assertEqual({'line': 0, 'character': 16}, diagnostic['range']['start'])
+
+    def test_changes(self):
+        uri = 'file:///a.sqf'
+        self.server.handle([open_document(uri, 'hint _x')])
+        self.published()
+
+        # only the last text is analyzed
+        self.server.handle([change_document(uri, 'hint _y', 2),
+                            change_document(uri, 'private _x = 1; hint str _x;', 3)])
+        self.assertEqual([{'uri': uri, 'version': 3, 'diagnostics': []}], self.published())
+
+        # an unchanged text is not analyzed again
+        self.server.handle([{'jsonrpc': '2.0', 'method': 'textDocument/didSave',
+                             'params': {'textDocument': {'uri': uri}, 'text': 'private _x = 1; hint str _x;'}}])
+        self.assertEqual([], self.published())
+
+        self.server.handle([{'jsonrpc': '2.0', 'method': 'textDocument/didClose',
+                             'params': {'textDocument': {'uri': uri}}}])
+        self.assertEqual([{'uri': uri, 'diagnostics': []}], self.published())
+
+    def test_parse_tree(self):
+        uri = 'file:///a.sqf'
+        self.server.handle([open_document(uri, 'x = 1;\nhint _x;\ny = 2;')])
+        self.published()
+        result = self.server._analyzed[uri][1]
+
+        # the statements before and after the change are reused
+        self.server.handle([change_document(uri, 'x = 1;\nhint _z;\ny = 2;', 2)])
+        diagnostics = self.published()[0]['diagnostics']
+        self.assertEqual('Local variable "_z" is not from this scope (not private)', diagnostics[0]['message'])
+        self.assertEqual({'line': 1, 'character': 5}, diagnostics[0]['range']['start'])
+        new_result = self.server._analyzed[uri][1]
+        self.assertIs(result[0], new_result[0])
+        self.assertIs(result[2], new_result[2])
+
+    def test_includes(self):
+        with tempfile.TemporaryDirectory() as root:
+            header = os.path.join(root, 'script_component.hpp')
+            with open(header, 'w') as f:
+                f.write('#define DEFAULT(var1) private _value = var1\n')
+            server = Server(io.BytesIO(), self.output, Includes([root]))
+            uri = 'file://' + root.replace(os.sep, '/') + '/fnc_a.sqf'
+
+            server.handle([open_document(uri, '#include "\\script_component.hpp"\nDEFAULT(1);\nhint str _value;')])
+            self.assertEqual([], self.published()[0]['diagnostics'])
+
+            # a changed header is read again and the open documents are analyzed again
+            with open(header, 'w') as f:
+                f.write('#define DEFAULT(var1) _other = var1\n')
+            server.handle([{'jsonrpc': '2.0', 'method': 'workspace/didChangeWatchedFiles',
+                            'params': {'changes': [{'uri': 'file://' + header.replace(os.sep, '/'), 'type': 2}]}}])
+            found = [diagnostic['message'] for diagnostic in self.published()[0]['diagnostics']]
+            self.assertIn('Local variable "_value" is not from this scope (not private)', found)
+
+    def test_run(self):
+        input = io.BytesIO()
+        for message in [
+                {'jsonrpc': '2.0', 'id': 1, 'method': 'initialize', 'params': {'capabilities': {}}},
+                {'jsonrpc': '2.0', 'method': 'initialized', 'params': {}},
+                {'jsonrpc': '2.0', 'id': 2, 'method': 'textDocument/hover', 'params': {}},
+                {'jsonrpc': '2.0', 'id': 3, 'method': 'shutdown'},
+                {'jsonrpc': '2.0', 'method': 'exit'}]:
+            _write_message(input, message)
+        input.seek(0)
+
+        self.assertEqual(0, Server(input, self.output).run())
+        responses = {message['id']: message for message in messages(self.output.getvalue()) if 'id' in message}
+        self.assertEqual('sqflint', responses[1]['result']['serverInfo']['name'])
+        self.assertEqual(-32601, responses[2]['error']['code'])
+        self.assertEqual(None, responses[3]['result'])
+
+    def test_exit_without_shutdown(self):
+        self.assertEqual(1, Server(io.BytesIO(), self.output).run())
+
+    def test_headers_without_length(self):
+        stream = io.BytesIO()
+        stream.write(b'Content-Type: application/vscode-jsonrpc; charset=utf-8\r\n\r\n')
+        _write_message(stream, {'jsonrpc': '2.0', 'method': 'initialized', 'params': {}})
+        stream.seek(0)
+
+        with self.assertRaises(ValueError):
+            _read_message(stream)
+        self.assertEqual('initialized', _read_message(stream)['method'])
+
+    def test_exit_process(self):
+        # the process exits on the exit notification, while its input is still open
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        server = subprocess.Popen([sys.executable, 'sqflint.py', '--server'], cwd=root,
+                                  stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        try:
+            for message in [
+                    {'jsonrpc': '2.0', 'id': 1, 'method': 'initialize', 'params': {'capabilities': {}}},
+                    {'jsonrpc': '2.0', 'id': 2, 'method': 'shutdown'},
+                    {'jsonrpc': '2.0', 'method': 'exit'}]:
+                _write_message(server.stdin, message)
+            self.assertEqual(0, server.wait(timeout=30))
+            self.assertEqual([1, 2], [message['id'] for message in messages(server.stdout.read())])
+        finally:
+            server.kill()
+            server.stdin.close()
+            server.stdout.close()
+            server.stderr.close()
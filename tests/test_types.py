@@ -1,7 +1,7 @@
 from unittest import TestCase
 
 from sqf.types import Statement, Array, Boolean, Code, Nothing, \
-    Variable as V, Number as N, Keyword
+    Variable as V, Number as N, Keyword, String
 from sqf.parser_types import Space, Comment, EndOfLine
 
 
@@ -65,3 +65,98 @@ class TestGetPosition(TestCase):
 
         self.assertEqual(Keyword('='), s[1][1])
         self.assertEqual((5, 3), s[1][1].position)
+
+    def test_nested_containers(self):
+        # [[1,\n2],3]
+        inner = Array([N(1), Statement([EndOfLine('\n'), N(2)])])
+        s = Statement([Array([inner, N(3)])])
+
+        s.set_position((1, 1))
+
+        self.assertEqual((1, 2), inner.position)
+        self.assertEqual((2, 1), inner[1][1].position)
+        self.assertEqual((2, 4), s[0].tokens[3].position)
+
+
+class TestCodeContentKey(TestCase):
+
+    def test_key(self):
+        code = Code([Statement([V('_x')])])
+        self.assertEqual('{_x}', code.content_key)
+        self.assertEqual(Code([Statement([V('_x')])]).content_key, code.content_key)
+        # the key is not part of the equality of codes
+        self.assertEqual(Code([Statement([V('_x')])]), code)
+
+    def test_changed(self):
+        code = Code([Statement([V('_x')])])
+        self.assertEqual('{_x}', code.content_key)
+        code.prepend([Space()])
+        self.assertEqual(' {_x}', code.content_key)
+        code.ending = ';'
+        self.assertEqual(' {_x};', code.content_key)
+
+
+class TestBaseTokens(TestCase):
+
+    def test_cached(self):
+        statement = Statement([V('_x'), Space(), Keyword('='), Space(), N(1)])
+        self.assertEqual([V('_x'), Keyword('='), N(1)], statement.base_tokens)
+        self.assertIs(statement.base_tokens, statement.base_tokens)
+        # the cache is not part of the equality of statements
+        self.assertEqual(Statement([V('_x'), Space(), Keyword('='), Space(), N(1)]), statement)
+
+    def test_changed(self):
+        statement = Statement([Space(), N(1)])
+        self.assertEqual([N(1)], statement.base_tokens)
+        statement.prepend([V('_x'), Keyword('=')])
+        self.assertEqual([V('_x'), Keyword('='), N(1)], statement.base_tokens)
+        statement.ending = ';'
+        self.assertEqual([V('_x'), Keyword('='), N(1)], statement.base_tokens)
+
+        code = Code([Statement([V('_x')])])
+        self.assertEqual([Statement([V('_x')])], code.base_tokens)
+        code.prepend([Statement([N(1)], ending=';')])
+        self.assertEqual([Statement([N(1)], ending=';'), Statement([V('_x')])], code.base_tokens)
+
+
+class TestStrings(TestCase):
+
+    def test_statement_stored(self):
+        statement = Statement([V('_x'), Space(), Keyword('='), Space(), N(1)])
+        self.assertEqual('_x = 1', str(statement))
+        self.assertIs(str(statement), str(statement))
+        statement.ending = ';'
+        self.assertEqual('_x = 1;', str(statement))
+
+        # the string of a stored statement is used by the statements that contain it
+        code = Code([statement])
+        self.assertEqual('{_x = 1;}', str(code))
+        self.assertEqual(Code([Statement([V('_x'), Space(), Keyword('='), Space(), N(1)], ending=';')]), code)
+
+    def test_array_changes(self):
+        array = Array([N(1)])
+        self.assertEqual('[1]', str(array))
+        array.append(N(2))
+        self.assertEqual('[1,2]', str(array))
+        array.reverse()
+        self.assertEqual('[2,1]', str(array))
+        self.assertEqual(Array([N(2), N(1)]), array)
+
+        # arrays within arrays are not stored
+        outer = Array([array])
+        self.assertEqual('[[2,1]]', str(outer))
+        array.resize(1)
+        self.assertEqual('[[2]]', str(outer))
+
+    def test_string_value(self):
+        string = String('"a ""b"""')
+        self.assertEqual('"a ""b"""', str(string))
+        self.assertEqual('a ""b""', string.value)
+        self.assertEqual(String('"a ""b"""'), string)
+        self.assertNotEqual(String("'a \"\"b\"\"'"), string)
+        self.assertEqual(hash(String('"a ""b"""')), hash(string))
+
+        self.assertEqual('', String('""').value)
+        self.assertFalse(String('""').is_undefined)
+        self.assertTrue(String().is_undefined)
+        self.assertEqual('undefined', str(String()))